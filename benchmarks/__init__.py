@@ -0,0 +1,14 @@
+"""Benchmarks of the LubeLogger integration against a local stand-in server.
+
+Run from the repository root with ``python -m benchmarks.run``; Home
+Assistant and aiohttp must be installed.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Import the integration as the top-level "lubelogger" package
+_CUSTOM_COMPONENTS = str(Path(__file__).resolve().parents[1] / "custom_components")
+if _CUSTOM_COMPONENTS not in sys.path:
+    sys.path.insert(0, _CUSTOM_COMPONENTS)
@@ -0,0 +1,83 @@
+"""Measure how sensors find their vehicle in the coordinator data.
+
+Compares the lookup of BaseLubeLoggerSensor._record, through
+data["vehicle_index"], with the scan of data["vehicles"] it replaced,
+for one coordinator update: every sensor of every vehicle looking its
+record up a few times, as a state write does.
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+from types import SimpleNamespace
+from typing import Any
+
+from lubelogger.record_types import RECORD_TYPES
+from lubelogger.sensor import BaseLubeLoggerSensor
+
+# Lookups of one sensor per state write (available, value, attributes)
+LOOKUPS_PER_WRITE = 6
+
+
+def _scan_record(sensor: Any) -> Any:
+    """Return the sensor's record by scanning the vehicle list, as before."""
+    data = sensor.coordinator.data or {}
+    for vehicle in data.get("vehicles", []):
+        if vehicle.get("id") == sensor._vehicle_id:
+            return vehicle.get(sensor._key)
+    return None
+
+
+def _sensors(vehicles: int) -> list[SimpleNamespace]:
+    """Return stand-ins for the record sensors of a fleet sharing one coordinator."""
+    vehicle_list = [
+        {"id": vehicle_id, **{record_type.key: {"id": 1} for record_type in RECORD_TYPES}}
+        for vehicle_id in range(1, vehicles + 1)
+    ]
+    coordinator = SimpleNamespace(
+        data={
+            "vehicles": vehicle_list,
+            "vehicle_index": {vehicle["id"]: vehicle for vehicle in vehicle_list},
+        }
+    )
+    return [
+        SimpleNamespace(coordinator=coordinator, _vehicle_id=vehicle_id, _key=record_type.key)
+        for vehicle_id in range(1, vehicles + 1)
+        for record_type in RECORD_TYPES
+    ]
+
+
+def benchmark(vehicles: int, repeat: int) -> tuple[float, float]:
+    """Return the best time of one update with the scan and with the index."""
+    sensors = _sensors(vehicles)
+    index_record = BaseLubeLoggerSensor._record.fget
+
+    def update(lookup: Any) -> None:
+        for sensor in sensors:
+            for _ in range(LOOKUPS_PER_WRITE):
+                lookup(sensor)
+
+    assert all(_scan_record(sensor) is index_record(sensor) for sensor in sensors)
+    return (
+        min(timeit.repeat(lambda: update(_scan_record), number=1, repeat=repeat)),
+        min(timeit.repeat(lambda: update(index_record), number=1, repeat=repeat)),
+    )
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--vehicles", type=int, nargs="+", default=[10, 100, 1000], help="fleet sizes"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'vehicles':>8} {'scan ms':>10} {'index ms':>10}")
+    for vehicles in args.vehicles:
+        scan, index = benchmark(vehicles, args.repeat)
+        print(f"{vehicles:>8} {scan * 1000:>10.2f} {index * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
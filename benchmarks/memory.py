@@ -0,0 +1,154 @@
+"""Measure the memory of the coordinator data with typed records.
+
+A coordinator refreshes a fleet whose payloads carry the fields
+LubeLogger sends and the integration ignores (files, tags, extra
+fields). The deep size of ``coordinator.data`` is compared with the
+same data holding the API records and vehicle payloads, as it did
+before the records were typed. The memory still allocated after the
+refresh (tracemalloc) covers the client's caches as well.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import sys
+import tempfile
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from lubelogger.const import CONF_DECIMAL_SEPARATOR, CONF_PASSWORD, CONF_URL, CONF_USERNAME
+from lubelogger.coordinator import LubeLoggerDataUpdateCoordinator
+from lubelogger.models import Record, VehicleInfo
+
+from .run import _ConfigEntries
+from .stand_in_server import FleetSpec, StandInServer, generate_fleet
+
+
+def deep_size(obj: Any, seen: set[int] | None = None) -> int:
+    """Return the size of an object and of everything it refers to, once each."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(key, seen) + deep_size(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, seen) for item in obj)
+    elif hasattr(type(obj), "__slots__"):
+        size += sum(
+            deep_size(getattr(obj, slot), seen)
+            for cls in type(obj).__mro__
+            for slot in getattr(cls, "__slots__", ())
+            if hasattr(obj, slot)
+        )
+    elif hasattr(obj, "__dict__"):
+        size += deep_size(vars(obj), seen)
+    return size
+
+
+def _add_ignored_fields(fleet: dict[int, dict[str, Any]]) -> None:
+    """Add the vehicle and record fields of real LubeLogger payloads."""
+    for vehicle in fleet.values():
+        vehicle["vehicle"].update(
+            licensePlate="AB123CD",
+            vin="ZFA31200000000000",
+            imageLocation="/images/car.png",
+            isElectric=False,
+            useHours=False,
+            odometerOptional=False,
+            soldDate="",
+            purchasePrice="0",
+            soldPrice="0",
+            extraFields=[{"name": "Insurance", "value": "Policy 1234", "isRequired": False}],
+            tags=["family"],
+            dashboardMetrics=["Default"],
+            vehicleIdentifier="LicensePlate",
+        )
+        for records in vehicle["records"].values():
+            for rec in records:
+                rec.update(
+                    extraFields=[],
+                    files=[{"name": "receipt.pdf", "location": "/documents/receipt.pdf"}],
+                    tags=["road"],
+                )
+
+
+def _untyped(
+    coordinator: LubeLoggerDataUpdateCoordinator, fleet: dict[int, dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Return the vehicle data with the API records and vehicle payloads put back."""
+    vehicles = []
+    for vehicle in coordinator.data["vehicles"]:
+        untyped = dict(vehicle)
+        for key, value in vehicle.items():
+            if isinstance(value, Record):
+                untyped[key] = coordinator._records[(vehicle["id"], key)][0]
+            elif isinstance(value, VehicleInfo):
+                untyped[key] = fleet[vehicle["id"]]["vehicle"]
+        vehicles.append(untyped)
+    return vehicles
+
+
+async def async_benchmark(spec: FleetSpec) -> None:
+    """Refresh the fleet once and print the memory figures."""
+    fleet = generate_fleet(spec)
+    _add_ignored_fields(fleet)
+    server = StandInServer(fleet)
+    url = await server.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.config_entries = _ConfigEntries()
+        entry = SimpleNamespace(
+            entry_id="benchmark",
+            data={
+                CONF_URL: url,
+                CONF_USERNAME: "benchmark",
+                CONF_PASSWORD: "benchmark",
+                CONF_DECIMAL_SEPARATOR: "," if spec.locale == "eu" else ".",
+            },
+            options={},
+        )
+        coordinator = LubeLoggerDataUpdateCoordinator(hass, entry)
+        try:
+            gc.collect()
+            tracemalloc.start()
+            coordinator.data = await coordinator._async_update_data()
+            gc.collect()
+            retained = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            typed = deep_size(coordinator.data["vehicles"])
+            untyped = deep_size(_untyped(coordinator, fleet))
+        finally:
+            await coordinator.client.async_close()
+            await server.stop()
+            await hass.async_stop(force=True)
+
+    vehicles = spec.vehicles
+    print(f"{vehicles} vehicles x {spec.records} records per type ({spec.locale})")
+    print(f"coordinator.data, API records:   {untyped / vehicles / 1024:8.1f} KiB per vehicle")
+    print(f"coordinator.data, typed records: {typed / vehicles / 1024:8.1f} KiB per vehicle")
+    print(f"retained after the refresh:      {retained / vehicles / 1024:8.1f} KiB per vehicle")
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vehicles", type=int, default=50)
+    parser.add_argument("--records", type=int, default=200, help="records per type")
+    parser.add_argument("--locale", choices=("eu", "us"), default="eu")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(
+        async_benchmark(FleetSpec(args.vehicles, args.records, args.seed, args.locale))
+    )
+
+
+if __name__ == "__main__":
+    main()
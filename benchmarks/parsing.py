@@ -0,0 +1,131 @@
+"""Measure the date and number parsers on a realistic record history.
+
+Dates: DateParser (without cache, with a cold cache and with a warm one)
+against ``parse_date_string``, the function it replaced, which tried up
+to eight strptime formats in turn. Numbers: NumberParser with the
+server's decimal separator learned against the per-value heuristic of
+``convert_number_string``.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from lubelogger.parsing import DateParser, NumberParser, convert_number_string
+
+DATE_FORMATS = {
+    "dd/mm/yyyy": "%d/%m/%Y",
+    "mm/dd/yyyy": "%m/%d/%Y",
+    "ISO": "%Y-%m-%dT00:00:00",
+}
+
+
+def parse_date_string(date_str: str) -> datetime | None:
+    """Parse a date string in multiple formats and return timezone-aware datetime.
+
+    The client's parser before DateParser, kept as the baseline.
+    """
+    if not date_str:
+        return None
+
+    try:
+        if date_str.endswith("Z"):
+            date_str = date_str.replace("Z", "+00:00")
+        dt = datetime.fromisoformat(date_str)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=dt_util.UTC)
+        return dt
+    except (ValueError, AttributeError):
+        pass
+
+    formats = [
+        "%d/%m/%Y",
+        "%d/%m/%Y %H:%M:%S",
+        "%m/%d/%Y",
+        "%m/%d/%Y %H:%M:%S",
+        "%Y-%m-%dT%H:%M:%S",
+        "%Y-%m-%dT%H:%M:%S.%f",
+        "%Y-%m-%d %H:%M:%S",
+        "%Y-%m-%d",
+    ]
+    for fmt in formats:
+        try:
+            dt = datetime.strptime(date_str, fmt)
+            if dt.tzinfo is None:
+                dt = dt_util.as_local(dt)
+            return dt
+        except (ValueError, AttributeError):
+            continue
+    return None
+
+
+def _history_dates(records: int, days: int, fmt: str, seed: int) -> list[str]:
+    """Return the dates of a history of ``records`` records over ``days`` days."""
+    rng = random.Random(seed)
+    first = date(2015, 1, 1)
+    return [
+        (first + timedelta(days=rng.randrange(days))).strftime(fmt) for _ in range(records)
+    ]
+
+
+def _history_numbers(records: int, seed: int) -> list[str]:
+    """Return European number strings: odometers, costs and fuel quantities."""
+    rng = random.Random(seed)
+    values = []
+    for _ in range(records):
+        values.append(f"{rng.randrange(1000, 300000):,}".replace(",", "."))
+        values.append(f"{rng.uniform(10, 120):.2f}".replace(".", ","))
+        values.append(f"{rng.uniform(5, 60):.3f}".replace(".", ","))
+    return values
+
+
+def _rate(parse: Callable[[str], Any], values: list[str]) -> float:
+    """Return the values parsed per second."""
+    started = time.perf_counter()
+    for value in values:
+        parse(value)
+    return len(values) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--days", type=int, default=3650, help="days the history spans")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"dates, {args.records} records over {args.days} days (values/s)")
+    print(f"{'format':<11} {'old':>9} {'no cache':>9} {'cold':>9} {'warm':>9}")
+    for label, fmt in DATE_FORMATS.items():
+        values = _history_dates(args.records, args.days, fmt, args.seed)
+        uncached = DateParser(cache_size=0)
+        cached = DateParser()
+        old = _rate(parse_date_string, values)
+        no_cache = _rate(uncached.parse, values)
+        cold = _rate(cached.parse, values)
+        warm = _rate(cached.parse, values)
+        print(f"{label:<11} {old:>9.0f} {no_cache:>9.0f} {cold:>9.0f} {warm:>9.0f}")
+
+    values = _history_numbers(args.records, args.seed)
+    number_parser = NumberParser(",")
+    # "1.234" and "12,345" are ambiguous to the heuristic
+    misread = sum(
+        convert_number_string(value) != number_parser.parse(value) for value in values
+    )
+    print(f"numbers, {len(values)} European values (values/s)")
+    print(f"{'heuristic':>11} {'learned':>9} {'misread':>9}")
+    print(
+        f"{_rate(convert_number_string, values):>11.0f} "
+        f"{_rate(number_parser.parse, values):>9.0f} {misread:>9}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""Measure coordinator refreshes against the stand-in LubeLogger server.
+
+Every run goes through three refreshes of one coordinator:
+
+- cold: first refresh, every tier due and nothing cached
+- warm: every tier forced due again, responses unchanged
+- tick: only the shortest polling tier due, as on most timer ticks
+
+Requests and bytes come from the server, wall and CPU time from a plain
+run, and peak memory from a second run traced with tracemalloc.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from types import SimpleNamespace
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from lubelogger.const import (
+    API_ADJUSTED_ODOMETER,
+    CONF_PASSWORD,
+    CONF_UPDATE_INTERVAL,
+    CONF_URL,
+    CONF_USERNAME,
+)
+from lubelogger.coordinator import LubeLoggerDataUpdateCoordinator
+
+from .stand_in_server import Faults, FleetSpec, StandInServer, generate_fleet
+
+PHASES = ("cold", "warm", "tick")
+
+
+@dataclass
+class RefreshResult:
+    """Cost of one refresh."""
+
+    phase: str
+    requests: int
+    bytes: int
+    failed_requests: int
+    wall_time: float
+    cpu_time: float
+    peak_memory: int = 0
+
+
+class _ConfigEntries:
+    """Stand-in for hass.config_entries; entry updates are not persisted."""
+
+    def async_update_entry(self, entry: Any, **kwargs: Any) -> bool:
+        return False
+
+
+async def _async_run_phases(
+    hass: HomeAssistant, server: StandInServer, options: dict[str, Any], traced: bool
+) -> list[RefreshResult]:
+    """Run the refresh phases with a new coordinator."""
+    entry = SimpleNamespace(
+        entry_id=f"benchmark_{time.monotonic_ns()}",
+        data={CONF_URL: server.url, CONF_USERNAME: "user", CONF_PASSWORD: "password"},
+        options=options,
+    )
+    coordinator = LubeLoggerDataUpdateCoordinator(hass, entry)
+    results = []
+    try:
+        for phase in PHASES:
+            if phase == "warm":
+                coordinator._tier_last_run.clear()
+            elif phase == "tick":
+                coordinator._tier_last_run.pop(CONF_UPDATE_INTERVAL, None)
+
+            server.stats.reset()
+            if traced:
+                tracemalloc.start()
+            started = time.perf_counter()
+            cpu_started = time.process_time()
+            coordinator.data = await coordinator._async_update_data()
+            wall_time = time.perf_counter() - started
+            cpu_time = time.process_time() - cpu_started
+            peak_memory = 0
+            if traced:
+                peak_memory = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+            stats = server.stats
+            results.append(
+                RefreshResult(
+                    phase=phase,
+                    requests=stats.requests,
+                    bytes=stats.bytes,
+                    failed_requests=sum(
+                        count for status, count in stats.statuses.items() if status >= 400
+                    ),
+                    wall_time=wall_time,
+                    cpu_time=cpu_time,
+                    peak_memory=peak_memory,
+                )
+            )
+    finally:
+        await coordinator.client.async_close()
+    return results
+
+
+async def async_benchmark(
+    spec: FleetSpec, faults: Faults, repeat: int = 3, options: dict[str, Any] | None = None
+) -> list[RefreshResult]:
+    """Benchmark the refresh phases and return the median result of each."""
+    server = StandInServer(generate_fleet(spec), faults)
+    await server.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.config_entries = _ConfigEntries()
+        try:
+            runs = [
+                await _async_run_phases(hass, server, options or {}, traced=False)
+                for _ in range(repeat)
+            ]
+            traced = await _async_run_phases(hass, server, options or {}, traced=True)
+        finally:
+            await server.stop()
+            await hass.async_stop(force=True)
+
+    results = []
+    for index, phase in enumerate(PHASES):
+        phase_runs = [run[index] for run in runs]
+        results.append(
+            RefreshResult(
+                phase=phase,
+                requests=phase_runs[0].requests,
+                bytes=phase_runs[0].bytes,
+                failed_requests=phase_runs[0].failed_requests,
+                wall_time=statistics.median(run.wall_time for run in phase_runs),
+                cpu_time=statistics.median(run.cpu_time for run in phase_runs),
+                peak_memory=traced[index].peak_memory,
+            )
+        )
+    return results
+
+
+def _print_table(spec: FleetSpec, faults: Faults, results: list[RefreshResult]) -> None:
+    print(
+        f"{spec.vehicles} vehicles x {spec.records} records per type ({spec.locale}), "
+        f"latency {faults.latency * 1000:.0f} ms, error rate {faults.error_rate:.0%}"
+    )
+    print(
+        f"{'phase':<6} {'requests':>8} {'failed':>6} {'kB':>9} "
+        f"{'wall ms':>9} {'CPU ms':>9} {'peak MB':>8}"
+    )
+    for result in results:
+        print(
+            f"{result.phase:<6} {result.requests:>8} {result.failed_requests:>6} "
+            f"{result.bytes / 1000:>9.1f} {result.wall_time * 1000:>9.1f} "
+            f"{result.cpu_time * 1000:>9.1f} {result.peak_memory / 1e6:>8.2f}"
+        )
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vehicles", type=int, default=5)
+    parser.add_argument("--records", type=int, default=200, help="records per type")
+    parser.add_argument("--locale", choices=("eu", "us"), default="eu")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 500s")
+    parser.add_argument(
+        "--no-adjusted-odometer",
+        action="store_true",
+        help="answer the adjusted odometer endpoint with 404",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", metavar="FILE", help="also write the results as JSON")
+    args = parser.parse_args()
+
+    spec = FleetSpec(args.vehicles, args.records, args.seed, args.locale)
+    faults = Faults(
+        latency=args.latency,
+        not_found=frozenset({API_ADJUSTED_ODOMETER}) if args.no_adjusted_odometer else frozenset(),
+        error_rate=args.error_rate,
+    )
+    results = asyncio.run(async_benchmark(spec, faults, args.repeat))
+    _print_table(spec, faults, results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(
+                {"fleet": asdict(spec), "results": [asdict(result) for result in results]},
+                file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
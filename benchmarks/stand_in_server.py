@@ -0,0 +1,266 @@
+"""Local stand-in for a LubeLogger server, serving a synthetic fleet."""
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any
+
+from aiohttp import web
+
+from lubelogger.const import (
+    API_ADJUSTED_ODOMETER,
+    API_GAS_RECORD,
+    API_ODOMETER,
+    API_PLAN,
+    API_REMINDER,
+    API_REPAIR_RECORD,
+    API_SERVICE_RECORD,
+    API_SUPPLY_RECORD,
+    API_TAX,
+    API_UPGRADE_RECORD,
+    API_VEHICLES,
+)
+
+# Record list endpoints, each answered with the vehicle's list of that type
+RECORD_ENDPOINTS = (
+    API_ODOMETER,
+    API_PLAN,
+    API_TAX,
+    API_SERVICE_RECORD,
+    API_REPAIR_RECORD,
+    API_UPGRADE_RECORD,
+    API_SUPPLY_RECORD,
+    API_GAS_RECORD,
+    API_REMINDER,
+)
+
+_MAKES = ("Fiat", "Alfa Romeo", "Lancia", "Volkswagen", "Renault", "Toyota")
+_FIRST_DAY = date(2015, 1, 1)
+_DAYS = 4000
+# Size of the chunks of chunked responses
+_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class FleetSpec:
+    """Size and formats of a synthetic fleet."""
+
+    vehicles: int = 3
+    records: int = 50
+    seed: int = 1
+    # "eu": 28/02/2027 and 1.234,56 - "us": 02/28/2027 and 1,234.56
+    locale: str = "eu"
+
+
+@dataclass
+class Faults:
+    """Faults injected by the stand-in server."""
+
+    # Added to every response (seconds)
+    latency: float = 0.0
+    # Endpoints answered with 404, e.g. API_ADJUSTED_ODOMETER
+    not_found: frozenset[str] = frozenset()
+    # Share of requests answered with 500
+    error_rate: float = 0.0
+
+
+@dataclass
+class ServerStats:
+    """Traffic served by the stand-in server."""
+
+    requests: int = 0
+    bytes: int = 0
+    statuses: dict[int, int] = field(default_factory=dict)
+
+    def count(self, status: int, size: int) -> None:
+        """Record one response."""
+        self.requests += 1
+        self.bytes += size
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    def reset(self) -> None:
+        """Forget the traffic counted so far."""
+        self.requests = 0
+        self.bytes = 0
+        self.statuses.clear()
+
+
+def generate_fleet(spec: FleetSpec) -> dict[int, dict[str, Any]]:
+    """Build vehicles and their records, the same for the same spec."""
+    rnd = random.Random(spec.seed)
+    date_format = "%d/%m/%Y" if spec.locale == "eu" else "%m/%d/%Y"
+
+    def number(value: float) -> str:
+        text = f"{value:,.2f}"
+        if spec.locale == "eu":
+            text = text.replace(",", " ").replace(".", ",").replace(" ", ".")
+        return text
+
+    def day() -> str:
+        return (_FIRST_DAY + timedelta(days=rnd.randrange(_DAYS))).strftime(date_format)
+
+    fleet: dict[int, dict[str, Any]] = {}
+    record_id = 1
+    for vehicle_id in range(1, spec.vehicles + 1):
+        records: dict[str, list[dict[str, Any]]] = {}
+        for endpoint in RECORD_ENDPOINTS:
+            records[endpoint] = []
+            for _ in range(spec.records):
+                record = _make_record(endpoint, record_id, day(), number, rnd)
+                records[endpoint].append(record)
+                record_id += 1
+        fleet[vehicle_id] = {
+            "vehicle": {
+                "id": vehicle_id,
+                "year": 2005 + rnd.randrange(20),
+                "make": rnd.choice(_MAKES),
+                "model": f"Model {vehicle_id}",
+            },
+            "records": records,
+        }
+    return fleet
+
+
+def _make_record(
+    endpoint: str, record_id: int, day: str, number: Any, rnd: random.Random
+) -> dict[str, Any]:
+    """Build one record shaped like the ones of the given endpoint."""
+    if endpoint == API_PLAN:
+        return {
+            "id": record_id,
+            "dateCreated": day,
+            "description": "Planned work",
+            "progress": rnd.choice(("Backlog", "InProgress", "Testing")),
+            "priority": rnd.choice(("Low", "Normal", "Critical")),
+        }
+    if endpoint == API_REMINDER:
+        return {
+            "id": record_id,
+            "description": "Reminder",
+            "dueDate": day,
+            "dueDays": str(rnd.randint(-30, 400)),
+            "dueDistance": str(rnd.randint(-500, 20000)),
+            "metric": rnd.choice(("Date", "Odometer", "Both")),
+            "urgency": rnd.choice(("NotUrgent", "Urgent", "VeryUrgent", "PastDue")),
+        }
+    record = {
+        "id": record_id,
+        "date": day,
+        "odometer": str(rnd.randint(1000, 250000)),
+        "description": "Record",
+        "cost": number(rnd.uniform(5, 2000)),
+        "notes": "",
+    }
+    if endpoint == API_GAS_RECORD:
+        record["fuelConsumed"] = number(rnd.uniform(20, 60))
+        record["fuelEconomy"] = number(rnd.uniform(4, 9))
+        record["isFillToFull"] = "True"
+    return record
+
+
+class StandInServer:
+    """aiohttp application answering the LubeLogger API endpoints."""
+
+    def __init__(
+        self,
+        fleet: dict[int, dict[str, Any]],
+        faults: Faults | None = None,
+        chunked: bool = False,
+        cache_bodies: bool = False,
+    ) -> None:
+        """Initialize the server.
+
+        With ``chunked`` record lists are sent without a Content-Length,
+        in chunks, as servers behind some proxies do. With
+        ``cache_bodies`` each record list is encoded once, so the server
+        allocates next to nothing per request (for memory measurements);
+        the fleet must not change then.
+        """
+        self.fleet = fleet
+        self.faults = faults or Faults()
+        self.chunked = chunked
+        self._bodies: dict[str, bytes] | None = {} if cache_bodies else None
+        self.stats = ServerStats()
+        self._random = random.Random(0)
+        self._runner: web.AppRunner | None = None
+        self.url: str | None = None
+
+    def make_app(self) -> web.Application:
+        """Return the application serving the fleet."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get(API_VEHICLES, self._vehicles)
+        app.router.add_get(API_ADJUSTED_ODOMETER, self._adjusted_odometer)
+        for endpoint in RECORD_ENDPOINTS:
+            app.router.add_get(endpoint, self._records)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the base URL."""
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{port}"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        """Inject the configured faults and count the traffic."""
+        if self.faults.latency:
+            await asyncio.sleep(self.faults.latency)
+        if request.path in self.faults.not_found:
+            response: web.StreamResponse = web.Response(status=404)
+        elif self.faults.error_rate and self._random.random() < self.faults.error_rate:
+            response = web.Response(status=500, text="Injected failure")
+        else:
+            response = await handler(request)
+        if isinstance(response, web.Response):
+            size = len(response.body) if response.body else 0
+        else:
+            size = response.body_length
+        self.stats.count(response.status, size)
+        return response
+
+    def _vehicle(self, request: web.Request) -> dict[str, Any]:
+        try:
+            return self.fleet[int(request.query["vehicleId"])]
+        except (KeyError, ValueError) as err:
+            raise web.HTTPBadRequest(text="Unknown vehicleId") from err
+
+    async def _vehicles(self, request: web.Request) -> web.Response:
+        return _json([vehicle["vehicle"] for vehicle in self.fleet.values()])
+
+    async def _records(self, request: web.Request) -> web.StreamResponse:
+        records = self._vehicle(request)["records"][request.path]
+        if self._bodies is None:
+            body = json.dumps(records).encode()
+        elif (body := self._bodies.get(request.path_qs)) is None:
+            body = self._bodies[request.path_qs] = json.dumps(records).encode()
+        if not self.chunked:
+            return web.Response(body=body, content_type="application/json")
+        response = web.StreamResponse()
+        response.content_type = "application/json"
+        await response.prepare(request)
+        for start in range(0, len(body), _CHUNK_SIZE):
+            await response.write(body[start : start + _CHUNK_SIZE])
+        await response.write_eof()
+        return response
+
+    async def _adjusted_odometer(self, request: web.Request) -> web.Response:
+        # LubeLogger answers with the adjusted reading as a plain number
+        records = self._vehicle(request)["records"][API_ODOMETER]
+        return _json(max((int(rec["odometer"]) for rec in records), default=0))
+
+
+def _json(payload: Any) -> web.Response:
+    return web.Response(text=json.dumps(payload), content_type="application/json")
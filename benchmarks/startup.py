@@ -0,0 +1,111 @@
+"""Measure how soon the entities have data after a restart.
+
+A cold start runs the first refresh before the entities are set up, so
+they wait for every request of the fleet. A snapshot start loads the
+data stored by the last refresh before the restart and lets the first
+live refresh run in the background. Each start uses a new coordinator
+of the same config entry against the stand-in server; "ready" is the
+time until ``coordinator.data`` is set.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from types import SimpleNamespace
+
+from homeassistant.core import HomeAssistant
+
+from lubelogger.const import CONF_PASSWORD, CONF_URL, CONF_USERNAME
+from lubelogger.coordinator import LubeLoggerDataUpdateCoordinator
+
+from .run import _ConfigEntries
+from .stand_in_server import Faults, FleetSpec, StandInServer, generate_fleet
+
+
+async def _async_start(
+    hass: HomeAssistant, entry: SimpleNamespace, server: StandInServer, snapshot: bool
+) -> tuple[float, int, int]:
+    """Start a new coordinator; return the time until it has data, its requests and vehicles."""
+    coordinator = LubeLoggerDataUpdateCoordinator(hass, entry)
+    try:
+        server.stats.reset()
+        started = time.perf_counter()
+        if snapshot:
+            if not await coordinator.async_load_snapshot():
+                raise RuntimeError("no snapshot was stored")
+        else:
+            coordinator.data = await coordinator._async_update_data()
+        ready = time.perf_counter() - started
+        return ready, server.stats.requests, len(coordinator.data["vehicles"])
+    finally:
+        await coordinator.client.async_close()
+
+
+async def async_benchmark(spec: FleetSpec, faults: Faults, repeat: int) -> None:
+    """Time cold and snapshot starts and print the medians."""
+    server = StandInServer(generate_fleet(spec), faults)
+    url = await server.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.config_entries = _ConfigEntries()
+        entry = SimpleNamespace(
+            entry_id="benchmark",
+            data={CONF_URL: url, CONF_USERNAME: "user", CONF_PASSWORD: "password"},
+            options={},
+        )
+        try:
+            # The run before the restart: refresh, then store the snapshot now
+            coordinator = LubeLoggerDataUpdateCoordinator(hass, entry)
+            try:
+                coordinator.data = await coordinator._async_update_data()
+                await coordinator._store.async_save(coordinator._snapshot_data())
+            finally:
+                await coordinator.client.async_close()
+            snapshot_size = os.path.getsize(coordinator._store.path)
+
+            results = {}
+            for label, snapshot in (("cold", False), ("snapshot", True)):
+                runs = [
+                    await _async_start(hass, entry, server, snapshot) for _ in range(repeat)
+                ]
+                results[label] = runs
+        finally:
+            await server.stop()
+            await hass.async_stop(force=True)
+
+    print(
+        f"{spec.vehicles} vehicles x {spec.records} records per type ({spec.locale}), "
+        f"latency {faults.latency * 1000:.0f} ms, snapshot {snapshot_size / 1000:.1f} kB"
+    )
+    print(f"{'start':<9} {'requests':>8} {'vehicles':>8} {'ready ms':>9}")
+    for label, runs in results.items():
+        _, requests, vehicles = runs[0]
+        ready = statistics.median(run[0] for run in runs)
+        print(f"{label:<9} {requests:>8} {vehicles:>8} {ready * 1000:>9.1f}")
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vehicles", type=int, default=5)
+    parser.add_argument("--records", type=int, default=200, help="records per type")
+    parser.add_argument("--locale", choices=("eu", "us"), default="eu")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per request")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(
+        async_benchmark(
+            FleetSpec(args.vehicles, args.records, args.seed, args.locale),
+            Faults(latency=args.latency),
+            args.repeat,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
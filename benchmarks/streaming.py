@@ -0,0 +1,114 @@
+"""Measure fetching a long gas history buffered and streamed.
+
+Each mode fetches the gas records of one vehicle from the stand-in
+server with a new client: once untimed, for the connection, once timed
+and once traced with tracemalloc. A second timed fetch of the unchanged
+list follows. Peak memory is the highest traced during the fetch, and
+retained memory is what is still allocated after it: the response cache
+and the selection. The peak of a repeated fetch of the unchanged list
+is traced as well.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any
+
+from lubelogger.client import LubeLoggerClient
+from lubelogger.const import API_GAS_RECORD
+from lubelogger.record_types import RECORD_TYPES_BY_KEY
+
+from .stand_in_server import FleetSpec, StandInServer, generate_fleet
+
+# Mode: whether the list is streamed, and whether the server sends it chunked
+MODES = {
+    "buffered": (False, False),
+    "streamed": (True, False),
+    "streamed, chunked": (True, True),
+}
+
+
+def _client(url: str) -> LubeLoggerClient:
+    # No reuse of recent results, so every fetch is a request
+    return LubeLoggerClient(url, "benchmark", "benchmark", coalesce_ttl=0)
+
+
+async def _async_fetch_times(url: str, record_type: Any) -> tuple[float, float, Any]:
+    """Return the time of a first and of a repeated fetch, and the selection."""
+    client = _client(url)
+    try:
+        await client.async_get_vehicles()
+        started = time.perf_counter()
+        selected = await client.async_get_record(record_type, 1)
+        cold = time.perf_counter() - started
+        started = time.perf_counter()
+        await client.async_get_record(record_type, 1)
+        return cold, time.perf_counter() - started, selected
+    finally:
+        await client.async_close()
+
+
+async def _async_fetch_memory(url: str, record_type: Any) -> tuple[int, int, int]:
+    """Return the peak and retained memory of a first fetch, and the peak of a repeat."""
+    client = _client(url)
+    try:
+        await client.async_get_vehicles()
+        gc.collect()
+        tracemalloc.start()
+        await client.async_get_record(record_type, 1)
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        await client.async_get_record(record_type, 1)
+        repeat_peak = tracemalloc.get_traced_memory()[1] - retained
+        tracemalloc.stop()
+        return peak, retained, repeat_peak
+    finally:
+        await client.async_close()
+
+
+async def async_benchmark(records: int, seed: int) -> None:
+    """Fetch the gas history in every mode and print the results."""
+    fleet = generate_fleet(FleetSpec(1, records, seed))
+    gas = RECORD_TYPES_BY_KEY["latest_gas"]
+    size = len(json.dumps(fleet[1]["records"][API_GAS_RECORD]))
+    print(f"{records} gas records, {size / 1e6:.1f} MB")
+    print(
+        f"{'mode':<18} {'peak MB':>8} {'kept MB':>8} {'repeat peak MB':>15} "
+        f"{'first ms':>9} {'repeat ms':>10}"
+    )
+    selections = []
+    for label, (stream, chunked) in MODES.items():
+        server = StandInServer(fleet, chunked=chunked, cache_bodies=True)
+        url = await server.start()
+        try:
+            record_type = dataclasses.replace(gas, stream=stream)
+            cold, repeat, selected = await _async_fetch_times(url, record_type)
+            peak, retained, repeat_peak = await _async_fetch_memory(url, record_type)
+        finally:
+            await server.stop()
+        selections.append(selected)
+        print(
+            f"{label:<18} {peak / 1e6:>8.1f} {retained / 1e6:>8.1f} "
+            f"{repeat_peak / 1e6:>15.1f} "
+            f"{cold * 1000:>9.0f} {repeat * 1000:>10.0f}"
+        )
+    assert all(selected == selections[0] for selected in selections)
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=30000, help="gas records")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(async_benchmark(args.records, args.seed))
+
+
+if __name__ == "__main__":
+    main()
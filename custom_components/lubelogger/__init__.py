@@ -4,12 +4,19 @@ from __future__ import annotations
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant, ServiceCall
+from homeassistant.exceptions import ConfigEntryNotReady
 import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN
-from .coordinator import LubeLoggerDataUpdateCoordinator
+from .const import (
+    CONF_IMPORT_STATISTICS,
+    DEFAULT_IMPORT_STATISTICS,
+    DOMAIN,
+    SERVICE_IMPORT_STATISTICS,
+)
+from .coordinator import LubeLoggerDataUpdateCoordinator, snapshot_store
+from .webhook import async_setup_webhook
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,37 +29,102 @@ CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the LubeLogger integration."""
     _LOGGER.debug("LubeLogger integration is being set up")
+
+    async def _async_import_statistics(call: ServiceCall) -> None:
+        """Import the record history of every entry into long-term statistics."""
+        for coordinator in list(hass.data.get(DOMAIN, {}).values()):
+            if isinstance(coordinator, LubeLoggerDataUpdateCoordinator):
+                await coordinator.async_import_statistics()
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_IMPORT_STATISTICS, _async_import_statistics
+    )
     return True
 
 
+async def _async_first_run(
+    coordinator: LubeLoggerDataUpdateCoordinator, refresh: bool, import_statistics: bool
+) -> None:
+    """Refresh the data shown from the snapshot, then import the statistics."""
+    if refresh:
+        await coordinator.async_refresh()
+    if import_statistics and coordinator.last_update_success:
+        await coordinator.async_import_statistics()
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up LubeLogger from a config entry."""
     _LOGGER.info("Setting up LubeLogger integration entry: %s", entry.title)
     
+    coordinator = LubeLoggerDataUpdateCoordinator(hass, entry)
     try:
-        coordinator = LubeLoggerDataUpdateCoordinator(hass, entry)
-        await coordinator.async_config_entry_first_refresh()
+        # With a stored snapshot the entities come up at once and the
+        # first live refresh runs in the background
+        from_snapshot = await coordinator.async_load_snapshot()
+        if not from_snapshot:
+            await coordinator.async_config_entry_first_refresh()
 
         hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+        async_setup_webhook(hass, entry, coordinator)
+
+        async def _async_close_client(event: Event) -> None:
+            """Close the pooled HTTP session when Home Assistant stops."""
+            await coordinator.client.async_close()
+
+        entry.async_on_unload(
+            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_client)
+        )
+        entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+        import_statistics = entry.options.get(
+            CONF_IMPORT_STATISTICS, DEFAULT_IMPORT_STATISTICS
+        )
+        if from_snapshot or import_statistics:
+            entry.async_create_background_task(
+                hass,
+                _async_first_run(coordinator, from_snapshot, import_statistics),
+                f"{DOMAIN} first refresh",
+            )
         
         _LOGGER.info("LubeLogger integration setup completed successfully")
         return True
+    except ConfigEntryNotReady:
+        # The server is not reachable yet, Home Assistant retries the setup
+        await coordinator.client.async_close()
+        raise
     except Exception as err:
         _LOGGER.exception("Error setting up LubeLogger integration: %s", err)
+        await coordinator.client.async_close()
         return False
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    coordinator: LubeLoggerDataUpdateCoordinator | None = hass.data.get(DOMAIN, {}).get(
+        entry.entry_id
+    )
+    if coordinator is not None and coordinator.options == entry.options:
+        # Only entry data changed (e.g. the learned number format)
+        return
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.info("Unloading LubeLogger integration entry: %s", entry.title)
     
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: LubeLoggerDataUpdateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.client.async_close()
         _LOGGER.info("LubeLogger integration unloaded successfully")
     else:
         _LOGGER.warning("Failed to unload LubeLogger integration platforms")
 
     return unload_ok
 
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored snapshot of a deleted config entry."""
+    await snapshot_store(hass, entry).async_remove()
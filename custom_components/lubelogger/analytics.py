@@ -0,0 +1,113 @@
+"""Fuel economy of a vehicle over its whole gas history."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from .const import FUEL_WINDOWS
+from .history import HistoryRow, diff_history
+
+
+def _sort_key(row: HistoryRow) -> tuple[int, float]:
+    return row.day, row.odometer
+
+
+def _fill_ups(rows: Sequence[HistoryRow]) -> Iterator[HistoryRow]:
+    """Skip rows without an odometer reading, they cannot be placed on the road."""
+    return (row for row in rows if row.odometer > 0)
+
+
+class FuelLog:
+    """Fill-ups of one vehicle in date order, as columns with running totals.
+
+    ``update`` merges the rows of a gas record list. An unchanged list is
+    recognised by identity, new fill-ups after the last known one are
+    appended, and anything else (an edited, deleted or back-dated fill-up)
+    rebuilds the columns. A window statistic then costs one bisection and a few
+    running total differences, whatever the length of the history.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty log."""
+        # Rows merged last; the client's response cache holds them anyway
+        self._source: Sequence[HistoryRow] = ()
+        self.days = array("l")
+        self.odometer = array("d")
+        # Element i is the total over the first i fill-ups
+        self._liters = array("d", [0.0])
+        self._cost = array("d", [0.0])
+
+    def __len__(self) -> int:
+        """Return the number of fill-ups."""
+        return len(self.days)
+
+    def update(self, rows: Sequence[HistoryRow]) -> None:
+        """Merge the rows of the vehicle's current gas record list."""
+        if rows is self._source:
+            return
+        added, removed = diff_history(self._source, rows)
+        self._source = rows
+        new = sorted(_fill_ups(added), key=_sort_key)
+        if any(_fill_ups(removed)) or (
+            new and self.days and _sort_key(new[0]) < (self.days[-1], self.odometer[-1])
+        ):
+            # Edited, deleted or back-dated fill-up
+            self._rebuild(sorted(_fill_ups(rows), key=_sort_key))
+        elif new:
+            self._append(new)
+
+    def _rebuild(self, rows: list[HistoryRow]) -> None:
+        del self.days[:], self.odometer[:], self._liters[1:], self._cost[1:]
+        self._append(rows)
+
+    def _append(self, rows: list[HistoryRow]) -> None:
+        liters = self._liters[-1]
+        cost = self._cost[-1]
+        for row in rows:
+            liters += row.quantity
+            cost += row.cost
+            self.days.append(row.day)
+            self.odometer.append(row.odometer)
+            self._liters.append(liters)
+            self._cost.append(cost)
+
+    def window(self, first_day: int) -> dict[str, float | None]:
+        """Return the fuel economy of the fill-ups from ``first_day`` on.
+
+        The fuel of the first fill-up of the window was burnt before it,
+        so consumption and cost per km only count the later fill-ups over
+        the distance driven since the first one.
+        """
+        count = len(self.days)
+        first = bisect_left(self.days, first_day)
+        stats: dict[str, float | None] = {
+            "consumption": None,
+            "cost_per_km": None,
+            "price_per_liter": None,
+        }
+        if first == count:
+            return stats
+
+        liters = self._liters[count] - self._liters[first]
+        if liters > 0:
+            stats["price_per_liter"] = round(
+                (self._cost[count] - self._cost[first]) / liters, 3
+            )
+        distance = self.odometer[count - 1] - self.odometer[first]
+        if distance > 0:
+            burnt = self._liters[count] - self._liters[first + 1]
+            stats["consumption"] = round(burnt / distance * 100, 2)
+            stats["cost_per_km"] = round(
+                (self._cost[count] - self._cost[first + 1]) / distance, 3
+            )
+        return stats
+
+    def stats(self, today: int) -> dict[str, Any]:
+        """Return the statistics of every window ending ``today`` (a date ordinal)."""
+        result: dict[str, Any] = {"fill_ups": len(self.days)}
+        for days in FUEL_WINDOWS:
+            for name, value in self.window(today - days).items():
+                result[f"{name}_{days}d"] = value
+        return result
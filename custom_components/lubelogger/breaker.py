@@ -0,0 +1,119 @@
+"""Circuit breakers that stop requests to failing LubeLogger endpoints."""
+from __future__ import annotations
+
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass
+
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import BREAKER_BASE_BACKOFF, BREAKER_FAILURE_THRESHOLD, BREAKER_MAX_BACKOFF
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CircuitOpenError(HomeAssistantError):
+    """Error raised instead of requesting an endpoint whose breaker is open."""
+
+
+@dataclass
+class CircuitBreaker:
+    """Consecutive failures of one endpoint and when it may be tried again.
+
+    Requests that fail together count as one failure. A refresh counts
+    at most one failure: its requests start at different times, queued
+    behind the concurrency limits, so they are grouped by the start of
+    the refresh. Requests made outside a refresh are only counted when
+    started after the last counted failure. A refresh failing the
+    endpoint for every vehicle thus adds a single step.
+    After BREAKER_FAILURE_THRESHOLD failures in a row the breaker opens
+    for a backoff that doubles with every further failure, up to
+    BREAKER_MAX_BACKOFF. Half of the backoff is random jitter, so
+    endpoints do not all retry at once. Once the backoff has passed the
+    breaker is half-open: one trial request is let through and the
+    others are refused until its outcome closes or reopens the breaker.
+    """
+
+    name: str
+    failures: int = 0
+    open_until: float = 0.0
+    # Start of the trial request while half-open
+    trial_started: float | None = None
+    # When the last failure was counted, and the start of its refresh
+    last_failure: float = -math.inf
+    last_refresh: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while requests are being refused."""
+        return time.monotonic() < self.open_until or self.trial_started is not None
+
+    def check(self) -> float:
+        """Raise CircuitOpenError if the endpoint should not be requested.
+
+        Return the start of the request, to pass to ``record_failure``
+        and ``settle``.
+        """
+        now = time.monotonic()
+        if self.failures < BREAKER_FAILURE_THRESHOLD:
+            return now
+        if now < self.open_until:
+            raise CircuitOpenError(
+                f"{self.name} is paused for {self.open_until - now:.0f}s "
+                f"after {self.failures} failures"
+            )
+        if self.trial_started is not None:
+            raise CircuitOpenError(f"{self.name} is being retried")
+        self.trial_started = now
+        return now
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        if self.failures >= BREAKER_FAILURE_THRESHOLD:
+            _LOGGER.info("%s is responding again", self.name)
+        self.failures = 0
+        self.open_until = 0.0
+        self.trial_started = None
+
+    def record_failure(self, started: float, refresh: float | None = None) -> None:
+        """Count a failure of a request started at ``started``.
+
+        ``refresh`` is the start of the refresh that made the request, if
+        any. A request started before the last counted failure, or made
+        by the refresh that counted it, failed with it and is not counted
+        again. A failed trial always counts.
+        """
+        trial = started == self.trial_started
+        self.settle(started)
+        if not trial and (
+            started < self.last_failure
+            or (refresh is not None and refresh == self.last_refresh)
+        ):
+            return
+        self.last_failure = time.monotonic()
+        self.last_refresh = refresh
+        self.failures += 1
+        if self.failures < BREAKER_FAILURE_THRESHOLD:
+            return
+        backoff = min(
+            BREAKER_MAX_BACKOFF,
+            BREAKER_BASE_BACKOFF * 2 ** (self.failures - BREAKER_FAILURE_THRESHOLD),
+        )
+        backoff = backoff / 2 + random.uniform(0, backoff / 2)
+        self.open_until = self.last_failure + backoff
+        if self.failures == BREAKER_FAILURE_THRESHOLD:
+            _LOGGER.warning(
+                "%s failed %d times in a row, pausing its requests", self.name, self.failures
+            )
+        _LOGGER.debug("%s paused for %.0fs", self.name, backoff)
+
+    def settle(self, started: float) -> None:
+        """End the trial if the request started at ``started`` was it.
+
+        For requests that neither succeeded nor failed the server, such
+        as client errors or cancellations.
+        """
+        if self.trial_started == started:
+            self.trial_started = None
@@ -0,0 +1,112 @@
+"""Endpoints and formats supported by a LubeLogger server."""
+from __future__ import annotations
+
+import time
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from typing import Any
+
+from .const import CAPABILITY_MAX_AGE
+
+
+def payload_shape(payload: Any) -> str:
+    """Return the JSON type of a response payload."""
+    if isinstance(payload, list):
+        return "list"
+    if isinstance(payload, dict):
+        return "object"
+    if isinstance(payload, bool) or payload is None:
+        return "literal"
+    if isinstance(payload, (int, float)):
+        return "number"
+    return "text"
+
+
+@dataclass
+class Capabilities:
+    """What a server supports, learned from the responses of normal refreshes.
+
+    Endpoints that answered 404 and never answered anything else are
+    skipped, and preferred endpoints are only used while they return the
+    expected shape. The map is stored in the config entry and learned
+    again after CAPABILITY_MAX_AGE or when the server version changes.
+    """
+
+    vehicles_endpoint: str | None = None
+    missing_endpoints: set[str] = field(default_factory=set)
+    # Endpoint path -> shape of its last payload, see payload_shape
+    shapes: dict[str, str] = field(default_factory=dict)
+    date_day_first: bool | None = None
+    server_version: str | None = None
+    discovered_at: float = field(default_factory=time.time)
+    # Endpoint path -> vehicles it answered 404 for, until it is missing
+    # for all of them; not stored
+    not_found_for: dict[str, set[str]] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> Capabilities:
+        """Restore the map stored in a config entry."""
+        if not data:
+            return cls()
+        return cls(
+            vehicles_endpoint=data.get("vehicles_endpoint"),
+            missing_endpoints=set(data.get("missing_endpoints", ())),
+            shapes=dict(data.get("shapes", {})),
+            date_day_first=data.get("date_day_first"),
+            server_version=data.get("server_version"),
+            discovered_at=data.get("discovered_at", 0.0),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the map in a form that can be stored in a config entry."""
+        return {
+            "vehicles_endpoint": self.vehicles_endpoint,
+            "missing_endpoints": sorted(self.missing_endpoints),
+            "shapes": dict(sorted(self.shapes.items())),
+            "date_day_first": self.date_day_first,
+            "server_version": self.server_version,
+            "discovered_at": self.discovered_at,
+        }
+
+    @property
+    def is_stale(self) -> bool:
+        """Return True when the map should be learned again."""
+        return time.time() - self.discovered_at > CAPABILITY_MAX_AGE
+
+    def renewed(self) -> Capabilities:
+        """Return an empty map, keeping the server's date format."""
+        return Capabilities(date_day_first=self.date_day_first)
+
+    def supports(self, path: str, shape: str | None = None) -> bool:
+        """Return False for a missing endpoint or one with another shape."""
+        if path in self.missing_endpoints:
+            return False
+        return shape is None or self.shapes.get(path, shape) == shape
+
+    def record_missing(
+        self,
+        path: str,
+        vehicle_id: str | None = None,
+        vehicle_ids: Collection[str] = (),
+    ) -> None:
+        """Note a 404; endpoints that answered before are not marked missing.
+
+        An endpoint asked for ``vehicle_id`` is only marked missing once it
+        answered 404 for every vehicle of ``vehicle_ids``, so one vehicle
+        without records does not stop the requests of the others.
+        """
+        if path in self.shapes:
+            return
+        if vehicle_id is not None:
+            vehicles = self.not_found_for.setdefault(path, set())
+            vehicles.add(vehicle_id)
+            if not vehicle_ids or not vehicles.issuperset(vehicle_ids):
+                return
+        self.missing_endpoints.add(path)
+        self.not_found_for.pop(path, None)
+
+    def record_payload(self, path: str, payload: Any) -> None:
+        """Note the shape of a successful response."""
+        self.missing_endpoints.discard(path)
+        self.not_found_for.pop(path, None)
+        self.shapes[path] = payload_shape(payload)
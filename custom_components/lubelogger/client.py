@@ -1,74 +1,125 @@
 """Client for interacting with LubeLogger API."""
 from __future__ import annotations
 
+import asyncio
+import codecs
+import hashlib
 import logging
-from datetime import datetime
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Any
+from urllib.parse import parse_qs
 
 import aiohttp
-from homeassistant.util import dt as dt_util
+from aiohttp import hdrs
 
+from .breaker import CircuitBreaker
+from .capabilities import Capabilities
 from .const import (
     API_ROOT,
-    API_ADJUSTED_ODOMETER,
-    API_GAS_RECORD,
-    API_ODOMETER,
-    API_PLAN,
-    API_REMINDER,
-    API_REPAIR_RECORD,
-    API_SERVICE_RECORD,
-    API_SUPPLY_RECORD,
-    API_TAX,
-    API_UPGRADE_RECORD,
     API_VEHICLES,
+    API_VERSION,
+    DEFAULT_COALESCE_TTL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    HEALTH_PROBE_TIMEOUT,
+    REQUEST_TIMEOUT,
+    STREAM_CHUNK_SIZE,
+    STREAM_MIN_BYTES,
 )
+from .history import HistoryRow, history_row
+from .hub import LubeLoggerHub
+from .metrics import EndpointMetrics
+from .models import due_in_days
+from .parsing import DateParser, NumberParser
+from .record_types import RecordType, Selection
+from .streaming import JsonArrayParser
+from .tracker import LatestRecordTracker, RecordSelector, record_id, select_record
+from .tracing import RefreshTrace
 
 _LOGGER = logging.getLogger(__name__)
 
+# Returned by _cached_selection when a payload has not been selected yet
+_NOT_SELECTED = object()
 
-def parse_date_string(date_str: str) -> datetime | None:
-    """Parse a date string in multiple formats and return timezone-aware datetime."""
-    if not date_str:
-        return None
 
-    # Try ISO format first (handles timezone-aware strings)
-    try:
-        if date_str.endswith("Z"):
-            date_str = date_str.replace("Z", "+00:00")
-        dt = datetime.fromisoformat(date_str)
-        # Ensure timezone-aware - use UTC if no timezone info
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=dt_util.UTC)
-        return dt
-    except (ValueError, AttributeError):
-        pass
-
-    # Try European formats first, then US formats
-    formats = [
-        "%d/%m/%Y",           # European format: "28/02/2027"
-        "%d/%m/%Y %H:%M:%S",  # European with time
-        "%m/%d/%Y",           # US format: "12/17/2025"
-        "%m/%d/%Y %H:%M:%S",  # US with time
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S.%f",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d",
-    ]
-
-    for fmt in formats:
+@dataclass
+class CachedResponse:
+    """Decoded payload of a GET request with its cache validators."""
+
+    payload: Any
+    etag: str | None = None
+    last_modified: str | None = None
+    body_hash: bytes | None = None
+
+
+@dataclass
+class StreamedSelection:
+    """Record selected from a streamed record list, which itself is not kept."""
+
+    selected: dict[str, Any] | None
+    # Rows of the whole list, for record types with a history
+    history: tuple[HistoryRow, ...] | None = None
+
+
+# Date of records without one in sort keys, never compared with a real date
+_NO_DATE = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _id_sort_key(rec: dict[str, Any]) -> Any:
+    """Sort key for records ordered by id."""
+    rec_id = rec.get("id") or rec.get("Id")
+    if rec_id:
         try:
-            dt = datetime.strptime(date_str, fmt)
-            # Make timezone-aware (assume local timezone)
-            if dt.tzinfo is None:
-                dt = dt_util.as_local(dt)
-            return dt
-        except (ValueError, AttributeError):
-            continue
+            return int(rec_id)
+        except (ValueError, TypeError):
+            return rec_id
+    return 0
+
+
+def _check_selected(
+    record_type: RecordType,
+    sort_key: Callable[[dict[str, Any]], Any],
+    selected: dict[str, Any] | None,
+) -> dict[str, Any] | None:
+    """Drop a selected "next" record that has no date."""
+    if (
+        record_type.selection is Selection.NEXT
+        and selected is not None
+        and sort_key(selected)[0] != 0
+    ):
+        return None
+    return selected
+
 
+def _no_payload() -> None:
+    """Payload of a 404 that callers must tell from an empty list."""
     return None
 
 
-def calculate_reminder_priority(reminder: dict[str, Any]) -> tuple:
+def _is_server_failure(err: BaseException) -> bool:
+    """Return True for errors that say the server, not the request, is at fault."""
+    if isinstance(err, aiohttp.ClientResponseError):
+        return err.status >= 500
+    return isinstance(err, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+
+def _log_selected(
+    record_type: RecordType, vehicle_id: Any, selected: dict[str, Any] | None
+) -> None:
+    """Log which record was selected, without dumping its contents."""
+    _LOGGER.debug(
+        "Selected %s for vehicle %s: record %s",
+        record_type.key,
+        vehicle_id,
+        record_id(selected) if selected else None,
+    )
+
+
+def calculate_reminder_priority(
+    reminder: dict[str, Any], km_per_day: float | None = None
+) -> tuple:
     """Calculate priority for reminder sorting.
     
     Returns (priority_value, days, distance) where:
@@ -76,6 +127,9 @@ def calculate_reminder_priority(reminder: dict[str, Any]) -> tuple:
     - For Date reminders: priority_value = dueDays
     - For Odometer reminders: priority_value = dueDistance
     - For Both: use the smaller of the two
+
+    With the vehicle's ``km_per_day`` the priority value is instead the
+    number of days until the reminder falls due, see models.due_in_days.
     """
     # Get values as numbers
     due_days_str = reminder.get("dueDays", "")
@@ -93,6 +147,10 @@ def calculate_reminder_priority(reminder: dict[str, Any]) -> tuple:
     
     # Get metric type
     metric = reminder.get("metric", "")
+
+    if km_per_day:
+        days = due_in_days(metric, due_days, due_distance, km_per_day)
+        return (999999 if days is None else days, due_days, due_distance)
     
     # Calculate priority based on metric
     if "Date" in metric and "Odometer" not in metric:
@@ -124,312 +182,616 @@ class LubeLoggerClient:
         username: str,
         password: str,
         session: aiohttp.ClientSession | None = None,
+        limit_per_host: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        coalesce_ttl: float = DEFAULT_COALESCE_TTL,
+        hub: LubeLoggerHub | None = None,
     ) -> None:
-        """Initialize the client."""
+        """Initialize the client.
+
+        Clients of config entries share the ``hub`` of their server, see
+        hub.async_get_hub. Without one the client gets a hub of its own,
+        using ``session`` and ``limit_per_host``. Either way the client
+        must be released with ``async_close``.
+        """
         self._url = url.rstrip("/")
         self._username = username
         self._password = password
-        self._session = session
+        self._coalesce_ttl = coalesce_ttl
         self._auth = aiohttp.BasicAuth(username, password)
+        self.hub = hub or LubeLoggerHub(url, session, limit_per_host)
+        self.hub.attach(self)
+
+        # Decoded GET payloads and GETs in progress live in the hub. The
+        # record selected from each payload is kept by endpoint, so
+        # unchanged responses are not re-processed.
+        self._selections: dict[str, tuple[Any, Any]] = {}
+        # History rows of each list payload by endpoint, checked the same way
+        self._histories: dict[str, tuple[Any, tuple[HistoryRow, ...]]] = {}
+        self._tracker = LatestRecordTracker()
+        self.date_parser = DateParser()
+        self.number_parser = NumberParser()
+        # Vehicles in the last vehicle list of this account; their records
+        # are shared with the other accounts of the server
+        self._vehicle_ids: set[Any] = set()
+
+        # Request metrics by endpoint path (without the query string)
+        self.metrics: dict[str, EndpointMetrics] = {}
+        # Trace of the refresh in progress, set by the coordinator
+        self.trace: RefreshTrace | None = None
+        # Start of the refresh in progress (monotonic), set by the
+        # coordinator; the breakers count its failures once
+        self.refresh_started: float | None = None
+        # Endpoints supported by the server, restored by the coordinator
+        self.capabilities = Capabilities()
+
+    @property
+    def connections_created(self) -> int:
+        """Connections opened to the server, by any client of the hub."""
+        return self.hub.connections_created
+
+    @property
+    def connect_time(self) -> float:
+        """Time spent opening connections to the server (seconds)."""
+        return self.hub.connect_time
+
+    async def async_close(self) -> None:
+        """Release the hub, closing its session after its last client."""
+        await self.hub.async_detach(self)
+
+    def _scope(self, shared: bool) -> Any:
+        """Return the cache scope of a response, see LubeLoggerHub."""
+        return None if shared else self._auth
+
+    async def async_check_health(self) -> bool:
+        """Make one cheap request and return whether the server answers.
+
+        Any response below 500 counts, even an error such as 401 or 404.
+        The timeout is shorter than for data requests, so a dead server
+        costs a single short wait. The answer is shared by the clients of
+        the hub like any coalesced request.
+        """
+        return await self._async_coalesced((hdrs.METH_HEAD, API_ROOT), None, self._async_probe)
+
+    async def _async_probe(self) -> bool:
+        """Send the health probe."""
+        started = time.perf_counter()
+        status: int | None = None
+        try:
+            async with self.hub.get_session().head(
+                f"{self._url}{API_ROOT}",
+                auth=self._auth,
+                timeout=aiohttp.ClientTimeout(total=HEALTH_PROBE_TIMEOUT),
+            ) as response:
+                status = response.status
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.debug("Health probe failed: %r", err)
+            return False
+        finally:
+            if self.trace is not None:
+                self.trace.add("probe", started, time.perf_counter(), status=status)
+        return status < 500
 
     async def async_get_vehicles(self) -> list[dict[str, Any]]:
         """Get all vehicles from LubeLogger."""
-        vehicles = await self._async_request(API_VEHICLES)
+        endpoint = self.capabilities.vehicles_endpoint or API_VEHICLES
+        vehicles = None
+        if endpoint == API_VEHICLES or self.capabilities.supports(endpoint):
+            vehicles = await self._async_request(endpoint, not_found=_no_payload)
         if not isinstance(vehicles, list):
-            return []
+            if endpoint != API_VEHICLES:
+                # The endpoint found at setup is missing or stopped working
+                self.capabilities.vehicles_endpoint = None
+                return await self.async_get_vehicles()
+            vehicles = []
+        self._vehicle_ids = {
+            vehicle.get("Id") or vehicle.get("id")
+            for vehicle in vehicles
+            if isinstance(vehicle, dict)
+        }
         return vehicles
 
-    async def async_get_latest_odometer(
-        self, vehicle_id: int | None = None
+    async def async_get_server_version(self) -> str | None:
+        """Get the LubeLogger version, if the server reports it."""
+        payload = await self._async_request(API_VERSION, shared=True)
+        if isinstance(payload, dict):
+            for key in ("currentVersion", "CurrentVersion", "version", "Version"):
+                if version := payload.get(key):
+                    return str(version)
+        elif isinstance(payload, str) and payload.strip():
+            return payload.strip().strip('"')
+        return None
+
+    async def async_get_record(
+        self,
+        record_type: RecordType,
+        vehicle_id: int | None = None,
+        km_per_day: float | None = None,
     ) -> dict[str, Any] | None:
-        """Get the latest odometer record for a vehicle."""
-        if vehicle_id:
+        """Get the selected record of a record type for a vehicle."""
+        selected, _ = await self.async_get_record_history(record_type, vehicle_id, km_per_day)
+        return selected
+
+    async def async_get_record_history(
+        self,
+        record_type: RecordType,
+        vehicle_id: int | None = None,
+        km_per_day: float | None = None,
+    ) -> tuple[dict[str, Any] | None, Sequence[HistoryRow] | None]:
+        """Get the selected record of a record type for a vehicle, and its history.
+
+        The history holds a row per dated record of the list for record
+        types with ``history``, and is None for the others or when the list
+        could not be read. An unchanged list gives the same sequence again.
+
+        ``km_per_day`` is the vehicle's driving pace, used to rank distance
+        based reminders by the day they fall due.
+
+        Records of a vehicle in this account's vehicle list are the same for
+        every account that sees the vehicle, so they are fetched once for
+        all the clients of the hub.
+        """
+        if not self.capabilities.supports(record_type.endpoint):
+            return None, None
+        shared = vehicle_id is not None and vehicle_id in self._vehicle_ids
+        if (
+            record_type.preferred_endpoint
+            and vehicle_id
+            # Skipped if it is missing or answered something else before
+            and self.capabilities.supports(record_type.preferred_endpoint, "object")
+        ):
             try:
-                endpoint = f"{API_ADJUSTED_ODOMETER}?vehicleId={vehicle_id}"
-                adjusted = await self._async_request(endpoint)
-                if adjusted and isinstance(adjusted, dict):
-                    _LOGGER.debug("Using adjusted odometer for vehicle %s: %s", vehicle_id, adjusted)
-                    return {"odometer": adjusted, "adjusted": True}
+                endpoint = f"{record_type.preferred_endpoint}?vehicleId={vehicle_id}"
+                preferred = await self._async_request(endpoint, shared=shared)
+                if preferred and isinstance(preferred, dict):
+                    _LOGGER.debug(
+                        "Using %s for vehicle %s: %s", endpoint, vehicle_id, preferred
+                    )
+                    return {"odometer": preferred, "adjusted": True}, None
             except Exception as err:
-                _LOGGER.debug("Adjusted odometer not available for vehicle %s: %s", vehicle_id, err)
-        
-        endpoint = f"{API_ODOMETER}?vehicleId={vehicle_id}" if vehicle_id else API_ODOMETER
-        records = await self._async_request(endpoint)
+                _LOGGER.debug(
+                    "%s not available for vehicle %s: %s",
+                    record_type.preferred_endpoint,
+                    vehicle_id,
+                    err,
+                )
+
+        endpoint = (
+            f"{record_type.endpoint}?vehicleId={vehicle_id}"
+            if vehicle_id
+            else record_type.endpoint
+        )
+        selector = None
+        row = None
+        if record_type.history:
+            row = self._history_row(record_type)
+        if record_type.stream:
+            selector = RecordSelector(*self._sort_key(record_type))
+        records = await self._async_request(
+            endpoint, selector=selector, row=row, shared=shared
+        )
+        if isinstance(records, StreamedSelection):
+            _log_selected(record_type, vehicle_id, records.selected)
+            return records.selected, records.history
+
+        history = None
+        if row is not None:
+            history = self._history(endpoint, records, row)
+        # Reminders are ranked at the current pace, not cached with the payload
+        selected = _NOT_SELECTED
+        if record_type.selection is not Selection.PRIORITY:
+            selected = self._cached_selection(endpoint, records)
+        if selected is not _NOT_SELECTED:
+            return selected, history
         if not isinstance(records, list) or not records:
-            _LOGGER.debug("No odometer records found for vehicle %s", vehicle_id)
+            _LOGGER.debug("No %s records found for vehicle %s", record_type.key, vehicle_id)
+            return None, history
+
+        started = time.perf_counter()
+        selected = self._select(endpoint, record_type, records, km_per_day)
+        if self.trace is not None:
+            self.trace.add(
+                "select",
+                started,
+                time.perf_counter(),
+                record_type=record_type.key,
+                records=len(records),
+            )
+        _log_selected(record_type, vehicle_id, selected)
+        return self._remember_selection(endpoint, records, selected), history
+
+    def _history_row(
+        self, record_type: RecordType
+    ) -> Callable[[dict[str, Any]], HistoryRow | None]:
+        """Return the function building the history row of a record."""
+        parse_date = self.date_parser.parse
+        parse_number = self.number_parser.parse
+
+        def row(rec: dict[str, Any]) -> HistoryRow | None:
+            return history_row(rec, record_type, parse_date, parse_number)
+
+        return row
+
+    def _history(
+        self,
+        endpoint: str,
+        records: Any,
+        row: Callable[[dict[str, Any]], HistoryRow | None],
+    ) -> tuple[HistoryRow, ...] | None:
+        """Return the history rows of a list payload, built once per payload."""
+        cached = self._histories.get(endpoint)
+        if cached is not None and cached[0] is records:
+            return cached[1]
+        if not isinstance(records, list):
             return None
-
-        def sort_key(rec: dict[str, Any]) -> Any:
-            rec_id = rec.get("id") or rec.get("Id")
-            if rec_id:
-                try:
-                    return int(rec_id)
-                except (ValueError, TypeError):
-                    return rec_id
-            return 0
-
-        latest = sorted(records, key=sort_key)[-1]
-        _LOGGER.debug("Latest odometer for vehicle %s: %s", vehicle_id, latest)
-        return latest
-
-    async def async_get_next_plan(
-        self, vehicle_id: int | None = None
+        history = tuple(
+            rec_row
+            for rec in records
+            if isinstance(rec, dict) and (rec_row := row(rec)) is not None
+        )
+        self._histories[endpoint] = (records, history)
+        return history
+
+    def _select(
+        self,
+        endpoint: str,
+        record_type: RecordType,
+        records: list[dict[str, Any]],
+        km_per_day: float | None = None,
     ) -> dict[str, Any] | None:
-        """Get the next upcoming plan item for a vehicle."""
-        endpoint = f"{API_PLAN}?vehicleId={vehicle_id}" if vehicle_id else API_PLAN
-        records = await self._async_request(endpoint)
-        if not isinstance(records, list) or not records:
-            _LOGGER.debug("No plan records found for vehicle %s", vehicle_id)
+        """Pick the record of a list according to the record type's selection rule."""
+        if record_type.selection is Selection.PRIORITY:
+            # Reminder priorities change every day, so they are not tracked
+            valid_records = [rec for rec in records if isinstance(rec, dict) and rec]
+            return select_record(
+                valid_records,
+                lambda rec: calculate_reminder_priority(rec, km_per_day),
+                latest=False,
+            )
+
+        sort_key, latest = self._sort_key(record_type)
+        selected = self._tracker.select(endpoint, records, sort_key, latest)
+        return _check_selected(record_type, sort_key, selected)
+
+    def _sort_key(
+        self, record_type: RecordType
+    ) -> tuple[Callable[[dict[str, Any]], Any], bool]:
+        """Return the sort key of a record type and whether the highest key wins."""
+        if record_type.selection is Selection.PRIORITY:
+            return calculate_reminder_priority, False
+        if record_type.selection is Selection.LATEST_ID:
+            return _id_sort_key, True
+
+        date_fields = record_type.date_fields
+        parse = self.date_parser.parse
+
+        def record_date(rec: dict[str, Any]) -> Any:
+            for field in date_fields:
+                if date_str := rec.get(field):
+                    return parse(date_str)
             return None
-        
-        def sort_key(rec: dict[str, Any]) -> Any:
-            date_str = rec.get("dateCreated") or rec.get("dateModified") or rec.get("Date") or rec.get("date")
-            if date_str:
-                dt = parse_date_string(date_str)
-                if dt:
-                    return dt
-            return datetime.max
-        
-        sorted_records = sorted([r for r in records if sort_key(r) != datetime.max], key=sort_key)
-        if sorted_records:
-            _LOGGER.debug("Next plan for vehicle %s: %s", vehicle_id, sorted_records[0])
-            return sorted_records[0]
-        return None
 
-    async def async_get_latest_tax(
-        self, vehicle_id: int | None = None
-    ) -> dict[str, Any] | None:
-        """Get the latest tax record for a vehicle."""
-        endpoint = f"{API_TAX}?vehicleId={vehicle_id}" if vehicle_id else API_TAX
-        records = await self._async_request(endpoint)
-        if not isinstance(records, list) or not records:
-            _LOGGER.debug("No tax records found for vehicle %s", vehicle_id)
-            return None
+        if record_type.selection is Selection.NEXT:
+            def next_key(rec: dict[str, Any]) -> Any:
+                # Records without a date sort last and are never selected
+                dt = record_date(rec)
+                return (0, dt) if dt else (1, 0)
 
-        def sort_key(rec: dict[str, Any]) -> Any:
-            date_str = rec.get("date") or rec.get("Date") or rec.get("taxDate")
-            if date_str:
-                dt = parse_date_string(date_str)
-                if dt:
-                    return dt
-            
-            rec_id = rec.get("id") or rec.get("Id")
-            if rec_id:
-                try:
-                    return int(rec_id)
-                except (ValueError, TypeError):
-                    return rec_id
-            return 0
-
-        sorted_records = sorted(records, key=sort_key)
-        latest = sorted_records[-1] if sorted_records else None
-        _LOGGER.debug("Latest tax for vehicle %s: %s", vehicle_id, latest)
-        return latest
-
-    async def async_get_latest_service(
-        self, vehicle_id: int | None = None
-    ) -> dict[str, Any] | None:
-        """Get the latest service record for a vehicle."""
-        endpoint = f"{API_SERVICE_RECORD}?vehicleId={vehicle_id}" if vehicle_id else API_SERVICE_RECORD
-        records = await self._async_request(endpoint)
-        if not isinstance(records, list) or not records:
-            _LOGGER.debug("No service records found for vehicle %s", vehicle_id)
-            return None
+            return next_key, False
 
-        def sort_key(rec: dict[str, Any]) -> Any:
-            date_str = rec.get("date") or rec.get("Date") or rec.get("serviceDate")
-            if date_str:
-                dt = parse_date_string(date_str)
-                if dt:
-                    return dt
-            
-            rec_id = rec.get("id") or rec.get("Id")
-            if rec_id:
-                try:
-                    return int(rec_id)
-                except (ValueError, TypeError):
-                    return rec_id
-            return 0
-
-        sorted_records = sorted(records, key=sort_key)
-        latest = sorted_records[-1] if sorted_records else None
-        _LOGGER.debug("Latest service for vehicle %s: %s", vehicle_id, latest)
-        return latest
-
-    async def async_get_latest_repair(
-        self, vehicle_id: int | None = None
-    ) -> dict[str, Any] | None:
-        """Get the latest repair record for a vehicle."""
-        endpoint = f"{API_REPAIR_RECORD}?vehicleId={vehicle_id}" if vehicle_id else API_REPAIR_RECORD
-        records = await self._async_request(endpoint)
-        if not isinstance(records, list) or not records:
-            _LOGGER.debug("No repair records found for vehicle %s", vehicle_id)
-            return None
+        def latest_key(rec: dict[str, Any]) -> Any:
+            # Dated records first, then by date; records without a date by id
+            dt = record_date(rec)
+            return (dt is not None, dt or _NO_DATE, _id_sort_key(rec))
 
-        def sort_key(rec: dict[str, Any]) -> Any:
-            date_str = rec.get("date") or rec.get("Date") or rec.get("repairDate")
-            if date_str:
-                dt = parse_date_string(date_str)
-                if dt:
-                    return dt
-            
-            rec_id = rec.get("id") or rec.get("Id")
-            if rec_id:
-                try:
-                    return int(rec_id)
-                except (ValueError, TypeError):
-                    return rec_id
-            return 0
-
-        sorted_records = sorted(records, key=sort_key)
-        latest = sorted_records[-1] if sorted_records else None
-        _LOGGER.debug("Latest repair for vehicle %s: %s", vehicle_id, latest)
-        return latest
-
-    async def async_get_latest_upgrade(
-        self, vehicle_id: int | None = None
-    ) -> dict[str, Any] | None:
-        """Get the latest upgrade record for a vehicle."""
-        endpoint = f"{API_UPGRADE_RECORD}?vehicleId={vehicle_id}" if vehicle_id else API_UPGRADE_RECORD
-        records = await self._async_request(endpoint)
-        if not isinstance(records, list) or not records:
-            _LOGGER.debug("No upgrade records found for vehicle %s", vehicle_id)
-            return None
+        return latest_key, True
 
-        def sort_key(rec: dict[str, Any]) -> Any:
-            date_str = rec.get("date") or rec.get("Date") or rec.get("upgradeDate")
-            if date_str:
-                dt = parse_date_string(date_str)
-                if dt:
-                    return dt
-            
-            rec_id = rec.get("id") or rec.get("Id")
-            if rec_id:
-                try:
-                    return int(rec_id)
-                except (ValueError, TypeError):
-                    return rec_id
-            return 0
-
-        sorted_records = sorted(records, key=sort_key)
-        latest = sorted_records[-1] if sorted_records else None
-        _LOGGER.debug("Latest upgrade for vehicle %s: %s", vehicle_id, latest)
-        return latest
-
-    async def async_get_latest_supply(
-        self, vehicle_id: int | None = None
-    ) -> dict[str, Any] | None:
-        """Get the latest supply record for a vehicle."""
-        endpoint = f"{API_SUPPLY_RECORD}?vehicleId={vehicle_id}" if vehicle_id else API_SUPPLY_RECORD
-        records = await self._async_request(endpoint)
-        if not isinstance(records, list) or not records:
-            _LOGGER.debug("No supply records found for vehicle %s", vehicle_id)
-            return None
+    def _cached_selection(self, endpoint: str, records: Any) -> Any:
+        """Return the record selected from this exact payload, if any.
 
-        def sort_key(rec: dict[str, Any]) -> Any:
-            date_str = rec.get("date") or rec.get("Date") or rec.get("supplyDate")
-            if date_str:
-                dt = parse_date_string(date_str)
-                if dt:
-                    return dt
-            
-            rec_id = rec.get("id") or rec.get("Id")
-            if rec_id:
-                try:
-                    return int(rec_id)
-                except (ValueError, TypeError):
-                    return rec_id
-            return 0
-
-        sorted_records = sorted(records, key=sort_key)
-        latest = sorted_records[-1] if sorted_records else None
-        _LOGGER.debug("Latest supply for vehicle %s: %s", vehicle_id, latest)
-        return latest
-
-    async def async_get_latest_gas(
-        self, vehicle_id: int | None = None
-    ) -> dict[str, Any] | None:
-        """Get the latest gas/fuel record for a vehicle."""
-        endpoint = f"{API_GAS_RECORD}?vehicleId={vehicle_id}" if vehicle_id else API_GAS_RECORD
-        records = await self._async_request(endpoint)
-        if not isinstance(records, list) or not records:
-            _LOGGER.debug("No gas records found for vehicle %s", vehicle_id)
-            return None
+        Unchanged responses are served as the same cached object, so an
+        identity check is enough to skip selecting the record again.
+        """
+        cached = self._selections.get(endpoint)
+        if cached is not None and cached[0] is records:
+            return cached[1]
+        return _NOT_SELECTED
 
-        def sort_key(rec: dict[str, Any]) -> Any:
-            date_str = rec.get("date") or rec.get("Date") or rec.get("fuelDate") or rec.get("FuelDate")
-            if date_str:
-                dt = parse_date_string(date_str)
-                if dt:
-                    return dt
-            
-            rec_id = rec.get("id") or rec.get("Id")
-            if rec_id:
-                try:
-                    return int(rec_id)
-                except (ValueError, TypeError):
-                    return rec_id
-            return 0
-
-        sorted_records = sorted(records, key=sort_key)
-        latest = sorted_records[-1] if sorted_records else None
-        _LOGGER.debug("Latest gas for vehicle %s: %s", vehicle_id, latest)
-        return latest
-
-    async def async_get_next_reminder(
-        self, vehicle_id: int | None = None
+    def _remember_selection(
+        self, endpoint: str, records: Any, selected: dict[str, Any] | None
     ) -> dict[str, Any] | None:
-        """Get the next upcoming reminder for a vehicle."""
-        endpoint = f"{API_REMINDER}?vehicleId={vehicle_id}" if vehicle_id else API_REMINDER
-        records = await self._async_request(endpoint)
-        
-        if not isinstance(records, list) or not records:
-            _LOGGER.debug("No reminders found for vehicle %s", vehicle_id)
-            return None
-        
-        valid_records = []
-        for record in records:
-            if isinstance(record, dict) and record:
-                valid_records.append(record)
-        
-        if not valid_records:
-            _LOGGER.debug("No valid reminder records for vehicle %s", vehicle_id)
-            return None
-        
-        sorted_records = sorted(valid_records, key=calculate_reminder_priority)
-        
-        if sorted_records:
-            next_reminder = sorted_records[0]
-            _LOGGER.debug("Selected next reminder for vehicle %s: %s", vehicle_id, next_reminder)
-            return next_reminder
-        
-        return None
+        """Store the record selected from a payload and return it."""
+        self._selections[endpoint] = (records, selected)
+        return selected
 
     async def _async_request(
-        self, endpoint: str, method: str = "GET", **kwargs: Any
+        self,
+        endpoint: str,
+        method: str = "GET",
+        selector: RecordSelector | None = None,
+        row: Callable[[dict[str, Any]], HistoryRow | None] | None = None,
+        shared: bool = False,
+        not_found: Callable[[], Any] = list,
+        **kwargs: Any,
     ) -> Any:
-        """Make an async request to the LubeLogger API."""
+        """Make an async request to the LubeLogger API, coalescing identical GETs.
+
+        Concurrent GETs of the same endpoint share one request and its
+        decoded result, which is also reused for ``coalesce_ttl`` seconds.
+        A caller being cancelled does not cancel the shared request.
+
+        Only GETs made with the same credentials are coalesced, unless the
+        response is ``shared`` by every account of the server.
+        """
+        if method != "GET" or kwargs:
+            return await self._async_fetch(
+                endpoint, method, selector, row, shared, not_found, **kwargs
+            )
+
+        return await self._async_coalesced(
+            (self._scope(shared), endpoint),
+            self.metrics.setdefault(endpoint.partition("?")[0], EndpointMetrics()),
+            lambda: self._async_fetch(
+                endpoint, selector=selector, row=row, shared=shared, not_found=not_found
+            ),
+        )
+
+    async def _async_coalesced(
+        self,
+        key: Any,
+        metrics: EndpointMetrics | None,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the result of ``fetch``, shared with the callers of the same key."""
+        hub = self.hub
+        if (recent := hub.recent.get(key)) is not None:
+            if recent[0] > time.monotonic():
+                if metrics is not None:
+                    metrics.coalesced += 1
+                return recent[1]
+            del hub.recent[key]
+
+        task = hub.in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            hub.in_flight[key] = task
+            task.add_done_callback(lambda task: self._request_done(key, task))
+        elif metrics is not None:
+            metrics.coalesced += 1
+        return await asyncio.shield(task)
+
+    def forget_recent(self, vehicle_id: Any) -> None:
+        """Stop reusing the results of a vehicle's endpoints, which are known to have changed."""
+        suffix = f"?vehicleId={vehicle_id}"
+        for key in [key for key in self.hub.recent if key[1].endswith(suffix)]:
+            del self.hub.recent[key]
+
+    def _request_done(self, key: Any, task: asyncio.Task[Any]) -> None:
+        """Forget a finished shared request, keeping a successful result briefly."""
+        del self.hub.in_flight[key]
+        # Retrieving the exception keeps asyncio from logging it when every
+        # caller was cancelled; callers that are still waiting get it anyway
+        if task.cancelled() or task.exception() is not None:
+            return
+        if self._coalesce_ttl > 0:
+            self.hub.recent[key] = (time.monotonic() + self._coalesce_ttl, task.result())
+
+    async def _async_fetch(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        selector: RecordSelector | None = None,
+        row: Callable[[dict[str, Any]], HistoryRow | None] | None = None,
+        shared: bool = False,
+        not_found: Callable[[], Any] = list,
+        **kwargs: Any,
+    ) -> Any:
+        """Make a request to the LubeLogger API.
+
+        GET responses are cached in the hub by scope and endpoint. Later
+        requests send the ETag and Last-Modified validators, and a 304 or a
+        body with the same hash returns the cached payload without decoding
+        it again. Each request still carries the client's own credentials.
+
+        With a ``selector``, a large record list is streamed through it and
+        only the selected record is returned, as a StreamedSelection. With
+        ``row`` too, the selection also holds the history rows of the list.
+
+        A 404 returns the result of ``not_found``, an empty list by default.
+        """
         url = f"{self._url}{endpoint}"
-        session = self._session or aiohttp.ClientSession()
+        session = self.hub.get_session()
+        path = endpoint.partition("?")[0]
+        breakers = self.hub.breakers
+        breaker = breakers.get(path)
+        if breaker is None:
+            breaker = breakers[path] = CircuitBreaker(path)
+        request_started = breaker.check()
+        metrics = self.metrics.setdefault(path, EndpointMetrics())
+        metrics.requests += 1
+        started = time.perf_counter()
+        decode_time = 0.0
+        # Outcome of the request, for the refresh trace
+        detail: dict[str, Any] = {"endpoint": path}
+
+        cache_key = (self._scope(shared), endpoint)
+        cached = self.hub.response_cache.get(cache_key) if method == "GET" else None
+        headers = dict(kwargs.pop("headers", None) or {})
+        if cached is not None:
+            if cached.etag:
+                headers[hdrs.IF_NONE_MATCH] = cached.etag
+            if cached.last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = cached.last_modified
 
         try:
             async with session.request(
                 method,
                 url,
                 auth=self._auth,
-                timeout=aiohttp.ClientTimeout(total=10),
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
                 **kwargs,
             ) as response:
+                detail["status"] = response.status
+                if response.status == 304 and cached is not None:
+                    _LOGGER.debug("Not modified: %s", url)
+                    detail["cache"] = "not_modified"
+                    return cached.payload
                 if response.status == 404:
                     _LOGGER.debug("Endpoint not found: %s", url)
-                    return []
+                    self.capabilities.record_missing(
+                        path,
+                        parse_qs(endpoint.partition("?")[2]).get("vehicleId", [None])[0],
+                        {str(vehicle_id) for vehicle_id in self._vehicle_ids},
+                    )
+                    return not_found()
                 response.raise_for_status()
-                if response.content_type == "application/json":
+                if response.content_type != "application/json":
+                    metrics.bytes += len(await response.read())
+                    text = await response.text()
+                    self.capabilities.record_payload(path, text)
+                    return text
+                if method != "GET":
                     return await response.json()
-                return await response.text()
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Error communicating with LubeLogger API: %s", err)
+
+                if selector is not None and (
+                    response.content_length is None
+                    or response.content_length > STREAM_MIN_BYTES
+                ):
+                    result, decode_time = await self._async_read_streamed(
+                        url, cache_key, response, cached, selector, row, metrics
+                    )
+                    unchanged = cached is not None and result is cached.payload
+                    detail["cache"] = "unchanged" if unchanged else "streamed"
+                    self.capabilities.record_payload(path, [])
+                    return result
+
+                body = await response.read()
+                metrics.bytes += len(body)
+                detail["bytes"] = len(body)
+                body_hash = hashlib.blake2b(body, digest_size=16).digest()
+                if (
+                    cached is not None
+                    and cached.body_hash == body_hash
+                    and not isinstance(cached.payload, StreamedSelection)
+                ):
+                    _LOGGER.debug("Unchanged body: %s", url)
+                    detail["cache"] = "unchanged"
+                    payload = cached.payload
+                else:
+                    decode_started = time.perf_counter()
+                    payload = await response.json()
+                    decode_time = time.perf_counter() - decode_started
+                    metrics.decode_times.append(decode_time)
+                self._store_response(cache_key, response, payload, body_hash)
+                self.capabilities.record_payload(path, payload)
+                return payload
+        except Exception as err:
+            metrics.errors += 1
+            detail["error"] = type(err).__name__
+            if _is_server_failure(err):
+                breaker.record_failure(request_started, self.refresh_started)
+            # Callers log the failure with its context
+            _LOGGER.debug("Error requesting %s: %r", url, err)
             raise
         finally:
-            if not self._session:
-                await session.close()
\ No newline at end of file
+            ended = time.perf_counter()
+            if "status" in detail and "error" not in detail:
+                breaker.record_success()
+            else:
+                breaker.settle(request_started)
+            metrics.latencies.append(ended - started - decode_time)
+            if self.trace is not None:
+                if decode_time:
+                    detail["decode_ms"] = round(decode_time * 1000, 2)
+                self.trace.add("http", started, ended, **detail)
+
+    def _store_response(
+        self,
+        cache_key: tuple[Any, str],
+        response: aiohttp.ClientResponse,
+        payload: Any,
+        body_hash: bytes,
+    ) -> None:
+        """Cache a GET payload with the validators of its response."""
+        self.hub.response_cache[cache_key] = CachedResponse(
+            payload=payload,
+            etag=response.headers.get(hdrs.ETAG),
+            last_modified=response.headers.get(hdrs.LAST_MODIFIED),
+            body_hash=body_hash,
+        )
+
+    async def _async_read_streamed(
+        self,
+        url: str,
+        cache_key: tuple[Any, str],
+        response: aiohttp.ClientResponse,
+        cached: CachedResponse | None,
+        selector: RecordSelector,
+        row: Callable[[dict[str, Any]], HistoryRow | None] | None,
+        metrics: EndpointMetrics,
+    ) -> tuple[StreamedSelection, float]:
+        """Feed the records of a JSON array response to a selector as they arrive.
+
+        With ``row`` the history row of every record is kept as well. The
+        body is hashed while it is decoded into the fresh ``selector``; when
+        the hash matches the cached one, the new selection is dropped and
+        the cached one returned, so callers see an unchanged payload. Only
+        the current winner and the new rows are held, never the whole body:
+        rows equal to the start of the previous history are not kept again.
+        Return the selection and the time spent decoding and selecting.
+        """
+        previous: StreamedSelection | None = None
+        if cached is not None and isinstance(cached.payload, StreamedSelection):
+            previous = cached.payload
+        previous_history = (previous.history if previous else None) or ()
+        parser = JsonArrayParser()
+        decoder = codecs.getincrementaldecoder(response.charset or "utf-8")()
+        hasher = hashlib.blake2b(digest_size=16)
+        history: list[HistoryRow] | None = [] if row is not None else None
+        # Leading rows equal to the previous history, not copied until one differs
+        matched = 0
+        decode_time = 0.0
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            decode_started = time.perf_counter()
+            metrics.bytes += len(chunk)
+            hasher.update(chunk)
+            for rec in parser.feed(decoder.decode(chunk)):
+                if not isinstance(rec, dict):
+                    continue
+                selector.add(rec)
+                if history is None or (rec_row := row(rec)) is None:
+                    continue
+                if (
+                    not history
+                    and matched < len(previous_history)
+                    and previous_history[matched] == rec_row
+                ):
+                    matched += 1
+                    continue
+                if not history:
+                    history.extend(previous_history[:matched])
+                history.append(rec_row)
+            decode_time += time.perf_counter() - decode_started
+        parser.feed(decoder.decode(b"", final=True))
+        parser.close()
+        metrics.decode_times.append(decode_time)
+
+        body_hash = hasher.digest()
+        if previous is not None and cached.body_hash == body_hash:
+            _LOGGER.debug("Unchanged body: %s", url)
+            result = previous
+        else:
+            rows: tuple[HistoryRow, ...] | None = None
+            if history is None:
+                rows = None
+            elif history:
+                rows = tuple(history)
+            elif matched == len(previous_history) and isinstance(
+                previous_history, tuple
+            ):
+                rows = previous_history
+            else:
+                rows = tuple(previous_history[:matched])
+            result = StreamedSelection(selector.selected, rows)
+        self._store_response(cache_key, response, result, body_hash)
+        return result, decode_time
@@ -9,11 +9,30 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_URL, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import DOMAIN
+from .capabilities import Capabilities
+from .const import (
+    CONF_CAPABILITIES,
+    CONF_IMPORT_STATISTICS,
+    CONF_MAX_CONCURRENT_PER_VEHICLE,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_RECORDS_INTERVAL,
+    CONF_TAX_PLAN_INTERVAL,
+    CONF_UPDATE_INTERVAL,
+    CONF_VEHICLES_INTERVAL,
+    DEFAULT_IMPORT_STATISTICS,
+    DEFAULT_MAX_CONCURRENT_PER_VEHICLE,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_RECORDS_INTERVAL,
+    DEFAULT_TAX_PLAN_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_VEHICLES_INTERVAL,
+    DOMAIN,
+)
+from .webhook import async_webhook_url
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -65,7 +84,13 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
                             try:
                                 data = await response.json()
                                 _LOGGER.debug("Successfully connected to LubeLogger")
-                                return {"title": f"LubeLogger ({url})"}
+                                return {
+                                    "title": f"LubeLogger ({url})",
+                                    # Kept so the client asks this endpoint directly
+                                    "vehicles_endpoint": endpoint
+                                    if isinstance(data, list)
+                                    else None,
+                                }
                             except Exception:
                                 # Even if JSON parsing fails, 200 means we connected
                                 _LOGGER.debug("Connected but response not JSON")
@@ -131,13 +156,85 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             _LOGGER.exception("Unexpected exception")
             errors["base"] = "unknown"
         else:
-            return self.async_create_entry(title=info["title"], data=user_input)
+            capabilities = Capabilities(vehicles_endpoint=info.get("vehicles_endpoint"))
+            return self.async_create_entry(
+                title=info["title"],
+                data={**user_input, CONF_CAPABILITIES: capabilities.as_dict()},
+            )
 
         return self.async_show_form(
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Create the options flow."""
+        return OptionsFlowHandler()
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle LubeLogger options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the polling and concurrency options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        interval = vol.All(vol.Coerce(int), vol.Range(min=30))
+        limit = vol.All(vol.Coerce(int), vol.Range(min=1))
+
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_UPDATE_INTERVAL,
+                    default=options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+                ): interval,
+                vol.Required(
+                    CONF_RECORDS_INTERVAL,
+                    default=options.get(CONF_RECORDS_INTERVAL, DEFAULT_RECORDS_INTERVAL),
+                ): interval,
+                vol.Required(
+                    CONF_TAX_PLAN_INTERVAL,
+                    default=options.get(CONF_TAX_PLAN_INTERVAL, DEFAULT_TAX_PLAN_INTERVAL),
+                ): interval,
+                vol.Required(
+                    CONF_VEHICLES_INTERVAL,
+                    default=options.get(CONF_VEHICLES_INTERVAL, DEFAULT_VEHICLES_INTERVAL),
+                ): interval,
+                vol.Required(
+                    CONF_MAX_CONCURRENT_REQUESTS,
+                    default=options.get(
+                        CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+                    ),
+                ): limit,
+                vol.Required(
+                    CONF_MAX_CONCURRENT_PER_VEHICLE,
+                    default=options.get(
+                        CONF_MAX_CONCURRENT_PER_VEHICLE, DEFAULT_MAX_CONCURRENT_PER_VEHICLE
+                    ),
+                ): limit,
+                vol.Required(
+                    CONF_IMPORT_STATISTICS,
+                    default=options.get(CONF_IMPORT_STATISTICS, DEFAULT_IMPORT_STATISTICS),
+                ): bool,
+            }
+        )
+        return self.async_show_form(
+            step_id="init",
+            data_schema=schema,
+            description_placeholders={
+                "webhook_url": async_webhook_url(self.hass, self.config_entry)
+            },
+        )
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
     
@@ -6,15 +6,78 @@ DOMAIN: Final = "lubelogger"
 CONF_URL: Final = "url"
 CONF_USERNAME: Final = "username"
 CONF_PASSWORD: Final = "password"
+CONF_DECIMAL_SEPARATOR: Final = "decimal_separator"
 CONF_UPDATE_INTERVAL: Final = "update_interval"
+CONF_RECORDS_INTERVAL: Final = "records_interval"
+CONF_TAX_PLAN_INTERVAL: Final = "tax_plan_interval"
+CONF_VEHICLES_INTERVAL: Final = "vehicles_interval"
+CONF_MAX_CONCURRENT_REQUESTS: Final = "max_concurrent_requests"
+CONF_MAX_CONCURRENT_PER_VEHICLE: Final = "max_concurrent_per_vehicle"
+CONF_CAPABILITIES: Final = "capabilities"
+CONF_IMPORT_STATISTICS: Final = "import_statistics"
 
 DEFAULT_UPDATE_INTERVAL: Final = 300  # 5 minutes
+DEFAULT_RECORDS_INTERVAL: Final = 1800  # 30 minutes
+DEFAULT_TAX_PLAN_INTERVAL: Final = 86400  # 1 day
+DEFAULT_VEHICLES_INTERVAL: Final = 3600  # 1 hour
+DEFAULT_MAX_CONCURRENT_REQUESTS: Final = 8  # whole server
+DEFAULT_MAX_CONCURRENT_PER_VEHICLE: Final = 4
+DEFAULT_IMPORT_STATISTICS: Final = False
+
+SERVICE_IMPORT_STATISTICS: Final = "import_statistics"
+
+# HTTP connection pool
+DNS_CACHE_TTL: Final = 300  # seconds
+KEEPALIVE_TIMEOUT: Final = 60  # seconds
+
+# Requests
+REQUEST_TIMEOUT: Final = 10  # seconds
+HEALTH_PROBE_TIMEOUT: Final = 5  # seconds
+# Identical GETs share one request while it runs, and its result for this
+# long after it completed (seconds, 0 disables)
+DEFAULT_COALESCE_TTL: Final = 1.0
+# Consecutive failures before an endpoint is paused, and its pause, which
+# doubles with every further failure (seconds)
+BREAKER_FAILURE_THRESHOLD: Final = 3
+BREAKER_BASE_BACKOFF: Final = 30
+BREAKER_MAX_BACKOFF: Final = 1800
+
+# Record lists larger than this (or of unknown size) are decoded while they
+# are received instead of being buffered, for record types that allow it
+STREAM_MIN_BYTES: Final = 256 * 1024
+STREAM_CHUNK_SIZE: Final = 64 * 1024
+
+# Requests kept per endpoint for latency percentiles and decode times
+METRICS_WINDOW: Final = 256
+
+# Endpoint capabilities are learned again after this long (seconds)
+CAPABILITY_MAX_AGE: Final = 7 * 86400
+
+# Rolling windows of the fuel economy sensors (days)
+FUEL_WINDOWS: Final = (30, 90, 365)
+
+# Odometer readings lose half their weight in the driving pace this often (days)
+ODOMETER_TREND_HALF_LIFE: Final = 180
+
+# Days of statistics sent to the recorder at once by the history import
+STATISTICS_CHUNK_SIZE: Final = 500
+
+# Key in hass.data[DOMAIN] of the hubs shared by the entries of a server
+DATA_HUBS: Final = "hubs"
+
+# Refresh traces kept for the diagnostics
+TRACE_HISTORY: Final = 5
+
+# Snapshot of the last refresh, shown at startup until live data arrives
+SNAPSHOT_VERSION: Final = 2
+SNAPSHOT_SAVE_DELAY: Final = 10  # seconds
 
 # API endpoints
 # The LubeLogger API is rooted at /api and exposes multiple resources.
 # See https://docs.lubelogger.com/Advanced/API for details.
 API_ROOT: Final = "/api"
 API_VEHICLES: Final = "/api/vehicles"
+API_VERSION: Final = "/api/version"
 
 # Vehicle-scoped endpoints
 API_ODOMETER: Final = "/api/vehicle/odometerrecords"
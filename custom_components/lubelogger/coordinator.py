@@ -1,24 +1,95 @@
 """Data update coordinator for LubeLogger."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import timedelta
+import time
+from collections import deque
+from collections.abc import Sequence
+from datetime import date, timedelta
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from .analytics import FuelLog
+from .breaker import CircuitOpenError
+from .capabilities import Capabilities
 from .client import LubeLoggerClient
+from .costs import CostLedger
+from .history import HistoryRow
+from .hub import async_get_hub
+from .models import (
+    RECORD_CLASSES,
+    Record,
+    ReminderRecord,
+    VehicleInfo,
+    vehicle_as_dict,
+    vehicle_from_dict,
+)
+from .record_types import RECORD_TYPES, RecordType
+from .statistics import async_import_vehicle_statistics
 from .const import (
+    API_VERSION,
+    CONF_CAPABILITIES,
+    CONF_DECIMAL_SEPARATOR,
+    CONF_MAX_CONCURRENT_PER_VEHICLE,
+    CONF_MAX_CONCURRENT_REQUESTS,
     CONF_PASSWORD,
+    CONF_RECORDS_INTERVAL,
+    CONF_TAX_PLAN_INTERVAL,
+    CONF_UPDATE_INTERVAL,
     CONF_URL,
     CONF_USERNAME,
+    CONF_VEHICLES_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_PER_VEHICLE,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_RECORDS_INTERVAL,
+    DEFAULT_TAX_PLAN_INTERVAL,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_VEHICLES_INTERVAL,
     DOMAIN,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_VERSION,
+    TRACE_HISTORY,
 )
+from .tracing import RefreshTrace, current_vehicle
+from .trend import OdometerTrend
 
 _LOGGER = logging.getLogger(__name__)
 
+# Polling tier options and their default period (seconds). Each record
+# type names its tier; the vehicle list has its own (CONF_VEHICLES_INTERVAL).
+POLLING_TIERS: dict[str, int] = {
+    CONF_UPDATE_INTERVAL: DEFAULT_UPDATE_INTERVAL,
+    CONF_RECORDS_INTERVAL: DEFAULT_RECORDS_INTERVAL,
+    CONF_TAX_PLAN_INTERVAL: DEFAULT_TAX_PLAN_INTERVAL,
+}
+
+# Returned by _async_fetch_record when the previous value should be kept
+_KEEP_PREVIOUS = object()
+
+# Vehicle data computed from the records, which any new record can change
+_DERIVED_KEYS: tuple[str, ...] = ("fuel_stats", "costs", "reminder_forecast")
+
+
+class _SnapshotStore(Store[dict[str, Any]]):
+    """Store of a data snapshot."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Drop a snapshot of an older version, the first refresh replaces it."""
+        return {}
+
+
+def snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    """Return the store holding the data snapshot of a config entry."""
+    return _SnapshotStore(hass, SNAPSHOT_VERSION, f"{DOMAIN}.{entry.entry_id}")
+
 
 class LubeLoggerDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching LubeLogger data."""
@@ -26,16 +97,75 @@ class LubeLoggerDataUpdateCoordinator(DataUpdateCoordinator):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
         self.entry = entry
+        max_concurrent_requests = entry.options.get(
+            CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+        )
         self.client = LubeLoggerClient(
             url=entry.data[CONF_URL],
             username=entry.data[CONF_USERNAME],
             password=entry.data[CONF_PASSWORD],
+            # Shared with the other entries of the same server
+            hub=async_get_hub(hass, entry.data[CONF_URL], max_concurrent_requests),
         )
+        # Number format and endpoints learned from earlier responses of this server
+        self.client.number_parser.decimal_separator = entry.data.get(CONF_DECIMAL_SEPARATOR)
+        self.client.capabilities = Capabilities.from_dict(entry.data.get(CONF_CAPABILITIES))
+        self.client.date_parser.day_first = self.client.capabilities.date_day_first
+        # Options the entry was set up with, see async_reload_entry
+        self.options = dict(entry.options)
+
+        # Refresh period of every polling tier; the coordinator ticks at the
+        # shortest one and each refresh only fetches the tiers that are due.
+        self._tier_intervals: dict[str, float] = {
+            CONF_VEHICLES_INTERVAL: entry.options.get(
+                CONF_VEHICLES_INTERVAL, DEFAULT_VEHICLES_INTERVAL
+            ),
+        }
+        for option, default in POLLING_TIERS.items():
+            self._tier_intervals[option] = entry.options.get(option, default)
+        self._tier_last_run: dict[str, float] = {}
+        # Keys whose last fetch failed are retried on the next refresh
+        self._retry_keys: set[tuple[Any, str]] = set()
+        # Gas history, cost totals and driving pace of every vehicle, for
+        # the analytics sensors
+        self._fuel_logs: dict[Any, FuelLog] = {}
+        self._cost_ledgers: dict[Any, CostLedger] = {}
+        self._odometer_trends: dict[Any, OdometerTrend] = {}
+        # Last history rows of every vehicle by record type, for the
+        # statistics import; the client's response cache holds them anyway
+        self._histories: dict[Any, dict[str, Sequence[HistoryRow]]] = {}
+        self._statistics_lock = asyncio.Lock()
+        # Polled and pushed refreshes replace the data one at a time
+        self._refresh_lock = asyncio.Lock()
+        # Typed record of every vehicle and record type, with the API record
+        # it was built from; an unchanged record is not parsed again
+        self._records: dict[tuple[Any, str], tuple[dict[str, Any], Record]] = {}
 
-        update_interval = timedelta(
-            seconds=entry.options.get("update_interval", DEFAULT_UPDATE_INTERVAL)
+        update_interval = timedelta(seconds=min(self._tier_intervals.values()))
+
+        # Concurrency limits for a refresh: one for the whole server, shared
+        # by its entries, and one for the endpoints of a single vehicle.
+        self._server_semaphore = self.client.hub.semaphore
+        self._max_per_vehicle: int = entry.options.get(
+            CONF_MAX_CONCURRENT_PER_VEHICLE, DEFAULT_MAX_CONCURRENT_PER_VEHICLE
         )
 
+        # Last good data, persisted so entities are ready right after a restart
+        self._store = snapshot_store(hass, entry)
+        self._saved_vehicles: list[dict] | None = None
+        # True while the data only comes from the stored snapshot
+        self.from_snapshot = False
+
+        # Timing of the last refresh (seconds)
+        self.last_refresh_wall_time: float | None = None
+        self.last_refresh_request_time: float | None = None
+        self.last_refresh_cpu_time: float | None = None
+        self.last_refresh_connect_time: float | None = None
+        self.last_refresh_vehicles: int | None = None
+        # Step timings of the last refreshes, for the diagnostics
+        self.traces: deque[RefreshTrace] = deque(maxlen=TRACE_HISTORY)
+        self.active_trace: RefreshTrace | None = None
+
         super().__init__(
             hass,
             _LOGGER,
@@ -45,130 +175,503 @@ class LubeLoggerDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self) -> dict:
         """Fetch data from LubeLogger, organized by vehicle."""
-        data: dict = {"vehicles": []}
+        async with self._refresh_lock:
+            # Started under the lock, so a webhook refresh running before
+            # does not add its requests to this trace
+            trace = RefreshTrace()
+            self.traces.append(trace)
+            self.active_trace = self.client.trace = trace
+            try:
+                return await self._async_fetch_data(trace)
+            except BaseException:
+                # No entity update follows to end the trace
+                trace.finish()
+                self.active_trace = None
+                raise
+            finally:
+                self.client.trace = None
+                self.client.refresh_started = None
 
-        # Get all vehicles
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the entities, timing it as the end of the refresh trace."""
+        trace = self.active_trace
         try:
-            vehicles = await self.client.async_get_vehicles()
-        except Exception as err:
-            _LOGGER.warning("Error fetching vehicles: %s", err)
-            return data
+            super().async_update_listeners()
+        finally:
+            if trace is not None:
+                trace.finish()
+                self.active_trace = None
 
-        # For each vehicle, fetch its specific data
-        for vehicle in vehicles:
-            vehicle_id = vehicle.get("Id") or vehicle.get("id")
-            if not vehicle_id:
-                continue
+    async def _async_fetch_data(self, trace: RefreshTrace) -> dict:
+        """Fetch the due data of every vehicle."""
+        data: dict = {"vehicles": [], "vehicle_index": {}}
+        started = self.client.refresh_started = time.monotonic()
+        cpu_started = time.process_time()
+        connections_before = self.client.connections_created
+        connect_time_before = self.client.connect_time
 
-            # Build device name from Make, Model, Year
-            make = vehicle.get("Make") or vehicle.get("make") or ""
-            model = vehicle.get("Model") or vehicle.get("model") or ""
-            year_val = vehicle.get("Year") or vehicle.get("year")
-            year = str(year_val) if year_val else ""
-            
-            name_parts = [part for part in [year, make, model] if part]
-            device_name = " ".join(name_parts) if name_parts else vehicle.get("Name") or vehicle.get("name") or f"Vehicle {vehicle_id}"
-
-            vehicle_data = {
-                "id": vehicle_id,
-                "name": device_name,
-                "vehicle_info": vehicle,
-            }
+        due_tiers = self._due_tiers()
+        trace.tiers = sorted(due_tiers)
+        previous: dict[Any, dict] = (self.data or {}).get("vehicle_index", {})
 
-            # Latest odometer for this vehicle
-            try:
-                vehicle_data["latest_odometer"] = await self.client.async_get_latest_odometer(
-                    vehicle_id
-                )
-            except Exception as err:
-                _LOGGER.warning(
-                    "Error fetching latest odometer for vehicle %s: %s", vehicle_id, err
-                )
-                vehicle_data["latest_odometer"] = None
+        # One short request first: a dead server must not cost a timeout
+        # for every endpoint of every vehicle. The last data is kept and
+        # marked stale until the server answers again.
+        if not await self.client.async_check_health():
+            raise UpdateFailed("LubeLogger server is not reachable")
 
-            # Next planned item for this vehicle
-            try:
-                vehicle_data["next_plan"] = await self.client.async_get_next_plan(vehicle_id)
-            except Exception as err:
-                _LOGGER.warning(
-                    "Error fetching next plan for vehicle %s: %s", vehicle_id, err
-                )
-                vehicle_data["next_plan"] = None
+        if CONF_VEHICLES_INTERVAL in due_tiers or not previous:
+            await self._async_check_capabilities()
 
-            # Latest tax for this vehicle
+        # Get all vehicles
+        if CONF_VEHICLES_INTERVAL in due_tiers or not previous:
             try:
-                vehicle_data["latest_tax"] = await self.client.async_get_latest_tax(vehicle_id)
+                vehicles = [
+                    info
+                    for vehicle in await self.client.async_get_vehicles()
+                    if (info := VehicleInfo.from_api(vehicle)) is not None
+                ]
+            except CircuitOpenError as err:
+                if not previous:
+                    raise UpdateFailed(str(err)) from err
+                _LOGGER.debug("Keeping the known vehicles: %s", err)
+                vehicles = [vehicle["vehicle_info"] for vehicle in previous.values()]
             except Exception as err:
-                _LOGGER.warning(
-                    "Error fetching latest tax for vehicle %s: %s", vehicle_id, err
-                )
-                vehicle_data["latest_tax"] = None
+                _LOGGER.warning("Error fetching vehicles: %s", err)
+                if self.from_snapshot:
+                    # Keep showing the snapshot until the server answers
+                    return self.data
+                return data
+        else:
+            vehicles = [vehicle["vehicle_info"] for vehicle in previous.values()]
+        request_time = time.monotonic() - started
 
-            # Latest service record for this vehicle
-            try:
-                vehicle_data["latest_service"] = await self.client.async_get_latest_service(
-                    vehicle_id
-                )
-            except Exception as err:
-                _LOGGER.warning(
-                    "Error fetching latest service for vehicle %s: %s", vehicle_id, err
-                )
-                vehicle_data["latest_service"] = None
+        due_keys = {
+            record_type.key
+            for record_type in RECORD_TYPES
+            if record_type.tier in due_tiers
+        }
 
-            # Latest repair record for this vehicle
-            try:
-                vehicle_data["latest_repair"] = await self.client.async_get_latest_repair(
-                    vehicle_id
-                )
-            except Exception as err:
-                _LOGGER.warning(
-                    "Error fetching latest repair for vehicle %s: %s", vehicle_id, err
-                )
-                vehicle_data["latest_repair"] = None
+        # Fetch every vehicle concurrently, bounded by the semaphores
+        results = await asyncio.gather(
+            *(
+                self._async_fetch_vehicle(vehicle, due_keys, previous)
+                for vehicle in vehicles
+            )
+        )
 
-            # Latest upgrade record for this vehicle
-            try:
-                vehicle_data["latest_upgrade"] = await self.client.async_get_latest_upgrade(
-                    vehicle_id
-                )
-            except Exception as err:
-                _LOGGER.warning(
-                    "Error fetching latest upgrade for vehicle %s: %s", vehicle_id, err
-                )
-                vehicle_data["latest_upgrade"] = None
+        for vehicle_data, vehicle_request_time in results:
+            request_time += vehicle_request_time
+            if vehicle_data is not None:
+                data["vehicles"].append(vehicle_data)
 
-            # Latest supply record for this vehicle
-            try:
-                vehicle_data["latest_supply"] = await self.client.async_get_latest_supply(
-                    vehicle_id
-                )
-            except Exception as err:
-                _LOGGER.warning(
-                    "Error fetching latest supply for vehicle %s: %s", vehicle_id, err
-                )
-                vehicle_data["latest_supply"] = None
+        # Vehicle id -> vehicle data, for constant-time lookups by entities
+        data["vehicle_index"] = {vehicle["id"]: vehicle for vehicle in data["vehicles"]}
+
+        if self.client.number_parser.decimal_separator is None:
+            self._learn_number_format(data["vehicles"])
+        # After the number format is learned from the API records
+        today = dt_util.now().date()
+        for vehicle_data in data["vehicles"]:
+            self._finish_vehicle(vehicle_data, today)
+        self._save_capabilities()
 
-            # Latest gas/fuel record for this vehicle
+        for option in due_tiers:
+            self._tier_last_run[option] = started
+
+        self.from_snapshot = False
+        self._save_snapshot(data)
+
+        self.last_refresh_wall_time = time.monotonic() - started
+        self.last_refresh_request_time = request_time
+        self.last_refresh_cpu_time = time.process_time() - cpu_started
+        self.last_refresh_connect_time = self.client.connect_time - connect_time_before
+        self.last_refresh_vehicles = len(data["vehicles"])
+        _LOGGER.debug(
+            "Refreshed %d vehicles (tiers: %s) in %.2fs wall time (%.2fs summed request time, "
+            "%.2fs CPU, %d new connections in %.3fs)",
+            len(data["vehicles"]),
+            ", ".join(sorted(due_tiers)) or "none",
+            self.last_refresh_wall_time,
+            self.last_refresh_request_time,
+            self.last_refresh_cpu_time,
+            self.client.connections_created - connections_before,
+            self.last_refresh_connect_time,
+        )
+
+        return data
+
+    async def async_refresh_records(
+        self, vehicle_id: Any, record_types: Sequence[RecordType]
+    ) -> bool:
+        """Fetch some record types of one vehicle now, e.g. when a webhook says they changed.
+
+        Only the entities of the vehicle that depend on them are updated,
+        and the polling schedule is left alone. Return False if the
+        vehicle is unknown.
+        """
+        async with self._refresh_lock:
+            previous_data = (self.data or {}).get("vehicle_index", {}).get(vehicle_id)
+            if previous_data is None:
+                return False
+            self.client.forget_recent(vehicle_id)
+            vehicle_semaphore = asyncio.Semaphore(self._max_per_vehicle)
+            self.client.refresh_started = time.monotonic()
             try:
-                vehicle_data["latest_gas"] = await self.client.async_get_latest_gas(vehicle_id)
-            except Exception as err:
-                _LOGGER.warning(
-                    "Error fetching latest gas for vehicle %s: %s", vehicle_id, err
+                results = await asyncio.gather(
+                    *(
+                        self._async_fetch_record(vehicle_id, record_type, vehicle_semaphore)
+                        for record_type in record_types
+                    )
                 )
-                vehicle_data["latest_gas"] = None
+            finally:
+                self.client.refresh_started = None
+            vehicle_data = dict(previous_data)
+            for record_type, (value, _) in zip(record_types, results):
+                if value is not _KEEP_PREVIOUS:
+                    vehicle_data[record_type.key] = value
+
+            today = dt_util.now().date()
+            self._add_analytics(vehicle_data, previous_data, today)
+            if self.client.number_parser.decimal_separator is None:
+                self._learn_number_format([vehicle_data])
+            self._finish_vehicle(vehicle_data, today)
+
+            vehicles = [
+                vehicle_data if vehicle["id"] == vehicle_id else vehicle
+                for vehicle in self.data["vehicles"]
+            ]
+            data = {
+                **self.data,
+                "vehicles": vehicles,
+                "vehicle_index": {vehicle["id"]: vehicle for vehicle in vehicles},
+            }
+            self.data = data
+            self._save_snapshot(data)
+
+        keys = {record_type.key for record_type in record_types}
+        keys.update(_DERIVED_KEYS)
+        self._async_update_context_listeners({(vehicle_id, key) for key in keys})
+        return True
+
+    @callback
+    def _async_update_context_listeners(self, contexts: set[Any]) -> None:
+        """Update the entities whose (vehicle id, data key) context is given."""
+        for update_callback, context in list(self._listeners.values()):
+            if context in contexts:
+                update_callback()
 
-            # Next reminder for this vehicle
+    def _save_snapshot(self, data: dict) -> None:
+        """Schedule saving the data when it changed."""
+        if data["vehicles"] != self._saved_vehicles:
+            self._saved_vehicles = data["vehicles"]
+            self._store.async_delay_save(self._snapshot_data, SNAPSHOT_SAVE_DELAY)
+
+    async def async_load_snapshot(self) -> bool:
+        """Use the data stored by the last refresh before a restart.
+
+        Return True if a snapshot was loaded; the first live refresh can
+        then run in the background.
+        """
+        try:
+            snapshot = await self._store.async_load()
+        except Exception as err:
+            # Unreadable file or unknown version, it is replaced on next save
+            _LOGGER.warning("Could not load the stored LubeLogger data: %s", err)
+            return False
+        if not snapshot or not isinstance(snapshot.get("vehicles"), list):
+            return False
+
+        try:
+            vehicles = [vehicle_from_dict(vehicle) for vehicle in snapshot["vehicles"]]
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Could not load the stored LubeLogger data: %s", err)
+            return False
+        self.data = {
+            "vehicles": vehicles,
+            "vehicle_index": {vehicle["id"]: vehicle for vehicle in vehicles},
+        }
+        self._saved_vehicles = vehicles
+        self.from_snapshot = True
+        _LOGGER.debug(
+            "Loaded %d vehicles from the snapshot saved at %s",
+            len(vehicles),
+            snapshot.get("saved_at"),
+        )
+        return True
+
+    def _snapshot_data(self) -> dict[str, Any]:
+        """Return the data to store; the vehicle index is rebuilt on load."""
+        return {
+            "saved_at": dt_util.utcnow().isoformat(),
+            "vehicles": [vehicle_as_dict(vehicle) for vehicle in self._saved_vehicles or ()],
+        }
+
+    async def async_import_statistics(self) -> int:
+        """Import the record history of every vehicle into long-term statistics.
+
+        Only the histories fetched since the start are known, so this runs
+        after a live refresh. Return the number of days imported.
+        """
+        imported = 0
+        # A second import waits and then only finds the days left over
+        async with self._statistics_lock:
+            for vehicle in (self.data or {}).get("vehicles", []):
+                if histories := self._histories.get(vehicle["id"]):
+                    imported += await async_import_vehicle_statistics(
+                        self.hass, vehicle["id"], vehicle["name"], histories
+                    )
+        _LOGGER.info("Imported %d days of LubeLogger statistics", imported)
+        return imported
+
+    async def _async_check_capabilities(self) -> None:
+        """Learn the server's endpoints again when the map is old or the server was updated."""
+        capabilities = self.client.capabilities
+        if capabilities.is_stale:
+            _LOGGER.debug("Learning the endpoints of the server again")
+            self.client.capabilities = capabilities.renewed()
+            return
+        if not capabilities.supports(API_VERSION):
+            return
+        try:
+            version = await self.client.async_get_server_version()
+        except Exception as err:
+            _LOGGER.debug("Could not get the server version: %s", err)
+            return
+        if version == capabilities.server_version:
+            return
+        if capabilities.server_version is not None:
+            _LOGGER.info(
+                "LubeLogger was updated from %s to %s, learning its endpoints again",
+                capabilities.server_version,
+                version,
+            )
+            capabilities = self.client.capabilities = capabilities.renewed()
+        capabilities.server_version = version
+
+    def _save_capabilities(self) -> None:
+        """Store the learned endpoints and date format in the config entry when they changed."""
+        capabilities = self.client.capabilities
+        capabilities.date_day_first = self.client.date_parser.day_first
+        stored = capabilities.as_dict()
+        if stored != self.entry.data.get(CONF_CAPABILITIES):
+            self.hass.config_entries.async_update_entry(
+                self.entry, data={**self.entry.data, CONF_CAPABILITIES: stored}
+            )
+
+    def _learn_number_format(self, vehicles: list[dict]) -> None:
+        """Infer the server's decimal separator from the fetched records.
+
+        Once it is known it is stored in the config entry, so the sampling
+        is not repeated after a restart.
+        """
+        parser = self.client.number_parser
+        for vehicle in vehicles:
+            for record_type in RECORD_TYPES:
+                record = vehicle.get(record_type.key)
+                if not isinstance(record, dict):
+                    continue
+                for value in record.values():
+                    if parser.observe(value):
+                        # Parse the records again with the learned format
+                        self._records.clear()
+                        self.hass.config_entries.async_update_entry(
+                            self.entry,
+                            data={
+                                **self.entry.data,
+                                CONF_DECIMAL_SEPARATOR: parser.decimal_separator,
+                            },
+                        )
+                        return
+
+    def _due_tiers(self) -> set[str]:
+        """Return the polling tiers whose period has elapsed."""
+        now = time.monotonic()
+        # Timer ticks can fire slightly early, allow half a tick of slack
+        slack = self.update_interval.total_seconds() / 2 if self.update_interval else 0
+        return {
+            option
+            for option, interval in self._tier_intervals.items()
+            if option not in self._tier_last_run
+            or now - self._tier_last_run[option] >= interval - slack
+        }
+
+    async def _async_fetch_vehicle(
+        self,
+        vehicle: VehicleInfo,
+        due_keys: set[str],
+        previous: dict[Any, dict],
+    ) -> tuple[dict | None, float]:
+        """Fetch the due data of one vehicle and return it with the summed request time.
+
+        Keys of tiers that are not due are copied from the previous data.
+        Fetched records are still API records, see _parse_records.
+        """
+        vehicle_id = vehicle.id
+        # Runs in its own task, so this only tags the spans of this vehicle
+        current_vehicle.set(vehicle_id)
+
+        vehicle_data = {
+            "id": vehicle_id,
+            "name": vehicle.name,
+            "vehicle_info": vehicle,
+        }
+
+        previous_data = previous.get(vehicle_id)
+        fetches = [
+            record_type
+            for record_type in RECORD_TYPES
+            if previous_data is None
+            or record_type.key in due_keys
+            or (vehicle_id, record_type.key) in self._retry_keys
+        ]
+
+        vehicle_semaphore = asyncio.Semaphore(self._max_per_vehicle)
+        results = await asyncio.gather(
+            *(
+                self._async_fetch_record(vehicle_id, record_type, vehicle_semaphore)
+                for record_type in fetches
+            )
+        )
+        fetched = {
+            record_type.key: result for record_type, result in zip(fetches, results)
+        }
+
+        request_time = 0.0
+        for record_type in RECORD_TYPES:
+            key = record_type.key
+            value, elapsed = fetched.get(key, (_KEEP_PREVIOUS, 0.0))
+            request_time += elapsed
+            if value is _KEEP_PREVIOUS:
+                value = previous_data.get(key) if previous_data else None
+            vehicle_data[key] = value
+
+        self._add_analytics(vehicle_data, previous_data, dt_util.now().date())
+        return vehicle_data, request_time
+
+    def _add_analytics(
+        self, vehicle_data: dict[str, Any], previous_data: dict | None, today: date
+    ) -> None:
+        """Add the fuel statistics and cost totals of a vehicle as of today.
+
+        Windows and periods end today, so these change even without new records.
+        """
+        vehicle_id = vehicle_data["id"]
+        if (fuel_log := self._fuel_logs.get(vehicle_id)) is not None:
+            vehicle_data["fuel_stats"] = fuel_log.stats(today.toordinal())
+        elif previous_data:
+            vehicle_data["fuel_stats"] = previous_data.get("fuel_stats")
+        if (ledger := self._cost_ledgers.get(vehicle_id)) is not None:
+            vehicle_data["costs"] = ledger.totals(today)
+        elif previous_data:
+            vehicle_data["costs"] = previous_data.get("costs")
+
+    def _finish_vehicle(self, vehicle_data: dict[str, Any], today: date) -> None:
+        """Parse the fetched records of a vehicle and forecast its next reminder.
+
+        Runs once the number format has been learned from the API records.
+        """
+        self._parse_records(vehicle_data)
+        vehicle_data["reminder_forecast"] = self._forecast_reminder(
+            vehicle_data["id"], vehicle_data.get("next_reminder"), today
+        )
+
+    async def _async_fetch_record(
+        self,
+        vehicle_id: int,
+        record_type: RecordType,
+        vehicle_semaphore: asyncio.Semaphore,
+    ) -> tuple[Any, float]:
+        """Fetch one record type under both concurrency limits.
+
+        A failure only clears this key, the other keys of the vehicle are kept.
+        While the endpoint's circuit breaker is open the previous value is kept.
+        """
+        key = record_type.key
+        async with vehicle_semaphore, self._server_semaphore:
+            started = time.monotonic()
             try:
-                vehicle_data["next_reminder"] = await self.client.async_get_next_reminder(
-                    vehicle_id
+                value, history = await self.client.async_get_record_history(
+                    record_type, vehicle_id, self._km_per_day(vehicle_id)
                 )
+                if history is not None:
+                    self._update_history(vehicle_id, record_type, history)
+                self._retry_keys.discard((vehicle_id, key))
+            except CircuitOpenError as err:
+                # The endpoint is paused, keep showing the last value
+                _LOGGER.debug("Skipped %s for vehicle %s: %s", key, vehicle_id, err)
+                value = _KEEP_PREVIOUS
+                self._retry_keys.add((vehicle_id, key))
             except Exception as err:
                 _LOGGER.warning(
-                    "Error fetching next reminder for vehicle %s: %s", vehicle_id, err
+                    "Error fetching %s for vehicle %s: %s",
+                    key.replace("_", " "),
+                    vehicle_id,
+                    err,
                 )
-                vehicle_data["next_reminder"] = None
+                value = None
+                self._retry_keys.add((vehicle_id, key))
+            return value, time.monotonic() - started
 
-            data["vehicles"].append(vehicle_data)
+    def _update_history(
+        self, vehicle_id: int, record_type: RecordType, history: Sequence[HistoryRow]
+    ) -> None:
+        """Merge the history of a record list into the analytics of the vehicle."""
+        self._histories.setdefault(vehicle_id, {})[record_type.key] = history
+        if record_type.key == "latest_gas":
+            self._fuel_logs.setdefault(vehicle_id, FuelLog()).update(history)
+        if record_type.cost_category:
+            self._cost_ledgers.setdefault(vehicle_id, CostLedger()).update(
+                record_type.cost_category, history
+            )
+        self._odometer_trends.setdefault(vehicle_id, OdometerTrend()).update(
+            record_type.key, history
+        )
 
-        return data
+    def _km_per_day(self, vehicle_id: int) -> float | None:
+        """Return the driving pace of a vehicle as of the last merged readings.
+
+        Record lists are fetched concurrently, so reminders are ranked with
+        the pace known before this refresh's readings arrive.
+        """
+        trend = self._odometer_trends.get(vehicle_id)
+        return trend.km_per_day if trend is not None else None
 
+    def _forecast_reminder(
+        self, vehicle_id: int, reminder: ReminderRecord | None, today: date
+    ) -> dict[str, Any] | None:
+        """Predict when the vehicle's next reminder falls due."""
+        if reminder is None:
+            return None
+        km_per_day = self._km_per_day(vehicle_id)
+        days = reminder.due_in_days(km_per_day)
+        if days is None:
+            return None
+        return {
+            "due_date": (today + timedelta(days=round(days))).isoformat(),
+            "km_per_day": round(km_per_day, 1) if km_per_day else None,
+            "description": reminder.description,
+        }
+
+    def _parse_records(self, vehicle_data: dict[str, Any]) -> None:
+        """Replace the fetched API records of a vehicle by typed records."""
+        client = self.client
+        for record_type in RECORD_TYPES:
+            rec = vehicle_data.get(record_type.key)
+            if not isinstance(rec, dict):
+                continue
+            key = (vehicle_data["id"], record_type.key)
+            cached = self._records.get(key)
+            if cached is None or cached[0] is not rec:
+                record_class = RECORD_CLASSES.get(record_type.key, Record)
+                cached = self._records[key] = (
+                    rec,
+                    record_class.from_api(
+                        rec,
+                        record_type,
+                        client.date_parser.parse,
+                        client.number_parser.parse,
+                    ),
+                )
+            vehicle_data[record_type.key] = cached[1]
@@ -0,0 +1,81 @@
+"""Running cost totals of a vehicle by category and period."""
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Sequence
+from datetime import date
+from typing import Any
+
+from .history import HistoryRow, diff_history
+
+# Periods of the cost sensors
+COST_PERIODS: tuple[str, ...] = ("month", "year", "lifetime")
+# Category summing all the others
+TOTAL: str = "total"
+
+
+def _month(day: int) -> int:
+    """Return the month index (year * 12 + month - 1) of a date ordinal."""
+    value = date.fromordinal(day)
+    return value.year * 12 + value.month - 1
+
+
+class CostLedger:
+    """Cost totals of one vehicle by category and month.
+
+    ``update`` only applies the records added to or removed from a
+    category's list since the previous update (an edit is both), so the
+    totals never need a rescan of the history.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty ledger."""
+        # Rows merged last by category; the client's response cache holds them anyway
+        self._sources: dict[str, Sequence[HistoryRow]] = {}
+        self._lifetime: dict[str, float] = defaultdict(float)
+        self._months: dict[str, dict[int, float]] = defaultdict(lambda: defaultdict(float))
+
+    def update(self, category: str, rows: Sequence[HistoryRow]) -> None:
+        """Merge the rows of the vehicle's current record list of a category."""
+        old = self._sources.get(category, ())
+        if rows is old:
+            return
+        self._sources[category] = rows
+        added, removed = diff_history(old, rows)
+        for row in removed:
+            self._add(category, row, -row.cost)
+        for row in added:
+            self._add(category, row, row.cost)
+
+    def _add(self, category: str, row: HistoryRow, cost: float) -> None:
+        if not cost:
+            return
+        self._lifetime[category] += cost
+        self._months[category][_month(row.day)] += cost
+
+    def totals(self, today: date) -> dict[str, Any]:
+        """Return the totals of every known category and period as of ``today``.
+
+        The year total runs from January 1; records dated in the future
+        only count for the lifetime.
+        """
+        month = today.year * 12 + today.month - 1
+        first_month = today.year * 12
+        result: dict[str, Any] = {}
+        for category in self._sources:
+            months = self._months[category]
+            result[category] = {
+                "month": months.get(month, 0.0),
+                "year": sum(months.get(index, 0.0) for index in range(first_month, month + 1)),
+                "lifetime": self._lifetime[category],
+            }
+        result[TOTAL] = {
+            period: sum(totals[period] for totals in result.values())
+            for period in COST_PERIODS
+        }
+        for totals in result.values():
+            for period, value in totals.items():
+                # Adding 0.0 turns the -0.0 left by removed records into 0.0
+                totals[period] = round(value, 2) + 0.0
+        result["as_of"] = today.isoformat()
+        return result
@@ -0,0 +1,60 @@
+"""Diagnostics support for LubeLogger."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_PASSWORD, CONF_URL, CONF_USERNAME, DOMAIN
+from .coordinator import LubeLoggerDataUpdateCoordinator
+
+TO_REDACT = {CONF_URL, CONF_USERNAME, CONF_PASSWORD, CONF_WEBHOOK_ID}
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Record contents are left out; the traces only hold timings, endpoint
+    paths, record type keys and vehicle ids.
+    """
+    coordinator: LubeLoggerDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    client = coordinator.client
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "last_refresh": {
+            "wall_time_ms": _milliseconds(coordinator.last_refresh_wall_time),
+            "request_time_ms": _milliseconds(coordinator.last_refresh_request_time),
+            "cpu_time_ms": _milliseconds(coordinator.last_refresh_cpu_time),
+            "connect_time_ms": _milliseconds(coordinator.last_refresh_connect_time),
+            "vehicles": coordinator.last_refresh_vehicles,
+            "from_snapshot": coordinator.from_snapshot,
+        },
+        "endpoints": {
+            path: {
+                "requests": metrics.requests,
+                "coalesced": metrics.coalesced,
+                "errors": metrics.errors,
+                "bytes": metrics.bytes,
+                "latency_ms": {
+                    f"p{percent}": _milliseconds(metrics.latency_percentile(percent))
+                    for percent in (50, 90, 99)
+                },
+                "mean_decode_ms": _milliseconds(metrics.mean_decode_time),
+            }
+            for path, metrics in client.metrics.items()
+        },
+        "traces": [trace.as_dict() for trace in coordinator.traces],
+    }
@@ -0,0 +1,83 @@
+"""Compact rows of the record lists whose whole history is analysed."""
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from .record_types import RecordType
+from .tracker import record_id
+
+_ODOMETER_FIELDS = ("odometer", "Odometer")
+_COST_FIELDS = ("cost", "Cost")
+
+
+class HistoryRow(NamedTuple):
+    """Numbers of one record, without the rest of the record."""
+
+    record_id: int | None
+    # Ordinal of the record date, see date.toordinal
+    day: int
+    odometer: float
+    cost: float
+    # Fuel for gas records, see RecordType.quantity_fields
+    quantity: float
+
+
+def _number(
+    rec: dict[str, Any],
+    fields: tuple[str, ...],
+    parse_number: Callable[[Any], Any],
+) -> float:
+    """Return the first numeric field of a record, or 0."""
+    for field in fields:
+        value = rec.get(field)
+        # Plain digits (odometer readings) need no separator handling
+        if isinstance(value, str) and value.isdigit():
+            return float(value)
+        value = parse_number(value)
+        if isinstance(value, (int, float)):
+            return float(value)
+    return 0.0
+
+
+def history_row(
+    rec: dict[str, Any],
+    record_type: RecordType,
+    parse_date: Callable[[Any], datetime | None],
+    parse_number: Callable[[Any], Any],
+) -> HistoryRow | None:
+    """Return the row of a record, or None if it has no date."""
+    for field in record_type.date_fields:
+        if dt := parse_date(rec.get(field)):
+            break
+    else:
+        return None
+    return HistoryRow(
+        record_id(rec),
+        dt.date().toordinal(),
+        _number(rec, _ODOMETER_FIELDS, parse_number),
+        _number(rec, _COST_FIELDS, parse_number),
+        _number(rec, record_type.quantity_fields, parse_number),
+    )
+
+
+def diff_history(
+    old: Sequence[HistoryRow], new: Sequence[HistoryRow]
+) -> tuple[list[HistoryRow], list[HistoryRow]]:
+    """Return the rows added to and removed from a history.
+
+    The server lists records in a fixed order, so new records usually make
+    the list grow at one end, which a sequence comparison finds without
+    hashing every row. Other changes compare the two lists as multisets.
+    """
+    added = len(new) - len(old)
+    if added >= 0:
+        if tuple(new[: len(old)]) == tuple(old):
+            return list(new[len(old) :]), []
+        if tuple(new[added:]) == tuple(old):
+            return list(new[:added]), []
+    old_rows = Counter(old)
+    new_rows = Counter(new)
+    return list((new_rows - old_rows).elements()), list((old_rows - new_rows).elements())
@@ -0,0 +1,149 @@
+"""State shared by the config entries of one LubeLogger server."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from yarl import URL
+
+from homeassistant.core import HomeAssistant, callback
+
+from .breaker import CircuitBreaker
+from .const import (
+    DATA_HUBS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DNS_CACHE_TTL,
+    DOMAIN,
+    KEEPALIVE_TIMEOUT,
+)
+
+if TYPE_CHECKING:
+    from .client import CachedResponse, LubeLoggerClient
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def hub_key(url: str) -> str:
+    """Return the key of a server URL, the same for every spelling of it."""
+    return str(URL(url.strip().rstrip("/")))
+
+
+class LubeLoggerHub:
+    """Connection pool, caches and request limit of one server.
+
+    Every client of the server uses the hub, each with its own credentials.
+    Cache keys hold a scope: the client's credentials, or None for
+    responses that are the same for every account of the server.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        session: aiohttp.ClientSession | None = None,
+        limit_per_host: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        on_close: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize the hub.
+
+        Without an external ``session`` the hub lazily creates its own
+        pooled session, closed when its last client is closed. ``on_close``
+        is called at that point too.
+        """
+        self.url = url.rstrip("/")
+        self._session = session
+        self._owns_session = session is None
+        self._limit_per_host = limit_per_host
+        self._clients: set[LubeLoggerClient] = set()
+        self._on_close = on_close
+
+        # Limit on concurrent requests to the server, across its entries
+        self.semaphore = asyncio.Semaphore(limit_per_host)
+        # Decoded GET payloads by (scope, endpoint)
+        self.response_cache: dict[tuple[Any, str], CachedResponse] = {}
+        # GETs in progress, and recent results with their expiry, by key
+        self.in_flight: dict[Any, asyncio.Task[Any]] = {}
+        self.recent: dict[Any, tuple[float, Any]] = {}
+        # Circuit breakers by endpoint path
+        self.breakers: dict[str, CircuitBreaker] = {}
+
+        # Connection pool statistics
+        self.connections_created = 0
+        self.connect_time = 0.0
+
+    def attach(self, client: LubeLoggerClient) -> None:
+        """Register a client using the hub."""
+        self._clients.add(client)
+
+    async def async_detach(self, client: LubeLoggerClient) -> None:
+        """Unregister a client, closing the hub after the last one."""
+        self._clients.discard(client)
+        if self._clients:
+            return
+        if self._owns_session and self._session and not self._session.closed:
+            await self._session.close()
+        if self._owns_session:
+            self._session = None
+        self.recent.clear()
+        if self._on_close is not None:
+            self._on_close()
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """Return the session, creating the pooled one on first use."""
+        if self._session is None or self._session.closed:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_connection_create_start.append(self._on_connection_create_start)
+            trace_config.on_connection_create_end.append(self._on_connection_create_end)
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self._limit_per_host,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                trace_configs=[trace_config],
+            )
+            self._owns_session = True
+        return self._session
+
+    async def _on_connection_create_start(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        ctx.connect_started = time.monotonic()
+
+    async def _on_connection_create_end(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        self.connections_created += 1
+        self.connect_time += time.monotonic() - ctx.connect_started
+
+
+@callback
+def async_get_hub(
+    hass: HomeAssistant,
+    url: str,
+    limit_per_host: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+) -> LubeLoggerHub:
+    """Return the hub of a server, creating it for its first entry.
+
+    The hub keeps the limits of the entry that created it until its last
+    client is closed.
+    """
+    hubs: dict[str, LubeLoggerHub] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        DATA_HUBS, {}
+    )
+    key = hub_key(url)
+    if (hub := hubs.get(key)) is not None:
+        return hub
+
+    def _forget() -> None:
+        if hubs.get(key) is hub:
+            del hubs[key]
+            _LOGGER.debug("Closed the shared connection to %s", key)
+
+    hub = hubs[key] = LubeLoggerHub(url, limit_per_host=limit_per_host, on_close=_forget)
+    return hub
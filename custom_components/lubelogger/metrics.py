@@ -0,0 +1,39 @@
+"""Request metrics of the LubeLogger API client."""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+
+from .const import METRICS_WINDOW
+
+
+def _window() -> deque[float]:
+    return deque(maxlen=METRICS_WINDOW)
+
+
+@dataclass
+class EndpointMetrics:
+    """Counters and recent timings (seconds) of one API endpoint."""
+
+    requests: int = 0
+    # Calls served by a request already running or just completed
+    coalesced: int = 0
+    errors: int = 0
+    bytes: int = 0
+    latencies: deque[float] = field(default_factory=_window)
+    decode_times: deque[float] = field(default_factory=_window)
+
+    def latency_percentile(self, percent: float) -> float | None:
+        """Return a percentile of the recent latencies (nearest rank)."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = round(percent / 100 * (len(ordered) - 1))
+        return ordered[index]
+
+    @property
+    def mean_decode_time(self) -> float | None:
+        """Return the mean time spent decoding recent response bodies."""
+        if not self.decode_times:
+            return None
+        return sum(self.decode_times) / len(self.decode_times)
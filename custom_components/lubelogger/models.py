@@ -0,0 +1,213 @@
+"""Typed vehicles and records kept in the coordinator data."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any
+
+from .record_types import RECORD_TYPES_BY_KEY, RecordType
+from .tracker import record_id
+
+# Values kept from a record; lists and objects (files, tags, extra fields)
+# are not shown by any sensor
+_SCALARS = (str, int, float, bool)
+
+
+def due_in_days(
+    metric: str, due_days: float, due_distance: float, km_per_day: float | None
+) -> float | None:
+    """Return the days until a reminder falls due; past due reminders have none."""
+    candidates = []
+    if ("Date" in metric or "Odometer" not in metric) and 0 <= due_days < 999999:
+        candidates.append(due_days)
+    if (
+        ("Odometer" in metric or "Date" not in metric)
+        and km_per_day
+        and 0 <= due_distance < 999999
+    ):
+        candidates.append(due_distance / km_per_day)
+    return min(candidates, default=None)
+
+
+def _fields(
+    rec: dict[str, Any], parse_number: Callable[[Any], Any]
+) -> dict[str, Any]:
+    """Return the scalar fields of a record with the numbers converted.
+
+    Of mixed-case duplicates (``id`` and ``Id``) only the first is kept.
+    """
+    fields: dict[str, Any] = {}
+    seen: set[str] = set()
+    for key, value in rec.items():
+        if value is not None and not isinstance(value, _SCALARS):
+            continue
+        folded = key.lower()
+        if folded in seen:
+            continue
+        seen.add(folded)
+        # Convert any value that looks like a number
+        if isinstance(value, str) and any(char.isdigit() for char in value):
+            value = parse_number(value)
+        fields[key] = value
+    return fields
+
+
+def _number(value: Any) -> float | None:
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+@dataclass(slots=True)
+class Record:
+    """The selected record of a record type, parsed once when it is received."""
+
+    record_id: int | None
+    # Date of the first date field that holds one, and that field
+    date_field: str | None
+    date: datetime | None
+    # Sensor value of record types with value fields
+    value: Any
+    # Scalar fields with the numbers converted, shown as state attributes
+    fields: dict[str, Any]
+
+    @classmethod
+    def from_api(
+        cls,
+        rec: dict[str, Any],
+        record_type: RecordType,
+        parse_date: Callable[[Any], datetime | None],
+        parse_number: Callable[[Any], Any],
+    ) -> Record:
+        """Build the record from an API record."""
+        date_field = date = None
+        for field in record_type.date_fields:
+            if date := parse_date(rec.get(field)):
+                date_field = field
+                break
+        value = None
+        for field in record_type.value_fields:
+            if raw := rec.get(field):
+                value = parse_number(raw)
+                break
+        fields = _fields(rec, parse_number)
+        return cls(
+            record_id=record_id(rec),
+            date_field=date_field,
+            date=date,
+            value=value,
+            fields=fields,
+            **cls._extra(fields),
+        )
+
+    @staticmethod
+    def _extra(fields: dict[str, Any]) -> dict[str, Any]:
+        """Return the values of the fields of a subclass."""
+        return {}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as JSON for the snapshot."""
+        data = asdict(self)
+        data["date"] = self.date.isoformat() if self.date else None
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Record:
+        """Return a record stored by ``as_dict``."""
+        date = data.get("date")
+        return cls(**{**data, "date": datetime.fromisoformat(date) if date else None})
+
+
+@dataclass(slots=True)
+class ReminderRecord(Record):
+    """A reminder with its due distance and days as numbers."""
+
+    description: str | None = None
+    metric: str = ""
+    urgency: str = ""
+    due_days: float | None = None
+    due_distance: float | None = None
+
+    @staticmethod
+    def _extra(fields: dict[str, Any]) -> dict[str, Any]:
+        """Return the reminder fields."""
+        return {
+            "description": fields.get("description"),
+            "metric": fields.get("metric") or "",
+            "urgency": fields.get("urgency") or "",
+            "due_days": _number(fields.get("dueDays")),
+            "due_distance": _number(fields.get("dueDistance")),
+        }
+
+    def due_in_days(self, km_per_day: float | None) -> float | None:
+        """Return the days until the reminder falls due.
+
+        That is its due date or, for distance reminders, the day the vehicle
+        reaches the due distance driving ``km_per_day``, whichever comes
+        first. None for past due reminders, and for distance reminders while
+        the pace is unknown.
+        """
+        return due_in_days(
+            self.metric,
+            999999 if self.due_days is None else self.due_days,
+            999999 if self.due_distance is None else self.due_distance,
+            km_per_day,
+        )
+
+
+# Record classes of record types with extra fields
+RECORD_CLASSES: dict[str, type[Record]] = {
+    "next_reminder": ReminderRecord,
+}
+
+
+@dataclass(slots=True)
+class VehicleInfo:
+    """The fields of a vehicle used for its device."""
+
+    id: Any
+    # Device name, "<year> <make> <model>" when the vehicle has them
+    name: str
+    make: str
+    model: str
+    year: str
+
+    @classmethod
+    def from_api(cls, vehicle: dict[str, Any]) -> VehicleInfo | None:
+        """Build the vehicle from an API vehicle; None if it has no id."""
+        vehicle_id = vehicle.get("Id") or vehicle.get("id")
+        if not vehicle_id:
+            return None
+        make = vehicle.get("Make") or vehicle.get("make") or ""
+        model = vehicle.get("Model") or vehicle.get("model") or ""
+        year_val = vehicle.get("Year") or vehicle.get("year")
+        year = str(year_val) if year_val else ""
+
+        name_parts = [part for part in [year, make, model] if part]
+        name = (
+            " ".join(name_parts)
+            if name_parts
+            else vehicle.get("Name") or vehicle.get("name") or f"Vehicle {vehicle_id}"
+        )
+        return cls(id=vehicle_id, name=name, make=make, model=model, year=year)
+
+
+def vehicle_as_dict(vehicle: dict[str, Any]) -> dict[str, Any]:
+    """Return the coordinator data of a vehicle as JSON for the snapshot."""
+    return {
+        key: asdict(value)
+        if isinstance(value, VehicleInfo)
+        else value.as_dict()
+        if isinstance(value, Record)
+        else value
+        for key, value in vehicle.items()
+    }
+
+
+def vehicle_from_dict(data: dict[str, Any]) -> dict[str, Any]:
+    """Return the coordinator data of a vehicle stored by ``vehicle_as_dict``."""
+    vehicle = dict(data)
+    vehicle["vehicle_info"] = VehicleInfo(**data["vehicle_info"])
+    for key in RECORD_TYPES_BY_KEY:
+        if value := data.get(key):
+            vehicle[key] = RECORD_CLASSES.get(key, Record).from_dict(value)
+    return vehicle
@@ -0,0 +1,272 @@
+"""Parsing of the date and number values returned by the LubeLogger API."""
+from __future__ import annotations
+
+import logging
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+DATE_CACHE_SIZE = 4096
+
+# Unambiguous samples needed before a decimal separator is trusted
+NUMBER_PROFILE_MIN_SAMPLES = 5
+
+_CURRENCY_SYMBOLS = str.maketrans("", "", "€$£")
+# "1234", "-1.234,56", "1,234.56", ...
+_NUMBER = re.compile(r"[-+]?\d[\d.,]*")
+
+# "28/02/2027", "12/17/2025 08:30:00"
+_SLASH_DATE = re.compile(
+    r"(\d{1,2})/(\d{1,2})/(\d{4})(?: (\d{1,2}):(\d{1,2}):(\d{1,2}))?"
+)
+
+# Formats tried, in order, for values that match none of the patterns above
+_FALLBACK_FORMATS = (
+    "%d/%m/%Y",           # European format: "28/02/2027"
+    "%d/%m/%Y %H:%M:%S",  # European with time
+    "%m/%d/%Y",           # US format: "12/17/2025"
+    "%m/%d/%Y %H:%M:%S",  # US with time
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+
+
+class DateParser:
+    """Parse LubeLogger dates and remember the day/month order of a server.
+
+    ISO values go straight to ``datetime.fromisoformat`` and slash dates
+    are built from a precompiled pattern. The day/month order is learned
+    from the first value where it is unambiguous (a part above 12);
+    until then ambiguous values are read as European dates.
+    Results are kept in a bounded LRU cache.
+    """
+
+    def __init__(self, cache_size: int = DATE_CACHE_SIZE) -> None:
+        """Initialize the parser."""
+        self.day_first: bool | None = None
+        self._parse_cached = lru_cache(maxsize=cache_size)(self._parse)
+
+    def parse(self, date_str: str | None) -> datetime | None:
+        """Parse a date string and return a timezone-aware datetime."""
+        if not date_str or not isinstance(date_str, str):
+            return None
+        return self._parse_cached(date_str)
+
+    def _parse(self, date_str: str) -> datetime | None:
+        # "2025-12-17", "2025-12-17T08:30:00", "2025-12-17 08:30:00.123Z", ...
+        if date_str[4:5] == "-":
+            if date_str.endswith("Z"):
+                date_str = date_str[:-1] + "+00:00"
+            try:
+                dt = datetime.fromisoformat(date_str)
+            except ValueError:
+                pass
+            else:
+                # Ensure timezone-aware - use UTC if no timezone info
+                if dt.tzinfo is None:
+                    dt = dt.replace(tzinfo=dt_util.UTC)
+                return dt
+
+        if match := _SLASH_DATE.fullmatch(date_str):
+            first, second, year = int(match[1]), int(match[2]), int(match[3])
+            time_parts = [int(part) for part in match.groups()[3:] if part is not None]
+
+            if self.day_first is None and (first > 12) != (second > 12):
+                self._learn_day_first(first > 12)
+
+            orders = (True, False) if self.day_first is not False else (False, True)
+            for day_first in orders:
+                day, month = (first, second) if day_first else (second, first)
+                try:
+                    # Make timezone-aware (assume local timezone)
+                    return dt_util.as_local(datetime(year, month, day, *time_parts))
+                except ValueError:
+                    continue
+            return None
+
+        return _parse_with_formats(date_str)
+
+    def _learn_day_first(self, day_first: bool) -> None:
+        """Store the day/month order used by the server."""
+        _LOGGER.debug("Detected %s date format", "European" if day_first else "US")
+        self.day_first = day_first
+        if not day_first:
+            # Ambiguous values cached so far were read as European dates
+            self._parse_cached.cache_clear()
+
+
+def _parse_with_formats(date_str: str) -> datetime | None:
+    """Try the known formats one by one."""
+    for fmt in _FALLBACK_FORMATS:
+        try:
+            dt = datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+        # Make timezone-aware (assume local timezone)
+        return dt_util.as_local(dt)
+    return None
+
+
+class NumberParser:
+    """Convert number strings using the decimal separator of a server.
+
+    The separator is inferred once from unambiguous samples (both
+    separators present, or one separator not followed by exactly three
+    digits) and can be stored and restored. Until it is known, values are
+    converted with the per-value heuristic of ``convert_number_string``.
+    """
+
+    def __init__(self, decimal_separator: str | None = None) -> None:
+        """Initialize the parser."""
+        self.decimal_separator = decimal_separator
+        self._votes = {",": 0, ".": 0}
+
+    @property
+    def decimal_separator(self) -> str | None:
+        """Return the decimal separator, or None if it is not known yet."""
+        return self._decimal_separator
+
+    @decimal_separator.setter
+    def decimal_separator(self, separator: str | None) -> None:
+        self._decimal_separator = separator
+        if separator is not None:
+            self._thousands_separator = "." if separator == "," else ","
+
+    def observe(self, value: Any) -> bool:
+        """Use a sample value to infer the decimal separator.
+
+        Return True when the separator has just been learned.
+        """
+        if self._decimal_separator is not None or not isinstance(value, str):
+            return False
+        value = value.translate(_CURRENCY_SYMBOLS).strip()
+        if not _NUMBER.fullmatch(value):
+            return False
+
+        last_comma = value.rfind(",")
+        last_dot = value.rfind(".")
+        if last_comma >= 0 and last_dot >= 0:
+            vote = "," if last_comma > last_dot else "."
+        elif last_comma >= 0 or last_dot >= 0:
+            separator = "," if last_comma >= 0 else "."
+            parts = value.split(separator)
+            if len(parts) != 2 or len(parts[1]) == 3:
+                # "1,234" or "1.234.567" could be thousands separators
+                return False
+            vote = separator
+        else:
+            return False
+
+        self._votes[vote] += 1
+        other = self._votes["." if vote == "," else ","]
+        if self._votes[vote] >= NUMBER_PROFILE_MIN_SAMPLES and self._votes[vote] >= 4 * other:
+            _LOGGER.debug("Detected %r as decimal separator", vote)
+            self.decimal_separator = vote
+            return True
+        return False
+
+    def parse(self, number_str: Any) -> float | int | str | None:
+        """Convert a number string to a number."""
+        if self._decimal_separator is None or not isinstance(number_str, str):
+            return convert_number_string(number_str)
+        if number_str == "":
+            return None
+
+        value = number_str.replace(self._thousands_separator, "")
+        if self._decimal_separator == ",":
+            value = value.replace(",", ".")
+        try:
+            result = float(value)
+        except ValueError:
+            # Retry without currency symbols, which are rare
+            try:
+                result = float(value.translate(_CURRENCY_SYMBOLS))
+            except ValueError:
+                return number_str.strip()
+        return int(result) if result.is_integer() else result
+
+
+def convert_number_string(number_str: Any) -> float | int | str | None:
+    """Convert a number string to a number, handling both European and International formats.
+    
+    European format: 1.234,56 -> 1234.56
+    International format: 1,234.56 -> 1234.56
+    """
+    if number_str is None or number_str == "":
+        return None
+    
+    if isinstance(number_str, (int, float)):
+        return number_str
+    
+    if isinstance(number_str, str):
+        original = number_str
+        # Remove common currency symbols and trim
+        number_str = number_str.replace('€', '').replace('$', '').replace('£', '').strip()
+        
+        # Helper to check if a part is likely a thousands group (exactly 3 digits)
+        def is_thousands_part(part: str) -> bool:
+            return part.isdigit() and len(part) == 3
+        
+        # Count separators
+        comma_count = number_str.count(',')
+        dot_count = number_str.count('.')
+        
+        # Case 1: Only one type of separator
+        if comma_count == 1 and dot_count == 0:
+            # e.g., "1234,56" or "1,234"
+            parts = number_str.split(',')
+            if len(parts) == 2 and not is_thousands_part(parts[1]):
+                # Single comma with non-3-digit right part -> decimal comma
+                number_str = number_str.replace(',', '.')
+            else:
+                # Could be a thousands comma (e.g., "1,234") -> remove it
+                number_str = number_str.replace(',', '')
+        
+        elif dot_count == 1 and comma_count == 0:
+            # e.g., "1234.56" or "1.234"
+            parts = number_str.split('.')
+            if len(parts) == 2 and not is_thousands_part(parts[1]):
+                # Single dot with non-3-digit right part -> decimal dot, keep as is
+                pass
+            else:
+                # Likely a thousands dot (e.g., "1.234") -> remove it
+                number_str = number_str.replace('.', '')
+        
+        # Case 2: Both separators present (e.g., "1.234,56" or "1,234.56")
+        elif comma_count > 0 and dot_count > 0:
+            last_comma = number_str.rfind(',')
+            last_dot = number_str.rfind('.')
+            
+            # Assume the LAST separator is the decimal point
+            if last_comma > last_dot:
+                # European: last separator is comma -> dot is thousands
+                number_str = number_str.replace('.', '').replace(',', '.')
+            else:
+                # International: last separator is dot -> comma is thousands
+                number_str = number_str.replace(',', '')
+                # Dot remains as decimal
+        
+        # Case 3: Multiple separators of the same type (thousands)
+        elif comma_count > 1:
+            # e.g., "1,234,567"
+            number_str = number_str.replace(',', '')
+        elif dot_count > 1:
+            # e.g., "1.234.567"
+            number_str = number_str.replace('.', '')
+        
+        # Final conversion
+        try:
+            result = float(number_str)
+            return int(result) if result.is_integer() else result
+        except (ValueError, TypeError):
+            # If conversion fails, return the cleaned original string
+            return original.strip()
+    
+    return number_str
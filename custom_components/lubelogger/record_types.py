@@ -0,0 +1,167 @@
+"""Registry of the LubeLogger record types handled by the integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import StrEnum
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+
+from .const import (
+    API_ADJUSTED_ODOMETER,
+    API_GAS_RECORD,
+    API_ODOMETER,
+    API_PLAN,
+    API_REMINDER,
+    API_REPAIR_RECORD,
+    API_SERVICE_RECORD,
+    API_SUPPLY_RECORD,
+    API_TAX,
+    API_UPGRADE_RECORD,
+    CONF_RECORDS_INTERVAL,
+    CONF_TAX_PLAN_INTERVAL,
+    CONF_UPDATE_INTERVAL,
+)
+
+
+class Selection(StrEnum):
+    """How the record shown for a vehicle is picked from a record list."""
+
+    # Most recent date, falling back to the record id
+    LATEST = "latest"
+    # Highest record id
+    LATEST_ID = "latest_id"
+    # Earliest date; records without a date are never picked
+    NEXT = "next"
+    # Most urgent reminder, see calculate_reminder_priority
+    PRIORITY = "priority"
+
+
+@dataclass(frozen=True)
+class RecordType:
+    """A LubeLogger record type and the sensor built from it."""
+
+    # Key in the coordinator data, translation key and unique id suffix
+    key: str
+    endpoint: str
+    selection: Selection
+    # Fields holding the record date, in order of preference
+    date_fields: tuple[str, ...]
+    # Polling tier option, see coordinator.POLLING_TIERS
+    tier: str = CONF_RECORDS_INTERVAL
+    # Endpoint returning a single record, tried before ``endpoint``
+    preferred_endpoint: str | None = None
+    # Decode large record lists while they are received (long histories)
+    stream: bool = False
+    # Keep the whole list as history rows for the analytics, see history.py
+    history: bool = False
+    # Fields holding the quantity of a history row (fuel for gas records)
+    quantity_fields: tuple[str, ...] = ()
+    # Cost sensor category, summing the costs of the whole history
+    cost_category: str | None = None
+    # Fields holding a numeric sensor value; without them the sensor
+    # shows the record date as a timestamp
+    value_fields: tuple[str, ...] = ()
+    device_class: SensorDeviceClass | None = SensorDeviceClass.TIMESTAMP
+    state_class: SensorStateClass | None = None
+    unit: str | None = None
+    # Attribute with the formatted record date; None uses "<field>_formatted"
+    formatted_date_attribute: str | None = "date_formatted"
+
+
+RECORD_TYPES: tuple[RecordType, ...] = (
+    RecordType(
+        "latest_odometer",
+        API_ODOMETER,
+        Selection.LATEST_ID,
+        ("date",),
+        tier=CONF_UPDATE_INTERVAL,
+        preferred_endpoint=API_ADJUSTED_ODOMETER,
+        stream=True,
+        # Readings for the driving pace, when the list is fetched
+        history=True,
+        value_fields=("odometer", "Odometer"),
+        device_class=SensorDeviceClass.DISTANCE,
+        state_class=SensorStateClass.MEASUREMENT,
+        unit="km",
+    ),
+    RecordType(
+        "next_plan",
+        API_PLAN,
+        Selection.NEXT,
+        ("dateCreated", "dateModified", "Date", "date"),
+        tier=CONF_TAX_PLAN_INTERVAL,
+        formatted_date_attribute=None,
+    ),
+    RecordType(
+        "latest_tax",
+        API_TAX,
+        Selection.LATEST,
+        ("date", "Date", "taxDate"),
+        tier=CONF_TAX_PLAN_INTERVAL,
+        history=True,
+        cost_category="tax",
+        value_fields=("cost", "Cost"),
+        device_class=SensorDeviceClass.MONETARY,
+        unit="EUR",
+    ),
+    RecordType(
+        "latest_service",
+        API_SERVICE_RECORD,
+        Selection.LATEST,
+        ("date", "Date", "serviceDate", "ServiceDate"),
+        history=True,
+        cost_category="service",
+    ),
+    RecordType(
+        "latest_repair",
+        API_REPAIR_RECORD,
+        Selection.LATEST,
+        ("date", "Date", "repairDate", "RepairDate"),
+        history=True,
+        cost_category="repair",
+    ),
+    RecordType(
+        "latest_upgrade",
+        API_UPGRADE_RECORD,
+        Selection.LATEST,
+        ("date", "Date", "upgradeDate", "UpgradeDate"),
+        history=True,
+        cost_category="upgrade",
+    ),
+    RecordType(
+        "latest_supply",
+        API_SUPPLY_RECORD,
+        Selection.LATEST,
+        ("date", "Date", "supplyDate", "SupplyDate"),
+        history=True,
+        cost_category="supply",
+    ),
+    RecordType(
+        "latest_gas",
+        API_GAS_RECORD,
+        Selection.LATEST,
+        ("date", "Date", "fuelDate", "FuelDate"),
+        tier=CONF_UPDATE_INTERVAL,
+        stream=True,
+        history=True,
+        quantity_fields=("fuelConsumed", "FuelConsumed"),
+        cost_category="fuel",
+    ),
+    RecordType(
+        "next_reminder",
+        API_REMINDER,
+        Selection.PRIORITY,
+        ("dueDate", "DueDate", "Date", "date"),
+        tier=CONF_UPDATE_INTERVAL,
+        formatted_date_attribute="due_date_formatted",
+    ),
+)
+
+RECORD_TYPES_BY_KEY: dict[str, RecordType] = {
+    record_type.key: record_type for record_type in RECORD_TYPES
+}
+
+# Cost sensor categories, in record type order
+COST_CATEGORIES: tuple[str, ...] = tuple(
+    record_type.cost_category for record_type in RECORD_TYPES if record_type.cost_category
+)
@@ -1,144 +1,34 @@
 """Sensor platform for LubeLogger integration."""
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import wraps
+from typing import Any, TypeVar
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import API_VEHICLES, CONF_URL, DOMAIN, FUEL_WINDOWS
 from .coordinator import LubeLoggerDataUpdateCoordinator
+from .costs import COST_PERIODS, TOTAL
+from .metrics import EndpointMetrics
+from .models import Record, ReminderRecord, VehicleInfo
+from .record_types import COST_CATEGORIES, RECORD_TYPES, RecordType
 
-
-def parse_date(date_str: str | None) -> datetime | None:
-    """Parse a date string from LubeLogger API and return timezone-aware datetime."""
-    if not date_str:
-        return None
-
-    # Try ISO format first
-    try:
-        if date_str.endswith("Z"):
-            date_str = date_str.replace("Z", "+00:00")
-        dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        # Ensure timezone-aware
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=dt_util.UTC)
-        return dt
-    except (ValueError, AttributeError):
-        pass
-
-    # US and EU date and time format
-    formats = [
-        "%d/%m/%Y",           # EU format: "28/02/2027"
-        "%d/%m/%Y %H:%M:%S",  # EU format with time
-        "%m/%d/%Y",           # US format (fallback)
-        "%m/%d/%Y %H:%M:%S",  # US format with time (fallback)
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-dT%H:%M:%S.%f",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d",
-    ]
-
-    for fmt in formats:
-        try:
-            dt = datetime.strptime(date_str, fmt)
-            # Make timezone-aware (assume local timezone)
-            if dt.tzinfo is None:
-                dt = dt_util.as_local(dt)
-            return dt
-        except (ValueError, AttributeError):
-            continue
-
-    return None
-
-
-def convert_number_string(number_str: Any) -> float | int | str | None:
-    """Convert a number string to a number, handling both European and International formats.
-    
-    European format: 1.234,56 -> 1234.56
-    International format: 1,234.56 -> 1234.56
-    """
-    if number_str is None or number_str == "":
-        return None
-    
-    if isinstance(number_str, (int, float)):
-        return number_str
-    
-    if isinstance(number_str, str):
-        original = number_str
-        # Remove common currency symbols and trim
-        number_str = number_str.replace('€', '').replace('$', '').replace('£', '').strip()
-        
-        # Helper to check if a part is likely a thousands group (exactly 3 digits)
-        def is_thousands_part(part: str) -> bool:
-            return part.isdigit() and len(part) == 3
-        
-        # Count separators
-        comma_count = number_str.count(',')
-        dot_count = number_str.count('.')
-        
-        # Case 1: Only one type of separator
-        if comma_count == 1 and dot_count == 0:
-            # e.g., "1234,56" or "1,234"
-            parts = number_str.split(',')
-            if len(parts) == 2 and not is_thousands_part(parts[1]):
-                # Single comma with non-3-digit right part -> decimal comma
-                number_str = number_str.replace(',', '.')
-            else:
-                # Could be a thousands comma (e.g., "1,234") -> remove it
-                number_str = number_str.replace(',', '')
-        
-        elif dot_count == 1 and comma_count == 0:
-            # e.g., "1234.56" or "1.234"
-            parts = number_str.split('.')
-            if len(parts) == 2 and not is_thousands_part(parts[1]):
-                # Single dot with non-3-digit right part -> decimal dot, keep as is
-                pass
-            else:
-                # Likely a thousands dot (e.g., "1.234") -> remove it
-                number_str = number_str.replace('.', '')
-        
-        # Case 2: Both separators present (e.g., "1.234,56" or "1,234.56")
-        elif comma_count > 0 and dot_count > 0:
-            last_comma = number_str.rfind(',')
-            last_dot = number_str.rfind('.')
-            
-            # Assume the LAST separator is the decimal point
-            if last_comma > last_dot:
-                # European: last separator is comma -> dot is thousands
-                number_str = number_str.replace('.', '').replace(',', '.')
-            else:
-                # International: last separator is dot -> comma is thousands
-                number_str = number_str.replace(',', '')
-                # Dot remains as decimal
-        
-        # Case 3: Multiple separators of the same type (thousands)
-        elif comma_count > 1:
-            # e.g., "1,234,567"
-            number_str = number_str.replace(',', '')
-        elif dot_count > 1:
-            # e.g., "1.234.567"
-            number_str = number_str.replace('.', '')
-        
-        # Final conversion
-        try:
-            result = float(number_str)
-            return int(result) if result.is_integer() else result
-        except (ValueError, TypeError):
-            # If conversion fails, return the cleaned original string
-            return original.strip()
-    
-    return number_str
+_T = TypeVar("_T")
 
 
 def convert_fuel_consumption(value: Any) -> float | str:
@@ -171,6 +61,29 @@ def convert_fuel_consumption(value: Any) -> float | str:
     return round(num_value, 2)
 
 
+def cached_per_record(
+    func: Callable[[BaseLubeLoggerSensor], _T]
+) -> Callable[[BaseLubeLoggerSensor], _T]:
+    """Cache a sensor property until the coordinator delivers a different record.
+
+    Unchanged records are usually delivered as the same object, so the
+    identity check is tried before comparing the record contents.
+    """
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(self: BaseLubeLoggerSensor) -> _T:
+        rec = self._record
+        cached = self._record_cache.get(name)
+        if cached is not None and (cached[0] is rec or cached[0] == rec):
+            return cached[1]
+        value = func(self)
+        self._record_cache[name] = (rec, value)
+        return value
+
+    return wrapper
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -187,46 +100,49 @@ async def async_setup_entry(
     for vehicle in vehicles:
         vehicle_id = vehicle.get("id")
         vehicle_name = vehicle.get("name", f"Vehicle {vehicle_id}")
-        vehicle_info = vehicle.get("vehicle_info", {})
+        vehicle_info = vehicle["vehicle_info"]
+
+        for record_type in RECORD_TYPES:
+            # Only create sensors if data exists (visible/tabs requirement)
+            if vehicle.get(record_type.key):
+                sensor_class = SENSOR_CLASSES.get(record_type.key, LubeLoggerRecordSensor)
+                sensors.append(
+                    sensor_class(coordinator, vehicle_id, vehicle_name, vehicle_info, record_type)
+                )
+
+        fuel_stats = vehicle.get("fuel_stats")
+        if fuel_stats and fuel_stats.get("fill_ups"):
+            for stat, unit in FUEL_STATS:
+                for days in FUEL_WINDOWS:
+                    sensors.append(
+                        LubeLoggerFuelSensor(
+                            coordinator, vehicle_id, vehicle_name, vehicle_info, stat, unit, days
+                        )
+                    )
 
-        # Only create sensors if data exists (visible/tabs requirement)
-        if vehicle.get("latest_odometer"):
-            sensors.append(
-                LubeLoggerLatestOdometerSensor(coordinator, vehicle_id, vehicle_name, vehicle_info)
-            )
-        if vehicle.get("next_plan"):
-            sensors.append(
-                LubeLoggerNextPlanSensor(coordinator, vehicle_id, vehicle_name, vehicle_info)
-            )
-        if vehicle.get("latest_tax"):
-            sensors.append(
-                LubeLoggerLatestTaxSensor(coordinator, vehicle_id, vehicle_name, vehicle_info)
-            )
-        if vehicle.get("latest_service"):
-            sensors.append(
-                LubeLoggerLatestServiceSensor(coordinator, vehicle_id, vehicle_name, vehicle_info)
-            )
-        if vehicle.get("latest_repair"):
-            sensors.append(
-                LubeLoggerLatestRepairSensor(coordinator, vehicle_id, vehicle_name, vehicle_info)
-            )
-        if vehicle.get("latest_upgrade"):
-            sensors.append(
-                LubeLoggerLatestUpgradeSensor(coordinator, vehicle_id, vehicle_name, vehicle_info)
-            )
-        if vehicle.get("latest_supply"):
-            sensors.append(
-                LubeLoggerLatestSupplySensor(coordinator, vehicle_id, vehicle_name, vehicle_info)
-            )
-        if vehicle.get("latest_gas"):
-            sensors.append(
-                LubeLoggerLatestGasSensor(coordinator, vehicle_id, vehicle_name, vehicle_info)
-            )
         if vehicle.get("next_reminder"):
             sensors.append(
-                LubeLoggerNextReminderSensor(coordinator, vehicle_id, vehicle_name, vehicle_info)
+                LubeLoggerReminderForecastSensor(
+                    coordinator, vehicle_id, vehicle_name, vehicle_info
+                )
             )
 
+        costs = vehicle.get("costs") or {}
+        for category in (*COST_CATEGORIES, TOTAL):
+            if category in costs:
+                for period in COST_PERIODS:
+                    sensors.append(
+                        LubeLoggerCostSensor(
+                            coordinator, vehicle_id, vehicle_name, vehicle_info, category, period
+                        )
+                    )
+
+    for description in SERVER_SENSORS:
+        sensors.append(LubeLoggerServerSensor(coordinator, entry, description))
+    for endpoint in METRIC_ENDPOINTS:
+        for description in ENDPOINT_SENSORS:
+            sensors.append(LubeLoggerEndpointSensor(coordinator, entry, description, endpoint))
+
     async_add_entities(sensors)
 
 
@@ -241,7 +157,7 @@ class BaseLubeLoggerSensor(CoordinatorEntity, SensorEntity):
         coordinator: LubeLoggerDataUpdateCoordinator,
         vehicle_id: int,
         vehicle_name: str,
-        vehicle_info: dict,
+        vehicle_info: VehicleInfo,
         key: str,
         translation_key: str,
         unique_id_suffix: str,
@@ -249,7 +165,8 @@ class BaseLubeLoggerSensor(CoordinatorEntity, SensorEntity):
         state_class: SensorStateClass | None = None,
         unit: str | None = None,
     ) -> None:
-        super().__init__(coordinator)
+        # The context lets a pushed refresh update only the affected entities
+        super().__init__(coordinator, context=(vehicle_id, key))
         self._vehicle_id = vehicle_id
         self._vehicle_name = vehicle_name
         self._key = key
@@ -258,672 +175,526 @@ class BaseLubeLoggerSensor(CoordinatorEntity, SensorEntity):
         self._attr_device_class = device_class
         self._attr_state_class = state_class
         self._attr_native_unit_of_measurement = unit
-        
-        # Extract make/model/year from vehicle info for device info
-        make = vehicle_info.get("Make") or vehicle_info.get("make") or ""
-        model = vehicle_info.get("Model") or vehicle_info.get("model") or ""
-        year = str(vehicle_info.get("Year") or vehicle_info.get("year") or "")
-        
+        # Property name -> (record, computed value), see cached_per_record
+        self._record_cache: dict[str, tuple[Any, Any]] = {}
+
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, str(vehicle_id))},
             name=vehicle_name,
-            manufacturer=make or "LubeLogger",
-            model=model or vehicle_name,
-            sw_version=year,
+            manufacturer=vehicle_info.make or "LubeLogger",
+            model=vehicle_info.model or vehicle_name,
+            sw_version=vehicle_info.year,
         )
 
     @property
-    def _record(self) -> dict | None:
+    def _record(self) -> Any:
+        """Return the vehicle's value of the sensor key: a record or statistics."""
         data = self.coordinator.data or {}
-        vehicles = data.get("vehicles", [])
-        for vehicle in vehicles:
-            if vehicle.get("id") == self._vehicle_id:
-                rec = vehicle.get(self._key)
-                return rec if isinstance(rec, dict) else None
-        return None
+        vehicle = data.get("vehicle_index", {}).get(self._vehicle_id)
+        if vehicle is None:
+            return None
+        return vehicle.get(self._key)
 
     @property
     def available(self) -> bool:
-        """Return if sensor is available."""
-        return self._record is not None
+        """Return if the last refresh succeeded and the vehicle has a value.
 
+        The last data is kept while the server is unreachable, but it is
+        stale, so the sensors are unavailable until a refresh succeeds.
+        """
+        return super().available and self._record is not None
 
-class LubeLoggerLatestOdometerSensor(BaseLubeLoggerSensor):
-    """Sensor for latest odometer value."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the new state, timed in the trace of the refresh."""
+        trace = self.coordinator.active_trace
+        if trace is None:
+            super()._handle_coordinator_update()
+            return
+        with trace.span("entity_state", self._vehicle_id, sensor=self._key):
+            super()._handle_coordinator_update()
+
+
+class LubeLoggerRecordSensor(BaseLubeLoggerSensor):
+    """Sensor for the selected record of a record type."""
 
     def __init__(
         self,
         coordinator: LubeLoggerDataUpdateCoordinator,
         vehicle_id: int,
         vehicle_name: str,
-        vehicle_info: dict,
+        vehicle_info: VehicleInfo,
+        record_type: RecordType,
     ) -> None:
         super().__init__(
             coordinator=coordinator,
             vehicle_id=vehicle_id,
             vehicle_name=vehicle_name,
             vehicle_info=vehicle_info,
-            key="latest_odometer",
-            translation_key="latest_odometer",
-            unique_id_suffix="latest_odometer",
-            device_class=SensorDeviceClass.DISTANCE,
-            state_class=SensorStateClass.MEASUREMENT,
-            unit="km",
+            key=record_type.key,
+            translation_key=record_type.key,
+            unique_id_suffix=record_type.key,
+            device_class=record_type.device_class,
+            state_class=record_type.state_class,
+            unit=record_type.unit,
         )
+        self._record_type = record_type
 
     @property
     def native_value(self) -> Any:
-        rec = self._record
-        if not rec:
+        rec: Record | None = self._record
+        if rec is None:
             return None
-        
-        if rec.get("adjusted"):
-            odometer = rec.get("odometer")
-        else:
-            odometer = rec.get("odometer") or rec.get("Odometer")
-        
-        if odometer:
-            return convert_number_string(odometer)
-        return None
+        return rec.value if self._record_type.value_fields else rec.date
 
     @property
+    @cached_per_record
     def extra_state_attributes(self) -> dict[str, Any] | None:
-        if not self._record:
+        rec: Record | None = self._record
+        if rec is None:
             return None
-        
-        attrs = {}
-        # Process ALL fields in the record to make them interoperable
-        for key, value in self._record.items():
-            # Convert any value that looks like a number
-            if isinstance(value, str) and any(char.isdigit() for char in value):
-                attrs[key] = convert_number_string(value)
-            else:
-                attrs[key] = value
-        
-        # Add the date in a readable format
-        if "date" in attrs:
-            try:
-                dt = parse_date(attrs["date"])
-                if dt:
-                    attrs["date_formatted"] = dt.strftime("%d/%m/%Y")
-            except (ValueError, TypeError):
-                pass
-        
-        return attrs
 
+        attrs = dict(rec.fields)
+        self._add_attributes(rec, attrs)
 
-class LubeLoggerNextPlanSensor(BaseLubeLoggerSensor):
-    """Sensor for next planned item from Plan endpoint."""
+        # Add date in readable format
+        if rec.date is not None:
+            name = self._record_type.formatted_date_attribute or f"{rec.date_field}_formatted"
+            attrs[name] = rec.date.strftime("%d/%m/%Y")
 
-    def __init__(
-        self,
-        coordinator: LubeLoggerDataUpdateCoordinator,
-        vehicle_id: int,
-        vehicle_name: str,
-        vehicle_info: dict,
-    ) -> None:
-        super().__init__(
-            coordinator=coordinator,
-            vehicle_id=vehicle_id,
-            vehicle_name=vehicle_name,
-            vehicle_info=vehicle_info,
-            key="next_plan",
-            translation_key="next_plan",
-            unique_id_suffix="next_plan",
-            device_class=SensorDeviceClass.TIMESTAMP,
-        )
+        return attrs
 
-    @property
-    def native_value(self) -> datetime | None:
-        rec = self._record
-        if not rec:
-            return None
+    def _add_attributes(self, rec: Record, attrs: dict[str, Any]) -> None:
+        """Add record type specific attributes."""
 
-        for field in ("dateCreated", "dateModified", "Date", "date"):
-            dt = parse_date(rec.get(field))
-            if dt:
-                return dt
-        return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        if not self._record:
-            return None
-        
-        attrs = {}
-        # Process ALL fields in the record to make them interoperable
-        for key, value in self._record.items():
-            # Convert any value that looks like a number
-            if isinstance(value, str) and any(char.isdigit() for char in value):
-                attrs[key] = convert_number_string(value)
-            else:
-                attrs[key] = value
-        
-        # Add the date in a readable format
-        date_fields = ["dateCreated", "dateModified", "Date", "date"]
-        for field in date_fields:
-            if field in attrs:
+class LubeLoggerLatestGasSensor(LubeLoggerRecordSensor):
+    """Sensor for latest gas/fuel record."""
+
+    def _add_attributes(self, rec: Record, attrs: dict[str, Any]) -> None:
+        """Add the fuel consumption converted to km/l."""
+        # FUEL CONSUMPTION - EXPLICIT CONVERSION for fuelEconomy
+        if "fuelEconomy" in attrs:
+            fuel_value = attrs["fuelEconomy"]
+            
+            # If it's a string with comma, convert to float
+            if isinstance(fuel_value, str):
+                fuel_value = fuel_value.replace(',', '.')
                 try:
-                    dt = parse_date(attrs[field])
-                    if dt:
-                        attrs[f"{field}_formatted"] = dt.strftime("%d/%m/%Y")
+                    fuel_value = float(fuel_value)
                 except (ValueError, TypeError):
                     pass
-                break
+            
+            # If it's a number, convert to km/l and round
+            if isinstance(fuel_value, (int, float)) and fuel_value > 0:
+                # Conversion l/100km → km/l (100 / consumption)
+                fuel_value = 100 / fuel_value
+                fuel_value = round(fuel_value, 2)  # Round to 2 decimals
+            
+            attrs["fuelEconomy"] = fuel_value
+            attrs["fuelEconomy_unit"] = "km/l"
         
-        return attrs
-
+        # Handle other similar consumption fields
+        other_consumption_fields = ["consumption", "litersPer100km", "averageConsumption"]
+        for field in other_consumption_fields:
+            if field in attrs:
+                raw_value = attrs[field]
+                if isinstance(raw_value, str):
+                    raw_value = raw_value.replace(',', '.')
+                    try:
+                        raw_value = float(raw_value)
+                    except (ValueError, TypeError):
+                        pass
+                
+                if isinstance(raw_value, (int, float)) and raw_value > 0:
+                    if raw_value < 20:  # Probably l/100km
+                        raw_value = 100 / raw_value
+                    raw_value = round(raw_value, 2)
+                
+                attrs[field] = raw_value
+                attrs[f"{field}_unit"] = "km/l"
 
-class LubeLoggerLatestTaxSensor(BaseLubeLoggerSensor):
-    """Sensor for latest tax record."""
 
-    def __init__(
-        self,
-        coordinator: LubeLoggerDataUpdateCoordinator,
-        vehicle_id: int,
-        vehicle_name: str,
-        vehicle_info: dict,
-    ) -> None:
-        super().__init__(
-            coordinator=coordinator,
-            vehicle_id=vehicle_id,
-            vehicle_name=vehicle_name,
-            vehicle_info=vehicle_info,
-            key="latest_tax",
-            translation_key="latest_tax",
-            unique_id_suffix="latest_tax",
-            device_class=SensorDeviceClass.MONETARY,
-            state_class=None,
-            unit="EUR",
-        )
+class LubeLoggerNextReminderSensor(LubeLoggerRecordSensor):
+    """Sensor for next reminder."""
 
-    @property
-    def native_value(self) -> Any:
-        rec = self._record
-        if not rec:
-            return None
+    def _add_attributes(self, rec: ReminderRecord, attrs: dict[str, Any]) -> None:
+        """Add the overdue state and a readable status."""
+        # Calculate the actual status of the reminder
+        due_distance = rec.due_distance
+        due_days = rec.due_days
+        metric = rec.metric
+        urgency = rec.urgency
         
-        cost = rec.get("cost") or rec.get("Cost")
-        if cost:
-            return convert_number_string(cost)
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        if not self._record:
-            return None
+        # Determine if it's overdue
+        is_overdue = False
+        overdue_by = None
         
-        attrs = {}
-        # Process ALL fields in the record to make them interoperable
-        for key, value in self._record.items():
-            # Convert any value that looks like a number
-            if isinstance(value, str) and any(char.isdigit() for char in value):
-                attrs[key] = convert_number_string(value)
-            else:
-                attrs[key] = value
+        if urgency == "PastDue":
+            is_overdue = True
+        elif due_distance is not None and due_distance < 0:
+            is_overdue = True
+            overdue_by = f"{-due_distance} km"
+        elif due_days is not None and due_days < 0:
+            is_overdue = True
+            overdue_by = f"{-due_days} days"
         
-        # Add date in readable format
-        date_fields = ["date", "Date", "taxDate"]
-        for field in date_fields:
-            if field in attrs:
-                try:
-                    dt = parse_date(attrs[field])
-                    if dt:
-                        attrs["date_formatted"] = dt.strftime("%d/%m/%Y")
-                except (ValueError, TypeError):
-                    pass
-                break
+        attrs["overdue"] = is_overdue
+        if overdue_by:
+            attrs["overdue_by"] = overdue_by
         
-        return attrs
+        # Add info about the metric
+        if "Odometer" in metric:
+            attrs["reminder_type"] = "By distance"
+            if due_distance is not None:
+                if due_distance < 0:
+                    attrs["status"] = f"Overdue by {-due_distance} km"
+                else:
+                    attrs["status"] = f"In {due_distance} km"
+        elif "Date" in metric:
+            attrs["reminder_type"] = "By time"
+            if due_days is not None:
+                if due_days < 0:
+                    attrs["status"] = f"Overdue by {-due_days} days"
+                else:
+                    attrs["status"] = f"In {due_days} days"
+        else:
+            attrs["reminder_type"] = "Mixed"
+
+
+# Sensor classes of record types with extra attributes
+SENSOR_CLASSES: dict[str, type[LubeLoggerRecordSensor]] = {
+    "latest_gas": LubeLoggerLatestGasSensor,
+    "next_reminder": LubeLoggerNextReminderSensor,
+}
 
 
-class LubeLoggerLatestServiceSensor(BaseLubeLoggerSensor):
-    """Sensor for latest service record."""
+class LubeLoggerReminderForecastSensor(BaseLubeLoggerSensor):
+    """Predicted due date of the next reminder.
+
+    Distance reminders fall due when the vehicle is expected to reach the
+    due distance at its current driving pace, see trend.OdometerTrend.
+    """
 
     def __init__(
         self,
         coordinator: LubeLoggerDataUpdateCoordinator,
         vehicle_id: int,
         vehicle_name: str,
-        vehicle_info: dict,
+        vehicle_info: VehicleInfo,
     ) -> None:
         super().__init__(
             coordinator=coordinator,
             vehicle_id=vehicle_id,
             vehicle_name=vehicle_name,
             vehicle_info=vehicle_info,
-            key="latest_service",
-            translation_key="latest_service",
-            unique_id_suffix="latest_service",
+            key="reminder_forecast",
+            translation_key="reminder_due",
+            unique_id_suffix="reminder_due",
             device_class=SensorDeviceClass.TIMESTAMP,
         )
 
     @property
+    @cached_per_record
     def native_value(self) -> datetime | None:
-        rec = self._record
-        if not rec:
+        forecast = self._record
+        if not forecast:
             return None
-
-        for field in ("date", "Date", "ServiceDate"):
-            dt = parse_date(rec.get(field))
-            if dt:
-                return dt
-        return None
+        return dt_util.start_of_local_day(date.fromisoformat(forecast["due_date"]))
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
-        if not self._record:
+        forecast = self._record
+        if not forecast:
             return None
-        
-        attrs = {}
-        # Process ALL fields in the record to make them interoperable
-        for key, value in self._record.items():
-            # Convert any value that looks like a number
-            if isinstance(value, str) and any(char.isdigit() for char in value):
-                attrs[key] = convert_number_string(value)
-            else:
-                attrs[key] = value
-        
-        # Add date in readable format
-        date_fields = ["date", "Date", "ServiceDate"]
-        for field in date_fields:
-            if field in attrs:
-                try:
-                    dt = parse_date(attrs[field])
-                    if dt:
-                        attrs["date_formatted"] = dt.strftime("%d/%m/%Y")
-                except (ValueError, TypeError):
-                    pass
-                break
-        
-        return attrs
+        return {
+            "description": forecast.get("description"),
+            "km_per_day": forecast.get("km_per_day"),
+        }
+
 
+# Fuel economy statistics of analytics.FuelLog and their units
+FUEL_STATS: tuple[tuple[str, str], ...] = (
+    ("consumption", "L/100km"),
+    ("cost_per_km", "EUR/km"),
+    ("price_per_liter", "EUR/L"),
+)
 
-class LubeLoggerLatestRepairSensor(BaseLubeLoggerSensor):
-    """Sensor for latest repair record."""
+
+class LubeLoggerFuelSensor(BaseLubeLoggerSensor):
+    """Fuel economy of a vehicle over a rolling window of days."""
 
     def __init__(
         self,
         coordinator: LubeLoggerDataUpdateCoordinator,
         vehicle_id: int,
         vehicle_name: str,
-        vehicle_info: dict,
+        vehicle_info: VehicleInfo,
+        stat: str,
+        unit: str,
+        days: int,
     ) -> None:
         super().__init__(
             coordinator=coordinator,
             vehicle_id=vehicle_id,
             vehicle_name=vehicle_name,
             vehicle_info=vehicle_info,
-            key="latest_repair",
-            translation_key="latest_repair",
-            unique_id_suffix="latest_repair",
-            device_class=SensorDeviceClass.TIMESTAMP,
+            key="fuel_stats",
+            translation_key=f"fuel_{stat}",
+            unique_id_suffix=f"fuel_{stat}_{days}d",
+            state_class=SensorStateClass.MEASUREMENT,
+            unit=unit,
         )
+        self._stat_key = f"{stat}_{days}d"
+        self._attr_translation_placeholders = {"days": str(days)}
 
     @property
-    def native_value(self) -> datetime | None:
-        rec = self._record
-        if not rec:
-            return None
-
-        for field in ("date", "Date", "RepairDate"):
-            dt = parse_date(rec.get(field))
-            if dt:
-                return dt
-        return None
+    def native_value(self) -> Any:
+        stats = self._record
+        return stats.get(self._stat_key) if stats else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
-        if not self._record:
-            return None
-        
-        attrs = {}
-        # Process ALL fields in the record to make them interoperable
-        for key, value in self._record.items():
-            # Convert any value that looks like a number
-            if isinstance(value, str) and any(char.isdigit() for char in value):
-                attrs[key] = convert_number_string(value)
-            else:
-                attrs[key] = value
-        
-        # Add date in readable format
-        date_fields = ["date", "Date", "RepairDate"]
-        for field in date_fields:
-            if field in attrs:
-                try:
-                    dt = parse_date(attrs[field])
-                    if dt:
-                        attrs["date_formatted"] = dt.strftime("%d/%m/%Y")
-                except (ValueError, TypeError):
-                    pass
-                break
-        
-        return attrs
+        stats = self._record
+        return {"fill_ups": stats.get("fill_ups")} if stats else None
 
 
-class LubeLoggerLatestUpgradeSensor(BaseLubeLoggerSensor):
-    """Sensor for latest upgrade record."""
+class LubeLoggerCostSensor(BaseLubeLoggerSensor):
+    """Cost of a vehicle in one category over the month, the year or its lifetime.
+
+    The month and year totals start again at every period; ``last_reset``
+    tells the long-term statistics where.
+    """
 
     def __init__(
         self,
         coordinator: LubeLoggerDataUpdateCoordinator,
         vehicle_id: int,
         vehicle_name: str,
-        vehicle_info: dict,
+        vehicle_info: VehicleInfo,
+        category: str,
+        period: str,
     ) -> None:
         super().__init__(
             coordinator=coordinator,
             vehicle_id=vehicle_id,
             vehicle_name=vehicle_name,
             vehicle_info=vehicle_info,
-            key="latest_upgrade",
-            translation_key="latest_upgrade",
-            unique_id_suffix="latest_upgrade",
-            device_class=SensorDeviceClass.TIMESTAMP,
+            key="costs",
+            translation_key=f"{category}_cost_{period}",
+            unique_id_suffix=f"{category}_cost_{period}",
+            device_class=SensorDeviceClass.MONETARY,
+            state_class=SensorStateClass.TOTAL,
+            unit="EUR",
+        )
+        self._category = category
+        self._period = period
+        # The monthly and yearly split per category is there to investigate
+        self._attr_entity_registry_enabled_default = (
+            category == TOTAL or period == "lifetime"
         )
 
     @property
-    def native_value(self) -> datetime | None:
-        rec = self._record
-        if not rec:
+    def native_value(self) -> Any:
+        costs = self._record
+        if not costs or self._category not in costs:
             return None
-
-        for field in ("date", "Date", "UpgradeDate"):
-            dt = parse_date(rec.get(field))
-            if dt:
-                return dt
-        return None
+        return costs[self._category][self._period]
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        if not self._record:
+    def last_reset(self) -> datetime | None:
+        costs = self._record
+        if self._period == "lifetime" or not costs:
             return None
-        
-        attrs = {}
-        # Process ALL fields in the record to make them interoperable
-        for key, value in self._record.items():
-            # Convert any value that looks like a number
-            if isinstance(value, str) and any(char.isdigit() for char in value):
-                attrs[key] = convert_number_string(value)
-            else:
-                attrs[key] = value
-        
-        # Add date in readable format
-        date_fields = ["date", "Date", "UpgradeDate"]
-        for field in date_fields:
-            if field in attrs:
-                try:
-                    dt = parse_date(attrs[field])
-                    if dt:
-                        attrs["date_formatted"] = dt.strftime("%d/%m/%Y")
-                except (ValueError, TypeError):
-                    pass
-                break
-        
-        return attrs
-
+        as_of = date.fromisoformat(costs["as_of"])
+        start = as_of.replace(day=1) if self._period == "month" else as_of.replace(month=1, day=1)
+        return dt_util.start_of_local_day(start)
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ServerSensorDescription(SensorEntityDescription):
+    """Diagnostic sensor of the server and of the integration's refreshes."""
+
+    value_fn: Callable[[LubeLoggerDataUpdateCoordinator], Any]
+
+
+@dataclass(frozen=True, kw_only=True)
+class EndpointSensorDescription(SensorEntityDescription):
+    """Diagnostic sensor of the requests to one API endpoint."""
+
+    value_fn: Callable[[EndpointMetrics], Any]
+    attributes_fn: Callable[[EndpointMetrics], dict[str, Any]] | None = None
+
+
+SERVER_SENSORS: tuple[ServerSensorDescription, ...] = (
+    ServerSensorDescription(
+        key="refresh_duration",
+        translation_key="refresh_duration",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=2,
+        value_fn=lambda coordinator: coordinator.last_refresh_wall_time,
+    ),
+    ServerSensorDescription(
+        key="vehicles_processed",
+        translation_key="vehicles_processed",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.last_refresh_vehicles,
+    ),
+    ServerSensorDescription(
+        key="requests",
+        translation_key="requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: sum(
+            metrics.requests for metrics in coordinator.client.metrics.values()
+        ),
+    ),
+    ServerSensorDescription(
+        key="request_errors",
+        translation_key="request_errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: sum(
+            metrics.errors for metrics in coordinator.client.metrics.values()
+        ),
+    ),
+)
 
-class LubeLoggerLatestSupplySensor(BaseLubeLoggerSensor):
-    """Sensor for latest supply record."""
+# Per endpoint sensors are disabled by default, enable them to investigate
+ENDPOINT_SENSORS: tuple[EndpointSensorDescription, ...] = (
+    EndpointSensorDescription(
+        key="requests",
+        translation_key="endpoint_requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: metrics.requests,
+    ),
+    EndpointSensorDescription(
+        key="errors",
+        translation_key="endpoint_errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: metrics.errors,
+    ),
+    EndpointSensorDescription(
+        key="latency",
+        translation_key="endpoint_latency",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_registry_enabled_default=False,
+        # The state is the 95th percentile of the recent requests
+        value_fn=lambda metrics: _milliseconds(metrics.latency_percentile(95)),
+        attributes_fn=lambda metrics: {
+            f"p{percent}": _milliseconds(metrics.latency_percentile(percent))
+            for percent in (50, 90, 95, 99)
+        },
+    ),
+    EndpointSensorDescription(
+        key="bytes",
+        translation_key="endpoint_bytes",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: metrics.bytes,
+    ),
+    EndpointSensorDescription(
+        key="decode_time",
+        translation_key="endpoint_decode_time",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: _milliseconds(metrics.mean_decode_time),
+    ),
+)
 
-    def __init__(
-        self,
-        coordinator: LubeLoggerDataUpdateCoordinator,
-        vehicle_id: int,
-        vehicle_name: str,
-        vehicle_info: dict,
-    ) -> None:
-        super().__init__(
-            coordinator=coordinator,
-            vehicle_id=vehicle_id,
-            vehicle_name=vehicle_name,
-            vehicle_info=vehicle_info,
-            key="latest_supply",
-            translation_key="latest_supply",
-            unique_id_suffix="latest_supply",
-            device_class=SensorDeviceClass.TIMESTAMP,
-        )
+# Endpoints with their own diagnostic sensors
+METRIC_ENDPOINTS: tuple[str, ...] = tuple(
+    dict.fromkeys(
+        [API_VEHICLES]
+        + [
+            endpoint
+            for record_type in RECORD_TYPES
+            for endpoint in (record_type.preferred_endpoint, record_type.endpoint)
+            if endpoint
+        ]
+    )
+)
 
-    @property
-    def native_value(self) -> datetime | None:
-        rec = self._record
-        if not rec:
-            return None
 
-        for field in ("date", "Date", "SupplyDate"):
-            dt = parse_date(rec.get(field))
-            if dt:
-                return dt
-        return None
+def server_device_info(entry: ConfigEntry) -> DeviceInfo:
+    """Return the device of the LubeLogger server of a config entry."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name=entry.title or "LubeLogger",
+        manufacturer="LubeLogger",
+        model="Server",
+        entry_type=DeviceEntryType.SERVICE,
+        configuration_url=entry.data[CONF_URL],
+    )
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        if not self._record:
-            return None
-        
-        attrs = {}
-        # Process ALL fields in the record to make them interoperable
-        for key, value in self._record.items():
-            # Convert any value that looks like a number
-            if isinstance(value, str) and any(char.isdigit() for char in value):
-                attrs[key] = convert_number_string(value)
-            else:
-                attrs[key] = value
-        
-        # Add date in readable format
-        date_fields = ["date", "Date", "SupplyDate"]
-        for field in date_fields:
-            if field in attrs:
-                try:
-                    dt = parse_date(attrs[field])
-                    if dt:
-                        attrs["date_formatted"] = dt.strftime("%d/%m/%Y")
-                except (ValueError, TypeError):
-                    pass
-                break
-        
-        return attrs
 
+class LubeLoggerServerSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor on the server device."""
 
-class LubeLoggerLatestGasSensor(BaseLubeLoggerSensor):
-    """Sensor for latest gas/fuel record."""
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    entity_description: ServerSensorDescription
 
     def __init__(
         self,
         coordinator: LubeLoggerDataUpdateCoordinator,
-        vehicle_id: int,
-        vehicle_name: str,
-        vehicle_info: dict,
+        entry: ConfigEntry,
+        description: SensorEntityDescription,
+        unique_id_suffix: str | None = None,
     ) -> None:
-        super().__init__(
-            coordinator=coordinator,
-            vehicle_id=vehicle_id,
-            vehicle_name=vehicle_name,
-            vehicle_info=vehicle_info,
-            key="latest_gas",
-            translation_key="latest_gas",
-            unique_id_suffix="latest_gas",
-            device_class=SensorDeviceClass.TIMESTAMP,
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = (
+            f"lubelogger_{entry.entry_id}_{unique_id_suffix or description.key}"
         )
+        self._attr_device_info = server_device_info(entry)
 
     @property
-    def native_value(self) -> datetime | None:
-        rec = self._record
-        if not rec:
-            return None
+    def native_value(self) -> Any:
+        return self.entity_description.value_fn(self.coordinator)
 
-        for field in ("date", "Date", "FuelDate"):
-            dt = parse_date(rec.get(field))
-            if dt:
-                return dt
-        return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        if not self._record:
-            return None
-        
-        attrs = {}
-        # Process ALL fields in the record to make them interoperable
-        for key, value in self._record.items():
-            # Convert any value that looks like a number
-            if isinstance(value, str) and any(char.isdigit() for char in value):
-                attrs[key] = convert_number_string(value)
-            else:
-                attrs[key] = value
-        
-        # FUEL CONSUMPTION - EXPLICIT CONVERSION for fuelEconomy
-        if "fuelEconomy" in attrs:
-            fuel_value = attrs["fuelEconomy"]
-            
-            # If it's a string with comma, convert to float
-            if isinstance(fuel_value, str):
-                fuel_value = fuel_value.replace(',', '.')
-                try:
-                    fuel_value = float(fuel_value)
-                except (ValueError, TypeError):
-                    pass
-            
-            # If it's a number, convert to km/l and round
-            if isinstance(fuel_value, (int, float)) and fuel_value > 0:
-                # Conversion l/100km → km/l (100 / consumption)
-                fuel_value = 100 / fuel_value
-                fuel_value = round(fuel_value, 2)  # Round to 2 decimals
-            
-            attrs["fuelEconomy"] = fuel_value
-            attrs["fuelEconomy_unit"] = "km/l"
-        
-        # Handle other similar consumption fields
-        other_consumption_fields = ["consumption", "litersPer100km", "averageConsumption"]
-        for field in other_consumption_fields:
-            if field in attrs:
-                raw_value = attrs[field]
-                if isinstance(raw_value, str):
-                    raw_value = raw_value.replace(',', '.')
-                    try:
-                        raw_value = float(raw_value)
-                    except (ValueError, TypeError):
-                        pass
-                
-                if isinstance(raw_value, (int, float)) and raw_value > 0:
-                    if raw_value < 20:  # Probably l/100km
-                        raw_value = 100 / raw_value
-                    raw_value = round(raw_value, 2)
-                
-                attrs[field] = raw_value
-                attrs[f"{field}_unit"] = "km/l"
-        
-        # Add date in readable format
-        date_fields = ["date", "Date", "FuelDate"]
-        for field in date_fields:
-            if field in attrs:
-                try:
-                    dt = parse_date(attrs[field])
-                    if dt:
-                        attrs["date_formatted"] = dt.strftime("%d/%m/%Y")
-                except (ValueError, TypeError):
-                    pass
-                break
-        
-        return attrs
+class LubeLoggerEndpointSensor(LubeLoggerServerSensor):
+    """Diagnostic sensor of the requests to one API endpoint."""
 
-
-class LubeLoggerNextReminderSensor(BaseLubeLoggerSensor):
-    """Sensor for next reminder."""
+    entity_description: EndpointSensorDescription
 
     def __init__(
         self,
         coordinator: LubeLoggerDataUpdateCoordinator,
-        vehicle_id: int,
-        vehicle_name: str,
-        vehicle_info: dict,
+        entry: ConfigEntry,
+        description: EndpointSensorDescription,
+        endpoint: str,
     ) -> None:
-        super().__init__(
-            coordinator=coordinator,
-            vehicle_id=vehicle_id,
-            vehicle_name=vehicle_name,
-            vehicle_info=vehicle_info,
-            key="next_reminder",
-            translation_key="next_reminder",
-            unique_id_suffix="next_reminder",
-            device_class=SensorDeviceClass.TIMESTAMP,
-        )
+        name = endpoint.rsplit("/", 1)[-1]
+        super().__init__(coordinator, entry, description, f"{name}_{description.key}")
+        self._endpoint = endpoint
+        self._attr_translation_placeholders = {"endpoint": name}
 
     @property
-    def native_value(self) -> datetime | None:
-        rec = self._record
-        if not rec:
-            return None
+    def _metrics(self) -> EndpointMetrics | None:
+        return self.coordinator.client.metrics.get(self._endpoint)
 
-        # API uses dueDate for reminders
-        for field in ("dueDate", "DueDate", "Date", "date"):
-            dt = parse_date(rec.get(field))
-            if dt:
-                return dt
-        return None
+    @property
+    def native_value(self) -> Any:
+        metrics = self._metrics
+        return None if metrics is None else self.entity_description.value_fn(metrics)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
-        if not self._record:
+        metrics = self._metrics
+        if metrics is None or self.entity_description.attributes_fn is None:
             return None
-        
-        attrs = {}
-        # Process ALL fields in the record to make them interoperable
-        for key, value in self._record.items():
-            # Convert any value that looks like a number
-            if isinstance(value, str) and any(char.isdigit() for char in value):
-                attrs[key] = convert_number_string(value)
-            else:
-                attrs[key] = value
-        
-        # Add due date in readable format
-        if "dueDate" in attrs:
-            try:
-                dt = parse_date(attrs["dueDate"])
-                if dt:
-                    attrs["due_date_formatted"] = dt.strftime("%d/%m/%Y")
-            except (ValueError, TypeError):
-                pass
-        
-        # Calculate the actual status of the reminder
-        due_distance = attrs.get("dueDistance")
-        due_days = attrs.get("dueDays")
-        metric = attrs.get("metric", "")
-        urgency = attrs.get("urgency", "")
-        
-        # Determine if it's overdue
-        is_overdue = False
-        overdue_by = None
-        
-        if urgency == "PastDue":
-            is_overdue = True
-        elif due_distance is not None and due_distance < 0:
-            is_overdue = True
-            overdue_by = f"{-due_distance} km"
-        elif due_days is not None and due_days < 0:
-            is_overdue = True
-            overdue_by = f"{-due_days} days"
-        
-        attrs["overdue"] = is_overdue
-        if overdue_by:
-            attrs["overdue_by"] = overdue_by
-        
-        # Add info about the metric
-        if "Odometer" in metric:
-            attrs["reminder_type"] = "By distance"
-            if due_distance is not None:
-                if due_distance < 0:
-                    attrs["status"] = f"Overdue by {-due_distance} km"
-                else:
-                    attrs["status"] = f"In {due_distance} km"
-        elif "Date" in metric:
-            attrs["reminder_type"] = "By time"
-            if due_days is not None:
-                if due_days < 0:
-                    attrs["status"] = f"Overdue by {-due_days} days"
-                else:
-                    attrs["status"] = f"In {due_days} days"
-        else:
-            attrs["reminder_type"] = "Mixed"
-        
-        return attrs
\ No newline at end of file
+        return self.entity_description.attributes_fn(metrics)
@@ -0,0 +1,179 @@
+"""Import of the vehicles' record history into long-term statistics."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date
+from itertools import groupby
+from typing import Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from homeassistant.util.unit_conversion import DistanceConverter, VolumeConverter
+
+try:
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # Home Assistant before 2025.4
+    StatisticMeanType = None
+
+from .const import DOMAIN, STATISTICS_CHUNK_SIZE
+from .history import HistoryRow
+from .record_types import RECORD_TYPES
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class VehicleStatistic:
+    """A long-term statistic of every vehicle, built from its history rows."""
+
+    key: str
+    unit: str
+    # Summed (costs, fuel) or averaged over a day (odometer)
+    has_sum: bool
+    # Value of a row; rows without one (0) are left out
+    value: Callable[[HistoryRow], float]
+    # Record types whose rows are used
+    sources: tuple[str, ...]
+    # Unit converter class of the unit, None if it has none (currencies)
+    unit_class: str | None = None
+
+
+STATISTICS: tuple[VehicleStatistic, ...] = (
+    VehicleStatistic(
+        "odometer",
+        "km",
+        False,
+        lambda row: row.odometer,
+        tuple(record_type.key for record_type in RECORD_TYPES if record_type.history),
+        DistanceConverter.UNIT_CLASS,
+    ),
+    VehicleStatistic(
+        "fuel", "L", True, lambda row: row.quantity, ("latest_gas",), VolumeConverter.UNIT_CLASS
+    ),
+    VehicleStatistic(
+        "cost",
+        "EUR",
+        True,
+        lambda row: row.cost,
+        tuple(record_type.key for record_type in RECORD_TYPES if record_type.cost_category),
+    ),
+)
+
+
+def statistic_id(vehicle_id: Any, statistic: VehicleStatistic) -> str:
+    """Return the id of a statistic of a vehicle."""
+    return f"{DOMAIN}:vehicle_{vehicle_id}_{statistic.key}"
+
+
+def statistic_metadata(
+    vehicle_id: Any, vehicle_name: str, statistic: VehicleStatistic
+) -> StatisticMetaData:
+    """Return the metadata of a statistic of a vehicle.
+
+    Newer recorders want the mean type and unit class as well; they are
+    only set where the installed Home Assistant has them.
+    """
+    metadata = StatisticMetaData(
+        has_mean=not statistic.has_sum,
+        has_sum=statistic.has_sum,
+        name=f"{vehicle_name} {statistic.key}",
+        source=DOMAIN,
+        statistic_id=statistic_id(vehicle_id, statistic),
+        unit_of_measurement=statistic.unit,
+    )
+    if StatisticMeanType is not None:
+        metadata["mean_type"] = (
+            StatisticMeanType.NONE if statistic.has_sum else StatisticMeanType.ARITHMETIC
+        )
+    if "unit_class" in StatisticMetaData.__annotations__:
+        metadata["unit_class"] = statistic.unit_class
+    return metadata
+
+
+def _daily_values(
+    histories: Mapping[str, Sequence[HistoryRow]], statistic: VehicleStatistic
+) -> Iterator[tuple[int, list[float]]]:
+    """Yield the values of every day with rows, in date order."""
+    rows = heapq.merge(
+        *(
+            sorted(histories[source], key=lambda row: row.day)
+            for source in statistic.sources
+            if source in histories
+        ),
+        key=lambda row: row.day,
+    )
+    for day, day_rows in groupby(rows, key=lambda row: row.day):
+        if values := [value for row in day_rows if (value := statistic.value(row))]:
+            yield day, values
+
+
+async def async_import_vehicle_statistics(
+    hass: HomeAssistant,
+    vehicle_id: Any,
+    vehicle_name: str,
+    histories: Mapping[str, Sequence[HistoryRow]],
+) -> int:
+    """Import the history of a vehicle into its statistics; return the days imported.
+
+    Days up to the last one already in the recorder are skipped, so an
+    interrupted import resumes where it stopped and a repeated one only
+    adds the newer days. Records added later with an older date are not
+    imported. The statistics are sent in chunks, yielding to the event
+    loop in between.
+    """
+    today = dt_util.now().date().toordinal()
+    imported = 0
+    for statistic in STATISTICS:
+        metadata = statistic_metadata(vehicle_id, vehicle_name, statistic)
+        last = await get_instance(hass).async_add_executor_job(
+            get_last_statistics, hass, 1, metadata["statistic_id"], False, {"sum"}
+        )
+        last_day = 0
+        total = 0.0
+        if last_rows := last.get(metadata["statistic_id"]):
+            last_day = dt_util.as_local(
+                dt_util.utc_from_timestamp(last_rows[0]["start"])
+            ).date().toordinal()
+            total = last_rows[0].get("sum") or 0.0
+
+        chunk: list[StatisticData] = []
+        for day, values in _daily_values(histories, statistic):
+            if day <= last_day:
+                continue
+            if day > today:
+                break
+            start = dt_util.start_of_local_day(date.fromordinal(day))
+            if statistic.has_sum:
+                total += sum(values)
+                chunk.append(StatisticData(start=start, state=total, sum=total))
+            else:
+                chunk.append(
+                    StatisticData(
+                        start=start,
+                        mean=sum(values) / len(values),
+                        min=min(values),
+                        max=max(values),
+                    )
+                )
+            if len(chunk) >= STATISTICS_CHUNK_SIZE:
+                async_add_external_statistics(hass, metadata, chunk)
+                imported += len(chunk)
+                chunk = []
+                await asyncio.sleep(0)
+        if chunk:
+            async_add_external_statistics(hass, metadata, chunk)
+            imported += len(chunk)
+
+    if imported:
+        _LOGGER.debug("Imported %d days of statistics of vehicle %s", imported, vehicle_id)
+    return imported
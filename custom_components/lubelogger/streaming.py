@@ -0,0 +1,78 @@
+"""Incremental decoding of JSON arrays received in chunks."""
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+# Whitespace and element separators between two array elements
+_SEPARATORS = re.compile(r"[ \t\n\r,]*")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters that can follow a complete number or literal
+_ELEMENT_END = frozenset(" \t\n\r,]")
+
+
+class JsonArrayParser:
+    """Decode the elements of a top-level JSON array as its text arrives.
+
+    Only the text of the element being received is buffered, so memory
+    stays bounded by the largest element instead of the whole array.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._started = False
+        self._done = False
+
+    def feed(self, text: str) -> list[Any]:
+        """Add text and return the elements completed by it."""
+        if self._done:
+            return []
+        buffer = self._buffer + text
+        pos = 0
+        items: list[Any] = []
+        end_of_buffer = len(buffer)
+
+        if not self._started:
+            pos = _WHITESPACE.match(buffer).end()
+            if pos == end_of_buffer:
+                self._buffer = ""
+                return items
+            if buffer[pos] != "[":
+                raise ValueError("Response is not a JSON array")
+            self._started = True
+            pos += 1
+
+        skip_separators = _SEPARATORS.match
+        raw_decode = self._decoder.raw_decode
+        while True:
+            pos = skip_separators(buffer, pos).end()
+            if pos == end_of_buffer:
+                break
+            if buffer[pos] == "]":
+                self._done = True
+                pos += 1
+                break
+
+            try:
+                item, end = raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Incomplete element, wait for more text
+                break
+            if not isinstance(item, (dict, list)) and (
+                end == end_of_buffer or buffer[end] not in _ELEMENT_END
+            ):
+                # A number or literal may continue in the next chunk
+                break
+            items.append(item)
+            pos = end
+
+        self._buffer = buffer[pos:]
+        return items
+
+    def close(self) -> None:
+        """Check that the whole array has been received."""
+        if not self._done:
+            raise ValueError("Incomplete JSON array")
@@ -0,0 +1,94 @@
+"""Timing traces of coordinator refreshes, shown in the diagnostics."""
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+# Vehicle handled by the current task, set by the coordinator
+current_vehicle: ContextVar[Any] = ContextVar("lubelogger_trace_vehicle", default=None)
+
+
+@dataclass
+class Span:
+    """One timed step of a refresh, in seconds from the start of the refresh."""
+
+    kind: str
+    vehicle_id: Any
+    start: float
+    end: float
+    detail: dict[str, Any]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the span with offsets in milliseconds."""
+        return {
+            "kind": self.kind,
+            "start_ms": round(self.start * 1000, 2),
+            "end_ms": round(self.end * 1000, 2),
+            **self.detail,
+        }
+
+
+@dataclass
+class RefreshTrace:
+    """Steps of one refresh: HTTP calls, record selection and entity updates."""
+
+    started_at: datetime = field(default_factory=dt_util.utcnow)
+    tiers: list[str] = field(default_factory=list)
+    spans: list[Span] = field(default_factory=list)
+    duration: float | None = None
+    _started: float = field(default_factory=time.perf_counter)
+
+    def add(self, kind: str, start: float, end: float, **detail: Any) -> None:
+        """Add a step timed with ``time.perf_counter``, for the current vehicle."""
+        self.spans.append(
+            Span(kind, current_vehicle.get(), start - self._started, end - self._started, detail)
+        )
+
+    @contextmanager
+    def span(
+        self, kind: str, vehicle_id: Any = None, **detail: Any
+    ) -> Iterator[dict[str, Any]]:
+        """Time a step; details can be added to the yielded dict."""
+        if vehicle_id is None:
+            vehicle_id = current_vehicle.get()
+        start = time.perf_counter()
+        try:
+            yield detail
+        finally:
+            self.spans.append(
+                Span(
+                    kind,
+                    vehicle_id,
+                    start - self._started,
+                    time.perf_counter() - self._started,
+                    detail,
+                )
+            )
+
+    def finish(self) -> None:
+        """Mark the end of the refresh."""
+        self.duration = time.perf_counter() - self._started
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the trace with the spans grouped by vehicle."""
+        server: list[dict[str, Any]] = []
+        vehicles: dict[str, list[dict[str, Any]]] = {}
+        for span in sorted(self.spans, key=lambda span: span.start):
+            if span.vehicle_id is None:
+                server.append(span.as_dict())
+            else:
+                vehicles.setdefault(str(span.vehicle_id), []).append(span.as_dict())
+        return {
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": None if self.duration is None else round(self.duration * 1000, 2),
+            "tiers": self.tiers,
+            "server": server,
+            "vehicles": vehicles,
+        }
@@ -0,0 +1,190 @@
+"""Incremental selection of the latest/next record of a record list."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+def record_id(rec: dict[str, Any]) -> int | None:
+    """Return the numeric id of a record, or None if it has none."""
+    rec_id = rec.get("id") or rec.get("Id")
+    if rec_id is None:
+        return None
+    try:
+        return int(rec_id)
+    except (ValueError, TypeError):
+        return None
+
+
+class RecordSelector:
+    """Keep the record with the highest (latest) or lowest key seen so far.
+
+    Of records with the same key the one with the highest (latest) or
+    lowest record id wins, so the result does not depend on the order
+    the server lists them in. Records without an id lose ties.
+    """
+
+    def __init__(
+        self, sort_key: Callable[[dict[str, Any]], Any], latest: bool = True
+    ) -> None:
+        """Initialize the selector."""
+        self._sort_key = sort_key
+        self._latest = latest
+        self.selected: dict[str, Any] | None = None
+        self._selected_key: Any = None
+
+    def add(self, rec: dict[str, Any]) -> None:
+        """Compare a record with the current winner."""
+        key = self._sort_key(rec)
+        if self.selected is None:
+            wins = True
+        elif key == self._selected_key:
+            wins = self._wins_tie(rec)
+        else:
+            wins = key > self._selected_key if self._latest else key < self._selected_key
+        if wins:
+            self.selected = rec
+            self._selected_key = key
+
+    def _wins_tie(self, rec: dict[str, Any]) -> bool:
+        """Return True if a record with the winner's key replaces it."""
+        rec_id = record_id(rec)
+        if rec_id is None:
+            return False
+        selected_id = record_id(self.selected)
+        if selected_id is None:
+            return True
+        return rec_id > selected_id if self._latest else rec_id < selected_id
+
+
+def select_record(
+    records: list[dict[str, Any]],
+    sort_key: Callable[[dict[str, Any]], Any],
+    latest: bool = True,
+) -> dict[str, Any] | None:
+    """Pick the record with the highest (latest) or lowest key in one pass."""
+    selector = RecordSelector(sort_key, latest)
+    for rec in records:
+        selector.add(rec)
+    return selector.selected
+
+
+# Modulus of the sums of record hashes
+_DIGEST_MASK = (1 << 64) - 1
+
+
+def _record_hash(rec: dict[str, Any]) -> int:
+    """Return a hash of the contents of a record, stable within the process."""
+    return hash(repr(rec))
+
+
+@dataclass
+class _Watermark:
+    """Selection state of one record list.
+
+    The records up to ``max_id`` are only kept as their count and the
+    sum of their hashes, not as copies.
+    """
+
+    winner: dict[str, Any] | None
+    max_id: int
+    count: int
+    digest: int
+
+
+class LatestRecordTracker:
+    """Track the selected record of each list using record id watermarks.
+
+    Only records with an id above the highest id seen so far have their
+    sort key computed and are compared with the previous winner. Older
+    records are only checked against the count and the hash sum of the
+    records seen last time; a full rescan happens when one of them was
+    deleted or edited, or when a record has no numeric id.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._watermarks: dict[str, _Watermark] = {}
+
+    def select(
+        self,
+        key: str,
+        records: list[dict[str, Any]],
+        sort_key: Callable[[dict[str, Any]], Any],
+        latest: bool = True,
+    ) -> dict[str, Any] | None:
+        """Return the selected record of ``records``, tracked under ``key``."""
+        watermark = self._watermarks.get(key)
+        if watermark is not None:
+            selected = self._select_new(watermark, records, sort_key, latest)
+            if selected is not _RESCAN:
+                return selected
+        return self._rescan(key, records, sort_key, latest)
+
+    def _select_new(
+        self,
+        watermark: _Watermark,
+        records: list[dict[str, Any]],
+        sort_key: Callable[[dict[str, Any]], Any],
+        latest: bool,
+    ) -> Any:
+        """Compare only records above the watermark with the known winner."""
+        new_records = []
+        new_ids = set()
+        old_count = 0
+        old_digest = 0
+        for rec in records:
+            rec_id = record_id(rec)
+            if rec_id is None:
+                return _RESCAN
+            if rec_id > watermark.max_id:
+                if rec_id in new_ids:
+                    return _RESCAN
+                new_ids.add(rec_id)
+                new_records.append(rec)
+            else:
+                old_count += 1
+                old_digest += _record_hash(rec)
+
+        if old_count != watermark.count or old_digest & _DIGEST_MASK != watermark.digest:
+            return _RESCAN
+
+        winner = watermark.winner
+        if new_records:
+            candidates = new_records if winner is None else [winner, *new_records]
+            winner = select_record(candidates, sort_key, latest)
+            watermark.winner = winner
+            watermark.max_id = max(new_ids)
+            watermark.count += len(new_records)
+            watermark.digest = (
+                watermark.digest + sum(_record_hash(rec) for rec in new_records)
+            ) & _DIGEST_MASK
+        return winner
+
+    def _rescan(
+        self,
+        key: str,
+        records: list[dict[str, Any]],
+        sort_key: Callable[[dict[str, Any]], Any],
+        latest: bool,
+    ) -> dict[str, Any] | None:
+        """Select from all records and store a new watermark."""
+        winner = select_record(records, sort_key, latest)
+
+        ids = {record_id(rec) for rec in records}
+        if not ids or None in ids or len(ids) != len(records):
+            self._watermarks.pop(key, None)
+            return winner
+
+        self._watermarks[key] = _Watermark(
+            winner=winner,
+            max_id=max(ids),
+            count=len(records),
+            digest=sum(_record_hash(rec) for rec in records) & _DIGEST_MASK,
+        )
+        return winner
+
+
+# Returned by LatestRecordTracker._select_new when a full rescan is needed
+_RESCAN = object()
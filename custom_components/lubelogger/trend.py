@@ -0,0 +1,83 @@
+"""Driving pace of a vehicle, fitted to its odometer readings."""
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+
+from .const import ODOMETER_TREND_HALF_LIFE
+from .history import HistoryRow, diff_history
+
+# Weighted variance of the reading days (days²) needed for a slope
+_MIN_SPREAD = 1e-6
+
+
+class OdometerTrend:
+    """Kilometres per day from a weighted least-squares line through the readings.
+
+    A reading loses half its weight every ``half_life`` days, so the pace
+    follows recent driving. The fit only keeps five weighted sums, scaled
+    to the day of the latest reading: adding or removing one reading,
+    whatever its date, changes them in O(1) and never refits the history.
+    Readings come from every record list with odometer values.
+    """
+
+    def __init__(self, half_life: float = ODOMETER_TREND_HALF_LIFE) -> None:
+        """Initialize a trend without readings."""
+        self._decay = math.log(2) / half_life
+        # Rows merged last by source; the client's response cache holds them anyway
+        self._sources: dict[str, Sequence[HistoryRow]] = {}
+        self._count = 0
+        # Day the weights are relative to, and origin of the day axis
+        self._reference = 0
+        self._origin: int | None = None
+        # Sums of w, w*x, w*y, w*x*x and w*x*y
+        self._sums = [0.0] * 5
+
+    def update(self, source: str, rows: Sequence[HistoryRow]) -> None:
+        """Merge the current rows of one record list."""
+        old = self._sources.get(source, ())
+        if rows is old:
+            return
+        self._sources[source] = rows
+        added, removed = diff_history(old, rows)
+        for row in removed:
+            if row.odometer > 0:
+                self._add(row, -1.0)
+        for row in added:
+            if row.odometer > 0:
+                self._add(row, 1.0)
+
+    def _add(self, row: HistoryRow, sign: float) -> None:
+        if self._origin is None:
+            self._origin = self._reference = row.day
+        elif row.day > self._reference:
+            scale = math.exp(-self._decay * (row.day - self._reference))
+            self._sums = [value * scale for value in self._sums]
+            self._reference = row.day
+
+        self._count += int(sign)
+        if not self._count:
+            # Drop the rounding left over by removed readings
+            self._sums = [0.0] * 5
+            return
+        weight = sign * math.exp(-self._decay * (self._reference - row.day))
+        x = row.day - self._origin
+        y = row.odometer
+        sums = self._sums
+        sums[0] += weight
+        sums[1] += weight * x
+        sums[2] += weight * y
+        sums[3] += weight * x * x
+        sums[4] += weight * x * y
+
+    @property
+    def km_per_day(self) -> float | None:
+        """Return the driving pace, or None without readings on two days."""
+        if self._count < 2:
+            return None
+        weight, sum_x, sum_y, sum_xx, sum_xy = self._sums
+        spread = weight * sum_xx - sum_x * sum_x
+        if weight <= 0 or spread <= _MIN_SPREAD * weight * weight:
+            return None
+        slope = (weight * sum_xy - sum_x * sum_y) / spread
+        return slope if slope > 0 else None
@@ -0,0 +1,150 @@
+"""Webhook asking for the refresh of a vehicle's records, e.g. after a fill-up."""
+from __future__ import annotations
+
+import logging
+import re
+from http import HTTPStatus
+from typing import Any
+
+from aiohttp import web
+
+from homeassistant.components.webhook import (
+    async_generate_id,
+    async_generate_path,
+    async_generate_url,
+    async_register,
+    async_unregister,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.network import NoURLAvailableError
+
+from .const import DOMAIN
+from .coordinator import LubeLoggerDataUpdateCoordinator
+from .record_types import RECORD_TYPES, RecordType
+
+_LOGGER = logging.getLogger(__name__)
+
+# Payload fields holding the vehicle id, at the top or in "data"
+_VEHICLE_FIELDS = ("vehicle_id", "vehicleId", "VehicleId")
+# Payload fields naming the record type: a sensor key ("latest_gas"), a
+# record name ("gasrecord"), its short form ("gas") or a LubeLogger event
+# ("gasrecord.add")
+_RECORD_TYPE_FIELDS = ("record_type", "type", "Type", "operation", "Operation")
+
+
+def _letters(value: Any) -> str:
+    return re.sub("[^a-z]", "", str(value).lower())
+
+
+def _record_name(record_type: RecordType) -> str:
+    """Return the record name of a record type, the singular of its endpoint."""
+    return record_type.endpoint.rsplit("/", 1)[-1].removesuffix("s")
+
+
+# Record types with their key, short name and record name
+_RECORD_TYPE_NAMES: tuple[tuple[RecordType, tuple[str, str], str], ...] = tuple(
+    (
+        record_type,
+        (_letters(record_type.key), _record_name(record_type).removesuffix("record")),
+        _record_name(record_type),
+    )
+    for record_type in RECORD_TYPES
+)
+
+
+def record_types_for(payload: dict[str, Any]) -> list[RecordType]:
+    """Return the record types a payload asks to refresh.
+
+    Without a record type field that is every record type; a record type
+    the integration does not know gives none.
+    """
+    for field in _RECORD_TYPE_FIELDS:
+        if value := payload.get(field):
+            name = _letters(value)
+            return [
+                record_type
+                for record_type, names, record_name in _RECORD_TYPE_NAMES
+                if name in names or record_name in name
+            ]
+    return list(RECORD_TYPES)
+
+
+def vehicle_id_for(payload: dict[str, Any]) -> Any:
+    """Return the vehicle id of a payload, or None."""
+    for source in (payload, payload.get("data")):
+        if not isinstance(source, dict):
+            continue
+        for field in _VEHICLE_FIELDS:
+            if (value := source.get(field)) not in (None, ""):
+                # Vehicle ids are numbers in the API, but strings in query strings
+                return int(value) if str(value).isdigit() else value
+    return None
+
+
+@callback
+def async_webhook_url(hass: HomeAssistant, entry: ConfigEntry) -> str:
+    """Return the URL of the webhook of a config entry, "-" before its first setup."""
+    webhook_id = entry.data.get(CONF_WEBHOOK_ID)
+    if not webhook_id:
+        return "-"
+    try:
+        return async_generate_url(hass, webhook_id)
+    except NoURLAvailableError:
+        return async_generate_path(webhook_id)
+
+
+@callback
+def async_setup_webhook(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: LubeLoggerDataUpdateCoordinator
+) -> None:
+    """Register the webhook of a config entry until the entry is unloaded."""
+    if not (webhook_id := entry.data.get(CONF_WEBHOOK_ID)):
+        webhook_id = async_generate_id()
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_WEBHOOK_ID: webhook_id}
+        )
+
+    async def _async_handle_webhook(
+        hass: HomeAssistant, webhook_id: str, request: web.Request
+    ) -> web.Response:
+        """Refresh the records named by a request in the background."""
+        payload: Any = dict(request.query)
+        if request.body_exists:
+            try:
+                body = await request.json()
+            except ValueError:
+                return web.Response(status=HTTPStatus.BAD_REQUEST)
+            if not isinstance(body, dict):
+                return web.Response(status=HTTPStatus.BAD_REQUEST)
+            payload.update(body)
+
+        vehicle_id = vehicle_id_for(payload)
+        if vehicle_id is None:
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+        if vehicle_id not in (coordinator.data or {}).get("vehicle_index", {}):
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        if not (record_types := record_types_for(payload)):
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+        _LOGGER.debug(
+            "Webhook refresh of %s for vehicle %s",
+            ", ".join(record_type.key for record_type in record_types),
+            vehicle_id,
+        )
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh_records(vehicle_id, record_types),
+            f"{DOMAIN} webhook refresh",
+        )
+        return web.Response(status=HTTPStatus.ACCEPTED)
+
+    async_register(
+        hass,
+        DOMAIN,
+        entry.title or "LubeLogger",
+        webhook_id,
+        _async_handle_webhook,
+        local_only=True,
+    )
+    entry.async_on_unload(lambda: async_unregister(hass, webhook_id))
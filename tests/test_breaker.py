@@ -0,0 +1,176 @@
+"""Tests of the endpoint circuit breakers."""
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from homeassistant.core import HomeAssistant
+
+from lubelogger import breaker as breaker_module
+from lubelogger.breaker import CircuitBreaker, CircuitOpenError
+from lubelogger.client import LubeLoggerClient
+from lubelogger.const import (
+    API_GAS_RECORD,
+    API_VEHICLES,
+    BREAKER_BASE_BACKOFF,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_BACKOFF,
+    CONF_PASSWORD,
+    CONF_URL,
+    CONF_USERNAME,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+)
+from lubelogger.coordinator import LubeLoggerDataUpdateCoordinator
+from lubelogger.record_types import RECORD_TYPES_BY_KEY
+
+from .test_client import _run
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace the breakers' monotonic clock with one moved by the test."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(
+        breaker_module, "time", SimpleNamespace(monotonic=lambda: clock.now)
+    )
+    return clock
+
+
+def _fail_together(breaker: CircuitBreaker, clock: SimpleNamespace, requests: int) -> None:
+    """Fail ``requests`` requests started at the same time."""
+    starts = [breaker.check() for _ in range(requests)]
+    clock.now += 1
+    for started in starts:
+        breaker.record_failure(started)
+
+
+def _backoff(breaker: CircuitBreaker, clock: SimpleNamespace) -> float:
+    return breaker.open_until - clock.now
+
+
+def test_concurrent_failures_count_once(clock: SimpleNamespace) -> None:
+    breaker = CircuitBreaker("gas")
+    for failures in range(1, BREAKER_FAILURE_THRESHOLD + 1):
+        _fail_together(breaker, clock, 20)
+        assert breaker.failures == failures
+    # Opened for the first step, not the maximum
+    assert BREAKER_BASE_BACKOFF / 2 <= _backoff(breaker, clock) <= BREAKER_BASE_BACKOFF
+
+    clock.now = breaker.open_until
+    _fail_together(breaker, clock, 1)
+    assert breaker.failures == BREAKER_FAILURE_THRESHOLD + 1
+    assert BREAKER_BASE_BACKOFF <= _backoff(breaker, clock) <= 2 * BREAKER_BASE_BACKOFF
+    assert _backoff(breaker, clock) < BREAKER_MAX_BACKOFF
+
+
+def test_failures_of_one_refresh_count_once(clock: SimpleNamespace) -> None:
+    breaker = CircuitBreaker("gas")
+    refresh = clock.now
+    # Queued behind the concurrency limit, the requests start one by one
+    for _ in range(10):
+        started = breaker.check()
+        clock.now += 1
+        breaker.record_failure(started, refresh)
+    assert breaker.failures == 1
+
+    breaker.record_failure(breaker.check(), clock.now)
+    assert breaker.failures == 2
+
+
+def test_half_open_lets_one_trial_through(clock: SimpleNamespace) -> None:
+    breaker = CircuitBreaker("gas")
+    for _ in range(BREAKER_FAILURE_THRESHOLD):
+        _fail_together(breaker, clock, 1)
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+    clock.now = breaker.open_until
+    trial = breaker.check()
+    for _ in range(5):
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+
+    # A trial ending in a client error lets the next request be the trial
+    breaker.settle(trial)
+    breaker.check()
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+    breaker.record_success()
+    assert breaker.failures == 0
+    breaker.check()
+    breaker.check()
+
+
+def test_client_failing_for_every_vehicle_adds_one_failure() -> None:
+    gas = RECORD_TYPES_BY_KEY["latest_gas"]
+
+    async def failing(request: web.Request) -> web.Response:
+        await asyncio.sleep(0.01)
+        return web.Response(status=500)
+
+    async def test(client: LubeLoggerClient) -> None:
+        for failures in range(1, BREAKER_FAILURE_THRESHOLD + 1):
+            results = await asyncio.gather(
+                *(client.async_get_record(gas, vehicle_id) for vehicle_id in range(1, 11)),
+                return_exceptions=True,
+            )
+            assert all(isinstance(result, Exception) for result in results)
+            assert client.hub.breakers[API_GAS_RECORD].failures == failures
+        with pytest.raises(CircuitOpenError):
+            await client.async_get_record(gas, 1)
+
+    _run({API_GAS_RECORD: failing}, test)
+
+
+def test_refresh_with_more_vehicles_than_the_server_limit_adds_one_failure(
+    tmp_path: Path,
+) -> None:
+    vehicles = DEFAULT_MAX_CONCURRENT_REQUESTS + 4
+
+    async def vehicle_list(request: web.Request) -> web.Response:
+        return web.json_response(
+            [
+                {"id": vehicle_id, "make": "Fiat", "model": "Panda"}
+                for vehicle_id in range(1, vehicles + 1)
+            ]
+        )
+
+    async def failing(request: web.Request) -> web.Response:
+        await asyncio.sleep(0.01)
+        return web.Response(status=500)
+
+    async def run() -> None:
+        app = web.Application()
+        app.router.add_get(API_VEHICLES, vehicle_list)
+        app.router.add_get(API_GAS_RECORD, failing)
+        server = TestServer(app)
+        await server.start_server()
+        hass = HomeAssistant(str(tmp_path))
+        hass.config_entries = SimpleNamespace(async_update_entry=lambda entry, **kwargs: False)
+        entry = SimpleNamespace(
+            entry_id="test",
+            data={
+                CONF_URL: str(server.make_url("")).rstrip("/"),
+                CONF_USERNAME: "user",
+                CONF_PASSWORD: "pass",
+            },
+            options={},
+        )
+        coordinator = LubeLoggerDataUpdateCoordinator(hass, entry)
+        try:
+            for failures in range(1, BREAKER_FAILURE_THRESHOLD + 1):
+                # Every tier is due, so every vehicle requests its gas records
+                coordinator._tier_last_run.clear()
+                await coordinator._async_update_data()
+                assert coordinator.client.hub.breakers[API_GAS_RECORD].failures == failures
+            assert coordinator.client.hub.breakers[API_GAS_RECORD].is_open
+        finally:
+            await coordinator.client.async_close()
+            await server.close()
+            await hass.async_stop(force=True)
+
+    asyncio.run(run())
@@ -0,0 +1,142 @@
+"""Tests of the LubeLogger API client against a local aiohttp server."""
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from lubelogger.capabilities import Capabilities
+from lubelogger.client import LubeLoggerClient
+from lubelogger.const import API_GAS_RECORD, API_SERVICE_RECORD, API_VEHICLES
+from lubelogger.record_types import RECORD_TYPES_BY_KEY
+
+GAS = RECORD_TYPES_BY_KEY["latest_gas"]
+
+
+def _gas_records(count: int) -> list[dict[str, Any]]:
+    return [
+        {"id": rec_id, "date": f"{rec_id % 28 + 1:02d}/01/2024", "odometer": str(rec_id * 100)}
+        for rec_id in range(1, count + 1)
+    ]
+
+
+def _run(
+    routes: dict[str, Callable[[web.Request], Awaitable[web.StreamResponse]]],
+    test: Callable[[LubeLoggerClient], Awaitable[None]],
+) -> None:
+    """Run ``test`` with a client of a server answering ``routes``."""
+
+    async def run() -> None:
+        app = web.Application()
+        for path, handler in routes.items():
+            app.router.add_get(path, handler)
+        server = TestServer(app)
+        await server.start_server()
+        client = LubeLoggerClient(str(server.make_url("")), "user", "pass", coalesce_ttl=0)
+        try:
+            await test(client)
+        finally:
+            await client.async_close()
+            await server.close()
+
+    asyncio.run(run())
+
+
+def test_unchanged_chunked_list_keeps_its_selection() -> None:
+    records = _gas_records(2000)
+    body = json.dumps(records).encode()
+
+    async def gas(request: web.Request) -> web.StreamResponse:
+        # Chunked, so the length is unknown and the list is streamed
+        response = web.StreamResponse()
+        response.content_type = "application/json"
+        await response.prepare(request)
+        for start in range(0, len(body), 10000):
+            await response.write(body[start : start + 10000])
+        await response.write_eof()
+        return response
+
+    async def test(client: LubeLoggerClient) -> None:
+        first, first_history = await client.async_get_record_history(GAS, 1)
+        metrics = client.metrics[API_GAS_RECORD]
+        # Decoded again while hashed, without holding the body
+        second, second_history = await client.async_get_record_history(GAS, 1)
+        assert second is first
+        assert second_history is first_history
+        assert metrics.requests == 2
+
+        records.append({"id": 9999, "date": "31/12/2030", "odometer": "1"})
+        nonlocal body
+        body = json.dumps(records).encode()
+        third, third_history = await client.async_get_record_history(GAS, 1)
+        assert third["id"] == 9999
+        # The rows already known are kept, not built again
+        assert all(
+            new is old for new, old in zip(third_history, first_history, strict=False)
+        )
+        assert len(third_history) == len(first_history) + 1
+
+    _run({API_GAS_RECORD: gas}, test)
+
+
+def test_missing_vehicles_endpoint_falls_back() -> None:
+    async def vehicles(request: web.Request) -> web.Response:
+        return web.json_response([{"id": 1}, {"id": 2}])
+
+    async def test(client: LubeLoggerClient) -> None:
+        client.capabilities = Capabilities(vehicles_endpoint="/api/Vehicle/GetAllVehicles")
+        assert [vehicle["id"] for vehicle in await client.async_get_vehicles()] == [1, 2]
+        assert client.capabilities.vehicles_endpoint is None
+
+    _run({API_VEHICLES: vehicles}, test)
+
+
+def test_endpoint_is_missing_only_once_every_vehicle_got_a_404() -> None:
+    service = RECORD_TYPES_BY_KEY["latest_service"]
+
+    async def vehicles(request: web.Request) -> web.Response:
+        return web.json_response([{"id": 1}, {"id": 2}])
+
+    async def services(request: web.Request) -> web.Response:
+        return web.Response(status=404)
+
+    async def test(client: LubeLoggerClient) -> None:
+        await client.async_get_vehicles()
+        await client.async_get_record(service, 1)
+        assert client.capabilities.supports(API_SERVICE_RECORD)
+        await client.async_get_record(service, 2)
+        assert not client.capabilities.supports(API_SERVICE_RECORD)
+
+    _run({API_VEHICLES: vehicles, API_SERVICE_RECORD: services}, test)
+
+
+def test_mixed_dated_and_undated_records() -> None:
+    records = [
+        {"id": 1, "date": "01/01/2024"},
+        {"id": 2, "date": ""},
+        {"id": 3, "date": "15/03/2024"},
+        {"id": 4},
+    ]
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.json_response(records)
+
+    async def chunked(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse()
+        response.content_type = "application/json"
+        await response.prepare(request)
+        await response.write(json.dumps(records).encode())
+        await response.write_eof()
+        return response
+
+    async def test(client: LubeLoggerClient) -> None:
+        # Streamed (gas, chunked) and tracked (service) selections
+        assert (await client.async_get_record(GAS, 1))["id"] == 3
+        service = RECORD_TYPES_BY_KEY["latest_service"]
+        assert (await client.async_get_record(service, 1))["id"] == 3
+
+    _run({API_GAS_RECORD: chunked, API_SERVICE_RECORD: handler}, test)
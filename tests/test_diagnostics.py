@@ -0,0 +1,43 @@
+"""Tests of the diagnostics download."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from types import SimpleNamespace
+
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.const import CONF_WEBHOOK_ID
+
+from lubelogger.const import CONF_PASSWORD, CONF_URL, CONF_USERNAME, DOMAIN
+from lubelogger.diagnostics import async_get_config_entry_diagnostics
+
+
+def test_secrets_are_redacted() -> None:
+    entry = SimpleNamespace(
+        entry_id="entry",
+        data={
+            CONF_URL: "http://lubelogger.local",
+            CONF_USERNAME: "user",
+            CONF_PASSWORD: "secret",
+            CONF_WEBHOOK_ID: "0123456789abcdef",
+            "capabilities": {"server_version": "1.4.0"},
+        },
+        options={},
+    )
+    coordinator = SimpleNamespace(
+        client=SimpleNamespace(metrics={}),
+        last_refresh_wall_time=None,
+        last_refresh_request_time=None,
+        last_refresh_cpu_time=None,
+        last_refresh_connect_time=None,
+        last_refresh_vehicles=None,
+        from_snapshot=False,
+        traces=deque(),
+    )
+    hass = SimpleNamespace(data={DOMAIN: {entry.entry_id: coordinator}})
+
+    data = asyncio.run(async_get_config_entry_diagnostics(hass, entry))["entry"]["data"]
+
+    for key in (CONF_URL, CONF_USERNAME, CONF_PASSWORD, CONF_WEBHOOK_ID):
+        assert data[key] == REDACTED
+    assert data["capabilities"] == {"server_version": "1.4.0"}
@@ -0,0 +1,27 @@
+"""Tests of the vehicle sensors."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from lubelogger.models import VehicleInfo
+from lubelogger.record_types import RECORD_TYPES_BY_KEY
+from lubelogger.sensor import LubeLoggerRecordSensor
+
+
+def test_sensor_is_unavailable_while_its_data_is_stale() -> None:
+    gas = RECORD_TYPES_BY_KEY["latest_gas"]
+    coordinator = SimpleNamespace(
+        data={"vehicle_index": {1: {gas.key: object()}}}, last_update_success=True
+    )
+    sensor = LubeLoggerRecordSensor(
+        coordinator, 1, "Panda", VehicleInfo.from_api({"id": 1, "make": "Fiat"}), gas
+    )
+    assert sensor.available
+
+    # The server stopped answering; the last data is kept
+    coordinator.last_update_success = False
+    assert not sensor.available
+
+    coordinator.last_update_success = True
+    coordinator.data = {"vehicle_index": {1: {}}}
+    assert not sensor.available
@@ -0,0 +1,32 @@
+"""Tests of the statistics import."""
+from __future__ import annotations
+
+from enum import Enum
+
+import pytest
+from homeassistant.components.recorder.models import StatisticMetaData
+
+from lubelogger import statistics
+from lubelogger.statistics import STATISTICS, statistic_metadata
+
+ODOMETER, FUEL, COST = STATISTICS
+
+
+def test_metadata_of_the_installed_home_assistant() -> None:
+    metadata = statistic_metadata(1, "Panda", ODOMETER)
+    assert metadata["statistic_id"] == "lubelogger:vehicle_1_odometer"
+    assert metadata["has_mean"] and not metadata["has_sum"]
+    # Only the fields the installed recorder knows
+    assert set(metadata) <= set(StatisticMetaData.__annotations__)
+
+
+def test_metadata_with_mean_type_and_unit_class(monkeypatch: pytest.MonkeyPatch) -> None:
+    mean_type = Enum("StatisticMeanType", "NONE ARITHMETIC")
+    monkeypatch.setattr(statistics, "StatisticMeanType", mean_type)
+    monkeypatch.setitem(StatisticMetaData.__annotations__, "unit_class", "str | None")
+
+    assert statistic_metadata(1, "Panda", ODOMETER)["mean_type"] is mean_type.ARITHMETIC
+    assert statistic_metadata(1, "Panda", ODOMETER)["unit_class"] == "distance"
+    assert statistic_metadata(1, "Panda", FUEL)["mean_type"] is mean_type.NONE
+    assert statistic_metadata(1, "Panda", FUEL)["unit_class"] == "volume"
+    assert statistic_metadata(1, "Panda", COST)["unit_class"] is None
@@ -0,0 +1,63 @@
+"""Tests of the record selection in tracker.py."""
+from __future__ import annotations
+
+import random
+
+from lubelogger.tracker import LatestRecordTracker, select_record
+
+
+def _date_key(rec):
+    return rec["date"]
+
+
+def _records(count: int) -> list[dict]:
+    # Few distinct dates, so most records share theirs with others
+    return [{"id": rec_id, "date": f"2024-01-0{rec_id % 3 + 1}"} for rec_id in range(1, count + 1)]
+
+
+def test_select_record_breaks_ties_by_id() -> None:
+    records = _records(30)
+    rng = random.Random(4)
+    for _ in range(20):
+        rng.shuffle(records)
+        latest = select_record(records, _date_key)
+        assert (latest["date"], latest["id"]) == ("2024-01-03", 29)
+        earliest = select_record(records, _date_key, latest=False)
+        assert (earliest["date"], earliest["id"]) == ("2024-01-01", 3)
+
+
+def test_records_without_id_lose_ties() -> None:
+    records = [{"date": "2024-01-01"}, {"id": 2, "date": "2024-01-01"}, {"date": "2024-01-01"}]
+    assert select_record(records, _date_key)["id"] == 2
+    assert select_record(records, _date_key, latest=False)["id"] == 2
+
+
+def test_tracker_matches_full_selection_after_edits() -> None:
+    tracker = LatestRecordTracker()
+    records = _records(30)
+    rng = random.Random(4)
+    for step in range(50):
+        rng.shuffle(records)
+        if step % 5 == 0:
+            # A new record sharing the latest date
+            records.append({"id": 100 + step, "date": "2024-01-03"})
+        elif step % 7 == 0:
+            records[0] = {**records[0], "date": "2024-01-09"}
+        selected = tracker.select("gas", list(records), _date_key)
+        assert selected == select_record(records, _date_key)
+        assert selected == max(records, key=lambda rec: (rec["date"], rec["id"]))
+
+
+def test_tracker_rescans_after_deletes_and_edits() -> None:
+    tracker = LatestRecordTracker()
+    records = _records(10)
+    assert tracker.select("gas", records, _date_key)["id"] == 8
+    # Deleting the winner
+    records = [rec for rec in records if rec["id"] != 8]
+    assert tracker.select("gas", records, _date_key)["id"] == 5
+    # Editing an old record, same count and ids
+    records = [{**rec, "date": "2024-02-01"} if rec["id"] == 1 else rec for rec in records]
+    assert tracker.select("gas", records, _date_key)["id"] == 1
+    # Duplicated new ids are not trusted
+    records = [*records, {"id": 20, "date": "2024-01-01"}, {"id": 20, "date": "2024-03-01"}]
+    assert tracker.select("gas", records, _date_key) == select_record(records, _date_key)
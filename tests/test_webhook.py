@@ -0,0 +1,76 @@
+"""Tests of the refresh webhook."""
+from __future__ import annotations
+
+import asyncio
+from http import HTTPStatus
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from homeassistant.const import CONF_WEBHOOK_ID
+
+from lubelogger import webhook
+from lubelogger.webhook import async_setup_webhook, record_types_for
+
+
+@pytest.mark.parametrize(
+    ("record_type", "keys"),
+    [
+        ("latest_gas", ["latest_gas"]),
+        ("gasrecord.add", ["latest_gas"]),
+        ("gas", ["latest_gas"]),
+        ("odometer", ["latest_odometer"]),
+        ("OdometerRecord.Update", ["latest_odometer"]),
+        ("reminder", ["next_reminder"]),
+        ("fuel", []),
+    ],
+)
+def test_record_types_for(record_type: str, keys: list[str]) -> None:
+    assert [item.key for item in record_types_for({"type": record_type})] == keys
+
+
+def _call(monkeypatch: pytest.MonkeyPatch, payload: dict[str, Any]) -> tuple[int, list]:
+    """Call the webhook of an entry with a JSON payload; return the status and refreshes."""
+    handlers = []
+    monkeypatch.setattr(
+        webhook, "async_register", lambda *args, **kwargs: handlers.append(args[4])
+    )
+    refreshes = []
+
+    async def refresh(vehicle_id: Any, record_types: list) -> bool:
+        return True
+
+    def create_task(hass: Any, target: Any, name: str) -> None:
+        target.close()
+        refreshes.append(name)
+
+    entry = SimpleNamespace(
+        data={CONF_WEBHOOK_ID: "webhook"},
+        title="LubeLogger",
+        async_on_unload=lambda func: None,
+        async_create_background_task=create_task,
+    )
+    coordinator = SimpleNamespace(
+        data={"vehicle_index": {1: {}}}, async_refresh_records=refresh
+    )
+    hass = SimpleNamespace()
+    async_setup_webhook(hass, entry, coordinator)
+
+    async def json() -> dict[str, Any]:
+        return payload
+
+    request = SimpleNamespace(query={}, body_exists=True, json=json)
+    response = asyncio.run(handlers[0](hass, "webhook", request))
+    return response.status, refreshes
+
+
+def test_webhook_answers(monkeypatch: pytest.MonkeyPatch) -> None:
+    status, refreshes = _call(monkeypatch, {"vehicle_id": 1, "type": "gas"})
+    assert status == HTTPStatus.ACCEPTED
+    assert len(refreshes) == 1
+    assert _call(monkeypatch, {"vehicle_id": 2, "type": "gas"})[0] == HTTPStatus.NOT_FOUND
+    assert _call(monkeypatch, {"type": "gas"})[0] == HTTPStatus.BAD_REQUEST
+
+
+def test_webhook_rejects_unknown_record_types(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert _call(monkeypatch, {"vehicle_id": 1, "type": "fuel"}) == (HTTPStatus.BAD_REQUEST, [])